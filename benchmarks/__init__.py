@@ -0,0 +1 @@
+"""Benchmarks for the SDV library, to be run with ``asv``."""
@@ -0,0 +1,64 @@
+"""Benchmarks for the predefined constraints."""
+
+from benchmarks.datasets import get_single_table, get_sizes
+from sdv.constraints import Constraint
+
+CONSTRAINTS = {
+    'Inequality': {
+        'constraint_class': 'Inequality',
+        'constraint_parameters': {
+            'low_column_name': 'low',
+            'high_column_name': 'high',
+        }
+    },
+    'ScalarRange': {
+        'constraint_class': 'ScalarRange',
+        'constraint_parameters': {
+            'column_name': 'amount',
+            'low_value': 0,
+            'high_value': 1000,
+            'strict_boundaries': False,
+        }
+    },
+    'FixedCombinations': {
+        'constraint_class': 'FixedCombinations',
+        'constraint_parameters': {
+            'column_names': ['city', 'country'],
+        }
+    },
+}
+
+
+class ConstraintSuite:
+    """Time of fitting, transforming, reverse transforming and validating a constraint."""
+
+    params = [list(CONSTRAINTS), get_sizes([10_000, 100_000, 1_000_000])]
+    param_names = ['constraint', 'num_rows']
+    timeout = 600
+
+    def setup(self, constraint_name, num_rows):
+        self.data, metadata = get_single_table(num_rows)
+        constraint_dict = CONSTRAINTS[constraint_name]
+        self.constraint = Constraint.from_dict({
+            'constraint_class': constraint_dict['constraint_class'],
+            'constraint_parameters': {
+                **constraint_dict['constraint_parameters'],
+                'metadata': metadata,
+            }
+        })
+        self.transformed = self.constraint.fit_transform(self.data)
+
+    def time_fit(self, constraint_name, num_rows):
+        self.constraint.fit(self.data)
+
+    def time_transform(self, constraint_name, num_rows):
+        self.constraint.transform(self.data)
+
+    def time_reverse_transform(self, constraint_name, num_rows):
+        self.constraint.reverse_transform(self.transformed)
+
+    def time_is_valid(self, constraint_name, num_rows):
+        self.constraint.is_valid(self.data)
+
+    def peakmem_transform(self, constraint_name, num_rows):
+        self.constraint.transform(self.data)
@@ -0,0 +1,173 @@
+"""Synthetic datasets of configurable size used by the benchmarks."""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from sdv.metadata import MultiTableMetadata, SingleTableMetadata
+
+SEED = 0
+
+
+def get_sizes(default):
+    """Get the sizes of the datasets to benchmark.
+
+    The sizes can be overridden with a comma separated list of integers in the
+    ``SDV_BENCHMARK_SIZES`` environment variable, e.g. ``SDV_BENCHMARK_SIZES=1000,100000``.
+
+    Args:
+        default (list[int]):
+            The sizes to use if the environment variable is not set.
+
+    Returns:
+        list[int]:
+            The sizes of the datasets.
+    """
+    sizes = os.environ.get('SDV_BENCHMARK_SIZES')
+    if not sizes:
+        return default
+
+    return [int(size) for size in sizes.split(',')]
+
+
+def get_single_table(num_rows):
+    """Create a table with numerical, categorical, boolean and datetime columns.
+
+    The table satisfies ``low < high`` and the ``city``/``country`` pairs are fixed, so the
+    ``Inequality`` and ``FixedCombinations`` constraints can be applied to it.
+
+    Args:
+        num_rows (int):
+            Number of rows of the table.
+
+    Returns:
+        tuple:
+            The table as a ``pandas.DataFrame`` and its ``SingleTableMetadata``.
+    """
+    random_state = np.random.default_rng(SEED)
+    low = random_state.normal(100, 10, num_rows).round(2)
+    cities = np.array(['Boston', 'Chicago', 'Madrid', 'Barcelona', 'Paris'])
+    countries = np.array(['US', 'US', 'ES', 'ES', 'FR'])
+    city_codes = random_state.integers(0, len(cities), num_rows)
+    data = pd.DataFrame({
+        'id': np.arange(num_rows),
+        'low': low,
+        'high': low + random_state.exponential(10, num_rows).round(2),
+        'amount': random_state.integers(0, 1000, num_rows),
+        'city': cities[city_codes],
+        'country': countries[city_codes],
+        'active': random_state.choice([True, False], num_rows),
+        'date': pd.Timestamp('2020-01-01') + pd.to_timedelta(
+            random_state.integers(0, 1000, num_rows), unit='D'),
+    })
+    data.loc[random_state.random(num_rows) < 0.1, 'amount'] = np.nan
+
+    metadata = SingleTableMetadata.load_from_dict({
+        'primary_key': 'id',
+        'columns': {
+            'id': {'sdtype': 'id'},
+            'low': {'sdtype': 'numerical'},
+            'high': {'sdtype': 'numerical'},
+            'amount': {'sdtype': 'numerical'},
+            'city': {'sdtype': 'categorical'},
+            'country': {'sdtype': 'categorical'},
+            'active': {'sdtype': 'boolean'},
+            'date': {'sdtype': 'datetime', 'datetime_format': '%Y-%m-%d'},
+        }
+    })
+    return data, metadata
+
+
+def get_multi_table(num_rows):
+    """Create a parent table and a child table with about 5 rows per parent row.
+
+    Args:
+        num_rows (int):
+            Number of rows of the parent table.
+
+    Returns:
+        tuple:
+            A dictionary mapping the table names to ``pandas.DataFrame`` and its
+            ``MultiTableMetadata``.
+    """
+    random_state = np.random.default_rng(SEED)
+    parent, _ = get_single_table(num_rows)
+    parent = parent.drop(columns=['high', 'date'])
+    num_child_rows = num_rows * 5
+    child = pd.DataFrame({
+        'child_id': np.arange(num_child_rows),
+        'parent_id': random_state.integers(0, num_rows, num_child_rows),
+        'value': random_state.gamma(2, 10, num_child_rows).round(2),
+        'type': random_state.choice(['a', 'b', 'c'], num_child_rows),
+    })
+
+    metadata = MultiTableMetadata.load_from_dict({
+        'tables': {
+            'parent': {
+                'primary_key': 'id',
+                'columns': {
+                    'id': {'sdtype': 'id'},
+                    'low': {'sdtype': 'numerical'},
+                    'amount': {'sdtype': 'numerical'},
+                    'city': {'sdtype': 'categorical'},
+                    'country': {'sdtype': 'categorical'},
+                    'active': {'sdtype': 'boolean'},
+                }
+            },
+            'child': {
+                'primary_key': 'child_id',
+                'columns': {
+                    'child_id': {'sdtype': 'id'},
+                    'parent_id': {'sdtype': 'id'},
+                    'value': {'sdtype': 'numerical'},
+                    'type': {'sdtype': 'categorical'},
+                }
+            }
+        },
+        'relationships': [{
+            'parent_table_name': 'parent',
+            'parent_primary_key': 'id',
+            'child_table_name': 'child',
+            'child_foreign_key': 'parent_id',
+        }]
+    })
+    return {'parent': parent, 'child': child}, metadata
+
+
+def get_sequential_table(num_sequences, sequence_length):
+    """Create a table of sequences with a context column.
+
+    Args:
+        num_sequences (int):
+            Number of sequences of the table.
+        sequence_length (int):
+            Number of rows of every sequence.
+
+    Returns:
+        tuple:
+            The table as a ``pandas.DataFrame`` and its ``SingleTableMetadata``.
+    """
+    random_state = np.random.default_rng(SEED)
+    num_rows = num_sequences * sequence_length
+    data = pd.DataFrame({
+        'sequence_id': np.repeat(np.arange(num_sequences), sequence_length),
+        'region': np.repeat(random_state.choice(['north', 'south'], num_sequences),
+                            sequence_length),
+        'step': np.tile(np.arange(sequence_length), num_sequences),
+        'value': random_state.normal(0, 1, num_rows).cumsum().round(3),
+        'state': random_state.choice(['on', 'off'], num_rows),
+    })
+
+    metadata = SingleTableMetadata.load_from_dict({
+        'sequence_key': 'sequence_id',
+        'sequence_index': 'step',
+        'columns': {
+            'sequence_id': {'sdtype': 'id'},
+            'region': {'sdtype': 'categorical'},
+            'step': {'sdtype': 'numerical'},
+            'value': {'sdtype': 'numerical'},
+            'state': {'sdtype': 'categorical'},
+        }
+    })
+    return data, metadata
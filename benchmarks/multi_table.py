@@ -0,0 +1,46 @@
+"""Benchmarks for the multi table synthesizers and metadata."""
+
+from benchmarks.datasets import get_multi_table, get_sizes
+from sdv.multi_table import HMASynthesizer
+
+
+class HMASynthesizerSuite:
+    """Time and peak memory of fitting and sampling an ``HMASynthesizer``."""
+
+    params = get_sizes([100, 1_000])
+    param_names = ['num_rows']
+    timeout = 1200
+
+    def setup(self, num_rows):
+        self.data, self.metadata = get_multi_table(num_rows)
+        self.synthesizer = HMASynthesizer(self.metadata, verbose=False)
+        self.synthesizer.set_table_parameters('child', {'default_distribution': 'norm'})
+        self.fitted_synthesizer = HMASynthesizer(self.metadata, verbose=False)
+        self.fitted_synthesizer.set_table_parameters('child', {'default_distribution': 'norm'})
+        self.fitted_synthesizer.fit(self.data)
+
+    def time_fit(self, num_rows):
+        self.synthesizer.fit(self.data)
+
+    def peakmem_fit(self, num_rows):
+        self.synthesizer.fit(self.data)
+
+    def time_sample(self, num_rows):
+        self.fitted_synthesizer.sample()
+
+    def peakmem_sample(self, num_rows):
+        self.fitted_synthesizer.sample()
+
+
+class MultiTableMetadataSuite:
+    """Time of validating data against a ``MultiTableMetadata``."""
+
+    params = get_sizes([1_000, 10_000, 100_000])
+    param_names = ['num_rows']
+    timeout = 600
+
+    def setup(self, num_rows):
+        self.data, self.metadata = get_multi_table(num_rows)
+
+    def time_validate_data(self, num_rows):
+        self.metadata.validate_data(self.data)
@@ -0,0 +1,31 @@
+"""Benchmarks for the sequential synthesizers."""
+
+from benchmarks.datasets import get_sequential_table, get_sizes
+from sdv.sequential import PARSynthesizer
+
+
+class PARSynthesizerSuite:
+    """Time and peak memory of fitting and sampling a ``PARSynthesizer`` on CPU."""
+
+    params = get_sizes([10, 100])
+    param_names = ['num_sequences']
+    timeout = 1200
+
+    def setup(self, num_sequences):
+        self.data, self.metadata = get_sequential_table(num_sequences, sequence_length=20)
+        kwargs = {'context_columns': ['region'], 'epochs': 2, 'cuda': False}
+        self.synthesizer = PARSynthesizer(self.metadata, **kwargs)
+        self.fitted_synthesizer = PARSynthesizer(self.metadata, **kwargs)
+        self.fitted_synthesizer.fit(self.data)
+
+    def time_fit(self, num_sequences):
+        self.synthesizer.fit(self.data)
+
+    def peakmem_fit(self, num_sequences):
+        self.synthesizer.fit(self.data)
+
+    def time_sample(self, num_sequences):
+        self.fitted_synthesizer.sample(num_sequences)
+
+    def peakmem_sample(self, num_sequences):
+        self.fitted_synthesizer.sample(num_sequences)
@@ -0,0 +1,84 @@
+"""Benchmarks for the single table synthesizers and the data processing."""
+
+from benchmarks.datasets import get_single_table, get_sizes
+from sdv.single_table import CTGANSynthesizer, GaussianCopulaSynthesizer
+
+
+class GaussianCopulaSynthesizerSuite:
+    """Time and peak memory of fitting and sampling a ``GaussianCopulaSynthesizer``."""
+
+    params = get_sizes([1_000, 10_000, 100_000])
+    param_names = ['num_rows']
+    timeout = 600
+
+    def setup(self, num_rows):
+        self.data, self.metadata = get_single_table(num_rows)
+        self.synthesizer = GaussianCopulaSynthesizer(self.metadata)
+        self.fitted_synthesizer = GaussianCopulaSynthesizer(self.metadata)
+        self.fitted_synthesizer.fit(self.data)
+
+    def time_fit(self, num_rows):
+        self.synthesizer.fit(self.data)
+
+    def peakmem_fit(self, num_rows):
+        self.synthesizer.fit(self.data)
+
+    def time_sample(self, num_rows):
+        self.fitted_synthesizer.sample(num_rows)
+
+    def peakmem_sample(self, num_rows):
+        self.fitted_synthesizer.sample(num_rows)
+
+
+class CTGANSynthesizerSuite:
+    """Time and peak memory of fitting and sampling a ``CTGANSynthesizer`` on CPU."""
+
+    params = get_sizes([1_000, 10_000])
+    param_names = ['num_rows']
+    timeout = 1200
+
+    def setup(self, num_rows):
+        self.data, self.metadata = get_single_table(num_rows)
+        self.synthesizer = CTGANSynthesizer(self.metadata, epochs=2, cuda=False)
+        self.fitted_synthesizer = CTGANSynthesizer(self.metadata, epochs=1, cuda=False)
+        self.fitted_synthesizer.fit(self.data)
+
+    def time_fit(self, num_rows):
+        self.synthesizer.fit(self.data)
+
+    def peakmem_fit(self, num_rows):
+        self.synthesizer.fit(self.data)
+
+    def time_sample(self, num_rows):
+        self.fitted_synthesizer.sample(num_rows)
+
+    def peakmem_sample(self, num_rows):
+        self.fitted_synthesizer.sample(num_rows)
+
+
+class DataProcessorSuite:
+    """Time and peak memory of the ``DataProcessor`` transformations."""
+
+    params = get_sizes([1_000, 10_000, 100_000])
+    param_names = ['num_rows']
+    timeout = 600
+
+    def setup(self, num_rows):
+        data, metadata = get_single_table(num_rows)
+        synthesizer = GaussianCopulaSynthesizer(metadata)
+        synthesizer.fit(data)
+        self.data = data
+        self.data_processor = synthesizer._data_processor
+        self.transformed = self.data_processor.transform(data)
+
+    def time_transform(self, num_rows):
+        self.data_processor.transform(self.data)
+
+    def peakmem_transform(self, num_rows):
+        self.data_processor.transform(self.data)
+
+    def time_reverse_transform(self, num_rows):
+        self.data_processor.reverse_transform(self.transformed)
+
+    def peakmem_reverse_transform(self, num_rows):
+        self.data_processor.reverse_transform(self.transformed)
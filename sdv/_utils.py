@@ -1,5 +1,6 @@
 """Miscellaneous utility functions."""
 import operator
+import os
 import uuid
 import warnings
 from collections import defaultdict
@@ -385,6 +386,22 @@ def check_synthesizer_version(synthesizer, is_fit_method=False, compare_operator
         )
 
 
+def _validate_n_jobs(n_jobs):
+    if isinstance(n_jobs, bool) or not isinstance(n_jobs, int) or n_jobs == 0 or n_jobs < -1:
+        raise SynthesizerInputError(
+            f"Invalid value '{n_jobs}' for parameter 'n_jobs'. Please provide a positive "
+            'integer or -1 to use all the available CPUs.'
+        )
+
+
+def _get_num_workers(n_jobs, num_tasks):
+    """Get the number of processes to use for ``num_tasks`` tasks given ``n_jobs``."""
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+
+    return max(1, min(n_jobs, num_tasks))
+
+
 def _get_root_tables(relationships):
     parent_tables = {rel['parent_table_name'] for rel in relationships}
     child_tables = {rel['child_table_name'] for rel in relationships}
@@ -14,7 +14,9 @@ from rdt.transformers import BinaryEncoder, FloatFormatter, OneHotEncoder, UnixT
 from sdv._utils import _format_invalid_values_string, _groupby_list
 from sdv.constraints.errors import (
     AggregateConstraintsError, ConstraintMetadataError, MissingConstraintColumnError)
+from sdv.constraints.utils import cast_to_datetime64
 from sdv.errors import ConstraintsNotMetError
+from sdv.sampling.reject_sampling import RejectSamplingController
 
 LOGGER = logging.getLogger(__name__)
 
@@ -107,6 +109,8 @@ class Constraint(metaclass=ConstraintMeta):
 
     constraint_columns = ()
     _hyper_transformer = None
+    _datetime_parse_cache = None
+    _row_independent = True
 
     @classmethod
     def _validate_inputs(cls, **kwargs):
@@ -212,6 +216,30 @@ class Constraint(metaclass=ConstraintMeta):
 
                 raise ConstraintsNotMetError(err_msg)
 
+    def _cast_to_datetime64(self, column_name, value, datetime_format=None):
+        """Cast the values of a column to ``numpy.datetime64``.
+
+        If the constraint is being used during a pass of the ``DataProcessor``, the values
+        are taken from the ``DatetimeParseCache`` that it shares with the other constraints,
+        so each datetime column is only parsed once.
+
+        Args:
+            column_name (str):
+                Name of the column the values belong to.
+            value (pandas.Series or numpy.ndarray):
+                Values of the column.
+            datetime_format (str):
+                Datetime format of the values.
+
+        Returns:
+            pandas.Series or numpy.ndarray:
+                The ``numpy.datetime64`` values.
+        """
+        if self._datetime_parse_cache is None:
+            return cast_to_datetime64(value, datetime_format)
+
+        return self._datetime_parse_cache.cast_to_datetime64(column_name, value, datetime_format)
+
     def _fit(self, table_data):
         del table_data
 
@@ -401,6 +429,7 @@ class ColumnsModel:
             self.constraint_columns = [constraint_columns]
 
         self.constraint = constraint
+        self._reject_sampling = RejectSamplingController()
 
     @staticmethod
     def _get_hyper_transformer_config(data_to_model):
@@ -451,13 +480,27 @@ class ColumnsModel:
 
         self._model = GaussianMultivariate(distribution=GaussianUnivariate)
         self._model.fit(transformed_data)
+        self._reject_sampling = RejectSamplingController()
 
-    def _reject_sample(self, num_rows, conditions):
-        sampled = self._model.sample(num_rows=num_rows, conditions=conditions)
+    def _get_reject_sampling(self):
+        # Columns models saved before the controller existed do not have it
+        if getattr(self, '_reject_sampling', None) is None:
+            self._reject_sampling = RejectSamplingController()
+
+        return self._reject_sampling
+
+    def _sample_valid_rows(self, num_rows, conditions):
+        reject_sampling = self._get_reject_sampling()
+        num_to_sample = reject_sampling.get_num_rows_to_sample(num_rows, num_rows, conditions)
+        sampled = self._model.sample(num_rows=num_to_sample, conditions=conditions)
         sampled = self._hyper_transformer.reverse_transform(sampled)
         valid_rows = sampled[self.constraint.is_valid(sampled)]
+        reject_sampling.update(conditions, num_to_sample, len(valid_rows))
+        return valid_rows
+
+    def _reject_sample(self, num_rows, conditions):
+        valid_rows = self._sample_valid_rows(num_rows, conditions)
         counter = 0
-        total_sampled = num_rows
 
         while len(valid_rows) < num_rows:
             num_valid = len(valid_rows)
@@ -472,14 +515,7 @@ class ColumnsModel:
                                            ignore_index=True)
                     break
 
-            remaining = num_rows - num_valid
-            valid_probability = (num_valid + 1) / (total_sampled + 1)
-            max_rows = num_rows * 10
-            num_to_sample = min(int(remaining / valid_probability), max_rows)
-            total_sampled += num_to_sample
-            new_sampled = self._model.sample(num_rows=num_to_sample, conditions=conditions)
-            new_sampled = self._hyper_transformer.reverse_transform(new_sampled)
-            new_valid_rows = new_sampled[self.constraint.is_valid(new_sampled)]
+            new_valid_rows = self._sample_valid_rows(num_rows - num_valid, conditions)
             valid_rows = pd.concat([valid_rows, new_valid_rows], ignore_index=True)
             counter += 1
 
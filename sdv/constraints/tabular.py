@@ -31,7 +31,6 @@ Currently implemented constraints are:
 """
 
 import operator
-import uuid
 
 import numpy as np
 import pandas as pd
@@ -110,6 +109,8 @@ def create_custom_constraint_class(is_valid_fn, transform_fn=None, reverse_trans
                 Any kwargs necessary for constraint.
         """
 
+        _row_independent = False
+
         @classmethod
         def _validate_inputs(cls, **kwargs):
             if 'column_names' not in set(kwargs):
@@ -234,8 +235,9 @@ class FixedCombinations(Constraint):
 
     _separator = None
     _joint_column = None
-    _combinations_to_uuids = None
-    _uuids_to_combinations = None
+    _combinations = None
+    _combinations_index = None
+    _combination_labels = None
 
     @staticmethod
     def _validate_metadata_specific_to_constraint(metadata, **kwargs):
@@ -267,8 +269,8 @@ class FixedCombinations(Constraint):
               current data by iteratively adding `#` to it.
             - Generating the joint column name by concatenating
               the names of ``self._columns`` with the separator.
-            - Generating a mapping of the fixed combinations
-              to a unique identifier.
+            - Indexing the fixed combinations, so every combination is identified
+              by its position, and generating a label for each one of them.
 
         Args:
             table_data (pandas.DataFrame):
@@ -279,13 +281,33 @@ class FixedCombinations(Constraint):
             self._separator += '#'
 
         self._joint_column = self._separator.join(self._columns)
-        self._combinations = table_data[self._columns].drop_duplicates().copy()
-        self._combinations_to_uuids = {}
-        self._uuids_to_combinations = {}
-        for combination in self._combinations.itertuples(index=False, name=None):
-            uuid_str = str(uuid.uuid4())
-            self._combinations_to_uuids[combination] = uuid_str
-            self._uuids_to_combinations[uuid_str] = combination
+        self._combinations = table_data[self._columns].drop_duplicates().reset_index(drop=True)
+        self._combinations_index = pd.MultiIndex.from_frame(self._combinations)
+        self._combination_labels = pd.Index(
+            np.arange(len(self._combinations)).astype(str), dtype=object)
+
+    def _index_uuid_combinations(self):
+        """Index the combinations of a constraint fitted with uuid labels.
+
+        Constraints fitted before the combinations were indexed only have the mappings between
+        the combinations and their uuids, which are kept as labels, since the transformers
+        were fitted on them.
+        """
+        uuids_to_combinations = getattr(self, '_uuids_to_combinations', None)
+        if self._combinations_index is not None or uuids_to_combinations is None:
+            return
+
+        # The uuids were generated in the same order as the combinations
+        self._combinations = self._combinations.reset_index(drop=True)
+        self._combinations_index = pd.MultiIndex.from_frame(self._combinations)
+        self._combination_labels = pd.Index(list(uuids_to_combinations), dtype=object)
+
+    def _get_combination_codes(self, table_data):
+        """Get the position of the combination of every row, or -1 if it was not seen."""
+        self._index_uuid_combinations()
+        combinations = pd.MultiIndex.from_arrays(
+            [table_data[column] for column in self._columns])
+        return self._combinations_index.get_indexer(combinations)
 
     def is_valid(self, table_data):
         """Say whether the column values are within the original combinations.
@@ -298,21 +320,16 @@ class FixedCombinations(Constraint):
             pandas.Series:
                 Whether each row is valid.
         """
-        merged = table_data.merge(
-            self._combinations,
-            how='left',
-            on=self._columns,
-            indicator=self._joint_column
-        )
-        return merged[self._joint_column] == 'both'
+        codes = self._get_combination_codes(table_data)
+        return pd.Series(codes >= 0, index=table_data.index, name=self._joint_column)
 
     def _transform(self, table_data):
         """Transform the table data.
 
         The transformation consist on removing all the ``self._columns`` from
-        the dataframe, and replacing them with a unique identifier that maps to
-        that unique combination of column values under the previously computed
-        combined column name.
+        the dataframe, and replacing them with a label that maps to that unique
+        combination of column values under the previously computed combined
+        column name. The rows with unseen combinations are left empty.
 
         Args:
             table_data (pandas.DataFrame):
@@ -322,16 +339,16 @@ class FixedCombinations(Constraint):
             pandas.DataFrame:
                 Transformed data.
         """
-        combinations = table_data[self._columns].itertuples(index=False, name=None)
-        uuids = map(self._combinations_to_uuids.get, combinations)
-        table_data[self._joint_column] = list(uuids)
+        codes = self._get_combination_codes(table_data)
+        table_data[self._joint_column] = pd.api.extensions.take(
+            self._combination_labels.to_numpy(), codes, allow_fill=True, fill_value=None)
         return table_data.drop(self._columns, axis=1)
 
     def _reverse_transform(self, table_data):
         """Reverse transform the table data.
 
         The transformation is reversed by popping the joint column from
-        the table, mapping it back to the original combination of column values,
+        the table, finding the position of every label in the original combinations,
         and then setting all the columns back to the table with the original
         names.
 
@@ -343,10 +360,12 @@ class FixedCombinations(Constraint):
             pandas.DataFrame:
                 Transformed data.
         """
-        columns = table_data.pop(self._joint_column).map(self._uuids_to_combinations)
-
-        for index, column in enumerate(self._columns):
-            table_data[column] = columns.str[index]
+        self._index_uuid_combinations()
+        labels = table_data.pop(self._joint_column)
+        codes = self._combination_labels.get_indexer(labels)
+        for column in self._columns:
+            table_data[column] = pd.api.extensions.take(
+                self._combinations[column].to_numpy(), codes, allow_fill=True)
 
         return table_data
 
@@ -458,8 +477,10 @@ class Inequality(Constraint):
         """
         low, high = self._get_data(table_data)
         if self._is_datetime and self._dtype == 'O':
-            low = cast_to_datetime64(low, self._low_datetime_format)
-            high = cast_to_datetime64(high, self._high_datetime_format)
+            low = self._cast_to_datetime64(
+                self._low_column_name, low, self._low_datetime_format)
+            high = self._cast_to_datetime64(
+                self._high_column_name, high, self._high_datetime_format)
 
         valid = pd.isna(low) | pd.isna(high) | self._operator(high, low)
         return valid
@@ -483,12 +504,11 @@ class Inequality(Constraint):
         """
         low, high = self._get_data(table_data)
         if self._is_datetime:
-            diff_column = get_datetime_diff(
-                high=high,
-                low=low,
-                high_datetime_format=self._high_datetime_format,
-                low_datetime_format=self._low_datetime_format
-            )
+            low = self._cast_to_datetime64(
+                self._low_column_name, low, self._low_datetime_format)
+            high = self._cast_to_datetime64(
+                self._high_column_name, high, self._high_datetime_format)
+            diff_column = get_datetime_diff(high=high, low=low, dtype=high.dtype)
         else:
             diff_column = high - low
 
@@ -535,7 +555,7 @@ class Inequality(Constraint):
 
         low = table_data[self._low_column_name].to_numpy()
         if self._is_datetime and self._dtype == 'O':
-            low = cast_to_datetime64(low)
+            low = self._cast_to_datetime64(self._low_column_name, low)
 
         table_data[self._high_column_name] = pd.Series(diff_column + low).astype(self._dtype)
 
@@ -671,7 +691,7 @@ class ScalarInequality(Constraint):
         """
         column = table_data[self._column_name].to_numpy()
         if self._is_datetime and self._dtype == 'O':
-            column = cast_to_datetime64(column, datetime_format=self._datetime_format)
+            column = self._cast_to_datetime64(self._column_name, column, self._datetime_format)
 
         valid = pd.isna(column) | self._operator(column, self._value)
         return valid
@@ -695,7 +715,7 @@ class ScalarInequality(Constraint):
         """
         column = table_data[self._column_name].to_numpy()
         if self._is_datetime:
-            column = cast_to_datetime64(column, datetime_format=self._datetime_format)
+            column = self._cast_to_datetime64(self._column_name, column, self._datetime_format)
             diff_column = abs(column - self._value)
             diff_column = diff_column.astype(np.float64)
         else:
@@ -942,20 +962,16 @@ class Range(Constraint):
         high = table_data[self.high_column_name].to_numpy()
 
         if self._is_datetime:
-            low_diff_column = get_datetime_diff(
-                middle,
-                low,
-                high_datetime_format=self._middle_datetime_format,
-                low_datetime_format=self._low_datetime_format,
-                dtype=self._dtype,
-            )
-            high_diff_column = get_datetime_diff(
-                high,
-                middle,
-                high_datetime_format=self._high_datetime_format,
-                low_datetime_format=self._middle_datetime_format,
-                dtype=self._dtype,
-            )
+            if self._dtype == 'O':
+                low = self._cast_to_datetime64(
+                    self.low_column_name, low, self._low_datetime_format)
+                middle = self._cast_to_datetime64(
+                    self.middle_column_name, middle, self._middle_datetime_format)
+                high = self._cast_to_datetime64(
+                    self.high_column_name, high, self._high_datetime_format)
+
+            low_diff_column = get_datetime_diff(middle, low, dtype=middle.dtype)
+            high_diff_column = get_datetime_diff(high, middle, dtype=high.dtype)
 
         else:
             low_diff_column = middle - low
@@ -1009,7 +1025,7 @@ class Range(Constraint):
 
         low = table_data[self.low_column_name].to_numpy()
         if self._is_datetime and self._dtype == 'O':
-            low = cast_to_datetime64(low, self._low_datetime_format)
+            low = self._cast_to_datetime64(self.low_column_name, low, self._low_datetime_format)
 
         middle = pd.Series(low_diff_column + low).astype(self._dtype)
         table_data[self.middle_column_name] = middle
@@ -1154,7 +1170,7 @@ class ScalarRange(Constraint):
         data = table_data[self._column_name]
 
         if self._is_datetime:
-            data = cast_to_datetime64(data, datetime_format=self._datetime_format)
+            data = self._cast_to_datetime64(self._column_name, data, self._datetime_format)
 
         satisfy_low_bound = np.logical_or(
             self._operator(self._low_value, data),
@@ -1187,8 +1203,7 @@ class ScalarRange(Constraint):
         """
         data = table_data[self._column_name]
         if self._is_datetime:
-            data = cast_to_datetime64(
-                table_data[self._column_name], datetime_format=self._datetime_format)
+            data = self._cast_to_datetime64(self._column_name, data, self._datetime_format)
 
         data = logit(data, self._low_value, self._high_value)
         table_data[self._transformed_column] = data
@@ -1403,6 +1418,8 @@ class Unique(Constraint):
             List of name(s) of the column(s) to keep unique.
     """
 
+    _row_independent = False
+
     def __init__(self, column_names):
         self.column_names = column_names
         self.constraint_columns = tuple(self.column_names)
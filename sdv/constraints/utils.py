@@ -1,5 +1,6 @@
 """Constraint utility functions."""
 
+import warnings
 from datetime import datetime
 from decimal import Decimal
 
@@ -27,16 +28,145 @@ def cast_to_datetime64(value, datetime_format=None):
     elif isinstance(value, pd.Series):
         value = value.astype('datetime64[ns]')
     elif isinstance(value, (np.ndarray, list)):
-        value = np.array([
-            pd.to_datetime(item, format=datetime_format).to_datetime64()
-            if not pd.isna(item)
-            else pd.NaT.to_datetime64()
-            for item in value
-        ])
+        value = _cast_array_to_datetime64(value, datetime_format)
 
     return value
 
 
+def _cast_items_to_datetime64(values, datetime_format):
+    return np.array([
+        pd.to_datetime(item, format=datetime_format).to_datetime64()
+        if not pd.isna(item)
+        else pd.NaT.to_datetime64()
+        for item in values
+    ])
+
+
+def _cast_array_to_datetime64(values, datetime_format):
+    """Cast an array of values to ``numpy.datetime64`` in a single call to ``pd.to_datetime``.
+
+    If the values can not be parsed together, for example because they do not share the
+    same format, each one of them is parsed on its own.
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            parsed = pd.to_datetime(values, format=datetime_format)
+
+    except (ValueError, TypeError, OverflowError):
+        return _cast_items_to_datetime64(values, datetime_format)
+
+    if not isinstance(parsed, pd.DatetimeIndex):
+        return _cast_items_to_datetime64(values, datetime_format)
+
+    if parsed.tz is not None:
+        parsed = parsed.tz_convert(None)
+
+    return parsed.to_numpy()
+
+
+class DatetimeParseCache:
+    """Cache of the datetime columns parsed during a single pass over a table.
+
+    The entries are stored by column name and datetime format, together with the raw values
+    they were parsed from. A column is only served from the cache if its values are still
+    the same, so a column that has been modified since it was parsed is parsed again.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    @staticmethod
+    def _has_same_values(cached_values, values):
+        if cached_values.shape != values.shape:
+            return False
+
+        same_values = np.asarray(cached_values == values, dtype=bool)
+        return bool(np.all(same_values | (pd.isna(cached_values) & pd.isna(values))))
+
+    def get(self, column_name, values, datetime_format=None, method='to_datetime'):
+        """Get the parsed values of a column if they have been cached.
+
+        Args:
+            column_name (str):
+                Name of the column.
+            values (numpy.ndarray):
+                Raw values of the column.
+            datetime_format (str):
+                Datetime format used to parse the values.
+            method (str):
+                Name of the method used to parse the values. Defaults to ``'to_datetime'``.
+
+        Returns:
+            numpy.ndarray or None:
+                The parsed values, or ``None`` if they are not in the cache.
+        """
+        entry = self._entries.get((column_name, datetime_format, method))
+        if entry is not None and self._has_same_values(entry[0], values):
+            return entry[1]
+
+        return None
+
+    def set(self, column_name, values, parsed_values, datetime_format=None,
+            method='to_datetime'):
+        """Store the parsed values of a column.
+
+        Args:
+            column_name (str):
+                Name of the column.
+            values (numpy.ndarray):
+                Raw values of the column.
+            parsed_values (numpy.ndarray):
+                The ``values`` parsed as datetimes.
+            datetime_format (str):
+                Datetime format used to parse the values.
+            method (str):
+                Name of the method used to parse the values. Defaults to ``'to_datetime'``.
+        """
+        # The values are usually a view of the table, which can be modified in place later
+        self._entries[(column_name, datetime_format, method)] = (values.copy(), parsed_values)
+
+    def cast_to_datetime64(self, column_name, value, datetime_format=None):
+        """Cast the values of a column using ``cast_to_datetime64``, parsing them only once.
+
+        Args:
+            column_name (str):
+                Name of the column the values belong to.
+            value (pandas.Series or numpy.ndarray):
+                Values of the column.
+            datetime_format (str):
+                Datetime format of the values.
+
+        Returns:
+            pandas.Series or numpy.ndarray:
+                The ``numpy.datetime64`` values, with the same type as ``value``.
+        """
+        is_series = isinstance(value, pd.Series)
+        values = value.to_numpy() if is_series else value
+        if not isinstance(values, np.ndarray) or values.dtype != 'O':
+            return cast_to_datetime64(value, datetime_format)
+
+        # ``pandas.Series`` are cast using ``astype``, which does not use the format
+        if is_series:
+            method = 'astype'
+            datetime_format = None
+        else:
+            method = 'to_datetime'
+            if datetime_format:
+                datetime_format = datetime_format.replace('%-', '%')
+
+        parsed_values = self.get(column_name, values, datetime_format, method)
+        if parsed_values is None:
+            parsed = cast_to_datetime64(value, datetime_format)
+            parsed_values = parsed.to_numpy() if is_series else parsed
+            self.set(column_name, values, parsed_values, datetime_format, method)
+
+        if is_series:
+            return pd.Series(parsed_values, index=value.index, name=value.name)
+
+        return parsed_values
+
+
 def matches_datetime_format(value, datetime_format):
     """Check if datetime value matches the provided format.
 
@@ -135,9 +265,21 @@ def get_nan_component_value(row):
         return 'None'
 
 
+def _get_nan_component_label(column_names, pattern):
+    """Get the label of a NaN pattern, listing the columns whose bit is set."""
+    columns_with_nans = [
+        column for position, column in enumerate(column_names) if pattern & (1 << position)
+    ]
+    return ', '.join(columns_with_nans) if columns_with_nans else 'None'
+
+
 def compute_nans_column(table_data, list_column_names):
     """Compute a categorical column to the table_data indicating where NaNs are.
 
+    The NaN pattern of every row is computed as a bitmask over the columns, and every
+    distinct pattern is mapped to a label with the names of the columns with NaNs, as
+    returned by ``get_nan_component_value``.
+
     Args:
         table_data (pandas.DataFrame):
             The table data.
@@ -149,27 +291,40 @@ def compute_nans_column(table_data, list_column_names):
         Empty dict if there are no NaNs.
     """
     nan_column_name = '#'.join(list_column_names) + '.nan_component'
-    column = table_data[list_column_names].apply(get_nan_component_value, axis=1)
-    if not (column == 'None').all():
-        return pd.Series(column, name=nan_column_name)
+    is_nan = table_data[list_column_names].isna().to_numpy()
+    if not is_nan.any():
+        return None
+
+    bits = np.left_shift(1, np.arange(len(list_column_names), dtype=np.int64))
+    patterns, codes = np.unique(is_nan @ bits, return_inverse=True)
+    labels = np.array([
+        _get_nan_component_label(list_column_names, pattern) for pattern in patterns
+    ], dtype=object)
 
-    return None
+    return pd.Series(labels[codes], index=table_data.index, name=nan_column_name)
 
 
 def revert_nans_columns(table_data, nan_column_name):
     """Reverts the NaNs in the table_data based on the categorical column.
 
+    Only the distinct labels of the categorical column are parsed, and then the NaNs
+    of every column are set at once.
+
     Args:
         table_data (pandas.DataFrame):
             The table data.
         nan_column (pandas.Series):
             The categorical columns indicating where the NaNs are.
     """
-    combinations = table_data[nan_column_name].unique()
-    for combination in combinations:
+    codes, combinations = pd.factorize(table_data[nan_column_name])
+    codes_per_column = {}
+    for code, combination in enumerate(combinations):
         if combination != 'None':
-            column_names = [column_name.strip() for column_name in combination.split(',')]
-            table_data.loc[table_data[nan_column_name] == combination, column_names] = np.nan
+            for column_name in combination.split(','):
+                codes_per_column.setdefault(column_name.strip(), []).append(code)
+
+    for column_name, column_codes in codes_per_column.items():
+        table_data.loc[np.isin(codes, column_codes), column_name] = np.nan
 
     return table_data.drop(columns=nan_column_name)
 
@@ -3,9 +3,11 @@
 import json
 import logging
 import warnings
+from contextlib import contextmanager
 from copy import deepcopy
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import rdt
 from pandas.api.types import is_float_dtype, is_integer_dtype
@@ -16,6 +18,7 @@ from sdv.constraints import Constraint
 from sdv.constraints.base import get_subclasses
 from sdv.constraints.errors import (
     AggregateConstraintsError, FunctionError, MissingConstraintColumnError)
+from sdv.constraints.utils import DatetimeParseCache
 from sdv.data_processing.datetime_formatter import DatetimeFormatter
 from sdv.data_processing.errors import InvalidConstraintsError, NotFittedError
 from sdv.data_processing.numerical_formatter import NumericalFormatter
@@ -114,6 +117,7 @@ class DataProcessor:
         self._constraints_list = []
         self._constraints = []
         self._constraints_to_reverse = []
+        self._constraints_statistics = []
         self._custom_constraint_classes = {}
 
         self._transformers_by_sdtype = deepcopy(get_default_transformers())
@@ -354,6 +358,7 @@ class DataProcessor:
 
     def _fit_constraints(self, data):
         self._constraints = self._load_constraints()
+        self._reset_constraints_statistics()
         errors = []
         for constraint in self._constraints:
             try:
@@ -364,6 +369,33 @@ class DataProcessor:
         if errors:
             raise AggregateConstraintsError(errors)
 
+    @contextmanager
+    def _datetime_parse_pass(self):
+        """Share a ``DatetimeParseCache`` between the constraints and the formatters.
+
+        While the pass lasts, every datetime column that the constraints or the datetime
+        formatters need to parse is only parsed once. The cache is dropped when the
+        outermost pass ends, so passes that are nested inside another reuse its cache.
+        """
+        components = [*self._constraints, *self.formatters.values()]
+        components = [
+            component for component in components
+            if isinstance(component, (Constraint, DatetimeFormatter))
+        ]
+        if any(component._datetime_parse_cache is not None for component in components):
+            yield
+            return
+
+        datetime_parse_cache = DatetimeParseCache()
+        for component in components:
+            component._datetime_parse_cache = datetime_parse_cache
+
+        try:
+            yield
+        finally:
+            for component in components:
+                del component._datetime_parse_cache
+
     def _transform_constraints(self, data, is_condition=False):
         errors = []
         if not is_condition:
@@ -721,7 +753,9 @@ class DataProcessor:
             if len(self._constraints_list) != len(self._constraints):
                 self._fit_constraints(data)
 
-            constrained = self._transform_constraints(data)
+            with self._datetime_parse_pass():
+                constrained = self._transform_constraints(data)
+
             columns_created_by_constraints = set(constrained.columns) - set(data.columns)
 
             config = self._hyper_transformer.get_config()
@@ -756,7 +790,9 @@ class DataProcessor:
             raise ValueError('The fit dataframe is empty, synthesizer will not be fitted.')
         self._prepared_for_fitting = False
         self.prepare_for_fitting(data)
-        constrained = self._transform_constraints(data)
+        with self._datetime_parse_pass():
+            constrained = self._transform_constraints(data)
+
         if constrained.empty:
             raise ValueError(
                 'The constrained fit dataframe is empty, synthesizer will not be fitted.')
@@ -808,7 +844,8 @@ class DataProcessor:
             if column in data.columns
         ]
         LOGGER.debug(f'Transforming constraints for table {self.table_name}')
-        data = self._transform_constraints(data[columns], is_condition)
+        with self._datetime_parse_pass():
+            data = self._transform_constraints(data[columns], is_condition)
 
         LOGGER.debug(f'Transforming table {self.table_name}')
         if self._keys and not is_condition:
@@ -821,21 +858,7 @@ class DataProcessor:
 
         return transformed
 
-    def reverse_transform(self, data, reset_keys=False):
-        """Reverse the transformed data to the original format.
-
-        Args:
-            data (pandas.DataFrame):
-                Data to be reverse transformed.
-            reset_keys (bool):
-                Whether or not to reset the keys generators. Defaults to ``False``.
-
-        Returns:
-            pandas.DataFrame
-        """
-        if not self.fitted:
-            raise NotFittedError()
-
+    def _reverse_transform_fields(self, data):
         reversible_columns = [
             column
             for column in self._hyper_transformer._output_columns
@@ -855,43 +878,53 @@ class DataProcessor:
             if not transformer.output_columns:
                 reversed_data = transformer.reverse_transform(reversed_data)
 
-        num_rows = len(reversed_data)
-        sampled_columns = list(reversed_data.columns)
-        missing_columns = [
+        return reversed_data
+
+    def _get_anonymized_columns(self, sampled_columns):
+        return [
             column
-            for column in self.metadata.columns.keys() - set(sampled_columns + self._keys)
+            for column in self.metadata.columns.keys() - set(sampled_columns) - set(self._keys)
             if self._hyper_transformer.field_transformers.get(column)
         ]
-        if missing_columns and num_rows:
+
+    def _generate_columns(self, reversed_data, anonymized_columns, reset_keys=False):
+        """Add the anonymized columns and the keys to the reverse transformed data."""
+        num_rows = len(reversed_data)
+        if anonymized_columns and num_rows:
             anonymized_data = self._hyper_transformer.create_anonymized_columns(
                 num_rows=num_rows,
-                column_names=missing_columns
+                column_names=anonymized_columns
             )
-            sampled_columns.extend(missing_columns)
+            anonymized_data.index = reversed_data.index
             reversed_data[anonymized_data.columns] = anonymized_data[anonymized_data.notna()]
 
         if self._keys and num_rows:
             generated_keys = self.generate_keys(num_rows, reset_keys)
-            sampled_columns.extend(self._keys)
+            generated_keys.index = reversed_data.index
             reversed_data[generated_keys.columns] = generated_keys[generated_keys.notna()]
 
+        return reversed_data
+
+    def _reverse_transform_constraints(self, reversed_data):
         for constraint in reversed(self._constraints_to_reverse):
             reversed_data = constraint.reverse_transform(reversed_data)
 
-        # Add new columns generated by the constraint
-        new_columns = list(set(reversed_data.columns) - set(sampled_columns))
-        sampled_columns.extend(new_columns)
+        return reversed_data
 
+    def _get_sampled_columns(self, reversed_data):
         # Sort the sampled columns in the order of the metadata.
         # Any extra columns not present in the metadata will be dropped.
         # In multitable there may be missing columns in the sample such as foreign keys
         # And alternate keys. Thats the reason of ensuring that the metadata column is within
         # The sampled columns.
-        sampled_columns = [
+        return [
             column for column in self.metadata.columns.keys()
-            if column in sampled_columns
+            if column in reversed_data.columns
         ]
-        for column_name in sampled_columns:
+
+    def _cast_and_format(self, reversed_data, columns):
+        """Cast the given columns to their original dtypes and reformat them."""
+        for column_name in columns:
             column_data = reversed_data[column_name]
 
             dtype = self._dtypes[column_name]
@@ -917,16 +950,191 @@ class DataProcessor:
                     raise ValueError(e)
 
         # reformat columns using the formatters
-        for column in sampled_columns:
+        for column in columns:
             if column in self.formatters:
                 data_to_format = reversed_data[column]
                 reversed_data[column] = self.formatters[column].format_data(data_to_format)
 
+        return reversed_data
+
+    def _complete_reverse_transform(self, reversed_data, anonymized_columns, reset_keys=False):
+        """Generate the missing columns and reverse the constraints of the reversed fields."""
+        reversed_data = self._generate_columns(reversed_data, anonymized_columns, reset_keys)
+        with self._datetime_parse_pass():
+            reversed_data = self._reverse_transform_constraints(reversed_data)
+            sampled_columns = self._get_sampled_columns(reversed_data)
+            reversed_data = self._cast_and_format(reversed_data, sampled_columns)
+
         return reversed_data[sampled_columns]
 
+    def reverse_transform(self, data, reset_keys=False):
+        """Reverse the transformed data to the original format.
+
+        Args:
+            data (pandas.DataFrame):
+                Data to be reverse transformed.
+            reset_keys (bool):
+                Whether or not to reset the keys generators. Defaults to ``False``.
+
+        Returns:
+            pandas.DataFrame
+        """
+        if not self.fitted:
+            raise NotFittedError()
+
+        reversed_data = self._reverse_transform_fields(data)
+        anonymized_columns = self._get_anonymized_columns(reversed_data.columns)
+        return self._complete_reverse_transform(reversed_data, anonymized_columns, reset_keys)
+
+    def reverse_transform_valid(self, data, condition_columns=None, filter_conditions=None):
+        """Reverse transform the data and return only the valid rows.
+
+        This is done in two phases. First, only the columns that the constraints and the
+        conditions depend on are reverse transformed completely, and the invalid rows are
+        dropped. Then, the remaining columns are cast and formatted, and the anonymized
+        columns and keys are generated, only for the valid rows. If a constraint or a
+        condition depends on an anonymized column or a key, or there are custom constraints,
+        which may read any column, all the columns are reverse transformed before filtering.
+
+        Args:
+            data (pandas.DataFrame):
+                Data to be reverse transformed.
+            condition_columns (list or None):
+                The columns used by ``filter_conditions``. Defaults to ``None``.
+            filter_conditions (callable or None):
+                A function that takes the reverse transformed data and returns the rows that
+                match the conditions. If ``None``, the rows are only filtered using the
+                constraints. Defaults to ``None``.
+
+        Returns:
+            pandas.DataFrame:
+                The valid rows in the original format.
+        """
+        if not self.fitted:
+            raise NotFittedError()
+
+        validity_columns = set(condition_columns or [])
+        for constraint in self._constraints:
+            validity_columns.update(constraint.constraint_columns)
+
+        custom_constraint_classes = tuple(self._custom_constraint_classes.values())
+        has_custom_constraints = any(
+            isinstance(constraint, custom_constraint_classes) for constraint in self._constraints
+        )
+        reversed_data = self._reverse_transform_fields(data)
+        anonymized_columns = self._get_anonymized_columns(reversed_data.columns)
+        if has_custom_constraints or validity_columns & set(anonymized_columns + self._keys):
+            with self._datetime_parse_pass():
+                reversed_data = self._complete_reverse_transform(reversed_data, anonymized_columns)
+                reversed_data = self.filter_valid(reversed_data)
+
+            if filter_conditions is not None:
+                reversed_data = filter_conditions(reversed_data)
+
+            return reversed_data
+
+        with self._datetime_parse_pass():
+            reversed_data = self._reverse_transform_constraints(reversed_data)
+            checked_columns = [
+                column
+                for column in self._get_sampled_columns(reversed_data)
+                if column in validity_columns
+            ]
+            reversed_data = self._cast_and_format(reversed_data, checked_columns)
+            reversed_data = self.filter_valid(reversed_data)
+
+        if filter_conditions is not None:
+            reversed_data = filter_conditions(reversed_data)
+
+        reversed_data = self._generate_columns(reversed_data.copy(), anonymized_columns)
+        sampled_columns = self._get_sampled_columns(reversed_data)
+        remaining_columns = [
+            column for column in sampled_columns if column not in checked_columns
+        ]
+        reversed_data = self._cast_and_format(reversed_data, remaining_columns)
+
+        return reversed_data[sampled_columns]
+
+    def _reset_constraints_statistics(self):
+        self._constraints_statistics = [
+            {'evaluated_rows': 0, 'rejected_rows': 0}
+            for _ in self._constraints
+        ]
+
+    def _get_constraints_statistics(self):
+        constraints_statistics = getattr(self, '_constraints_statistics', [])
+        if len(constraints_statistics) != len(self._constraints):
+            self._reset_constraints_statistics()
+
+        return self._constraints_statistics
+
+    def _get_constraints_plan(self):
+        """Get the positions of the constraints in the order in which to evaluate them.
+
+        The constraints that reject a larger share of the rows they evaluate go first, so the
+        following ones have fewer rows left to evaluate. The constraints that have not been
+        evaluated yet go before all the others, in the order in which they were added.
+
+        Constraints whose validity depends on other rows, like ``Unique``, are never moved:
+        they are evaluated on the same rows as if the constraints were evaluated one by one in
+        the order in which they were added. Only the constraints between them are reordered.
+
+        Returns:
+            list[int]:
+                The positions of the constraints in ``self._constraints``.
+        """
+        constraints_statistics = self._get_constraints_statistics()
+
+        def get_priority(position):
+            statistics = constraints_statistics[position]
+            if not statistics['evaluated_rows']:
+                return -np.inf
+
+            return -statistics['rejected_rows'] / statistics['evaluated_rows']
+
+        plan = []
+        segment = []
+        for position, constraint in enumerate(self._constraints):
+            if getattr(constraint, '_row_independent', False):
+                segment.append(position)
+            else:
+                plan.extend(sorted(segment, key=get_priority))
+                plan.append(position)
+                segment = []
+
+        plan.extend(sorted(segment, key=get_priority))
+        return plan
+
+    def get_constraints_statistics(self):
+        """Get how many rows each constraint has evaluated and rejected in ``filter_valid``.
+
+        The rows rejected by a constraint are the ones that were not already rejected by the
+        constraints evaluated before it. The counters are reset every time the data processor
+        is fitted.
+
+        Returns:
+            list[dict]:
+                A dictionary for each constraint, in the order in which they were added, with
+                the ``constraint`` class name, the number of ``evaluated_rows`` and the number
+                of ``rejected_rows``.
+        """
+        constraints_statistics = self._get_constraints_statistics()
+        return [
+            {
+                'constraint': constraint.__class__.__name__,
+                'evaluated_rows': statistics['evaluated_rows'],
+                'rejected_rows': statistics['rejected_rows'],
+            }
+            for constraint, statistics in zip(self._constraints, constraints_statistics)
+        ]
+
     def filter_valid(self, data):
         """Filter the data using the constraints and return only the valid rows.
 
+        The ``is_valid`` masks of all the constraints are combined into a single mask, which
+        is used to slice the data once. The constraints are evaluated in the order given by
+        ``_get_constraints_plan``, each of them only on the rows that are still valid.
+
         Args:
             data (pandas.DataFrame):
                 Table data.
@@ -935,10 +1143,31 @@ class DataProcessor:
             pandas.DataFrame:
                 Table containing only the valid rows.
         """
-        for constraint in self._constraints:
-            data = constraint.filter_valid(data)
-
-        return data
+        constraints_statistics = self._get_constraints_statistics()
+        valid = np.ones(len(data), dtype=bool)
+        with self._datetime_parse_pass():
+            for position in self._get_constraints_plan():
+                candidates = np.flatnonzero(valid)
+                if not len(candidates):
+                    break
+
+                constraint = self._constraints[position]
+                subset = data if len(candidates) == len(data) else data.iloc[candidates]
+                is_valid = np.asarray(constraint.is_valid(subset), dtype=bool)
+                num_rejected = len(candidates) - int(is_valid.sum())
+                valid[candidates] = is_valid
+
+                statistics = constraints_statistics[position]
+                statistics['evaluated_rows'] += len(subset)
+                statistics['rejected_rows'] += num_rejected
+                if num_rejected:
+                    LOGGER.debug('%s: %s invalid rows out of %s.',
+                                 constraint.__class__.__name__, num_rejected, len(candidates))
+
+        if valid.all():
+            return data
+
+        return data[valid]
 
     def to_dict(self):
         """Get a dict representation of this DataProcessor.
@@ -1,8 +1,111 @@
 """Formatter for datetime data."""
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
 
 from sdv._utils import _get_datetime_format
 
+# The ``strftime`` directives that always produce the same number of digits, mapped to the
+# datetime attribute they represent and their width.
+FIXED_WIDTH_DIRECTIVES = {
+    'Y': ('year', 4),
+    'y': ('year', 2),
+    'm': ('month', 2),
+    'd': ('day', 2),
+    'j': ('dayofyear', 3),
+    'H': ('hour', 2),
+    'M': ('minute', 2),
+    'S': ('second', 2),
+    'f': ('microsecond', 6),
+}
+
+
+def _compile_datetime_format(datetime_format):
+    """Split a ``strftime`` format into literal strings and fixed width directives.
+
+    Args:
+        datetime_format (str):
+            The ``strftime`` format to compile.
+
+    Returns:
+        list or None:
+            The literal strings and the directives (without the ``%``) in the format, or
+            ``None`` if the format contains a directive that is not in
+            ``FIXED_WIDTH_DIRECTIVES`` or a character that is not ASCII.
+    """
+    if not datetime_format.isascii():
+        return None
+
+    tokens = []
+    literal = ''
+    position = 0
+    while position < len(datetime_format):
+        char = datetime_format[position]
+        if char != '%':
+            literal += char
+            position += 1
+            continue
+
+        directive = datetime_format[position + 1:position + 2]
+        if directive == '%':
+            literal += '%'
+        elif directive in FIXED_WIDTH_DIRECTIVES:
+            if literal:
+                tokens.append(literal)
+                literal = ''
+
+            tokens.append(directive)
+        else:
+            return None
+
+        position += 2
+
+    if literal:
+        tokens.append(literal)
+
+    return tokens
+
+
+def _format_fixed_width(datetime_column, tokens):
+    """Format datetimes by writing the digits of each directive into a character array.
+
+    Args:
+        datetime_column (pandas.Series):
+            The datetimes to format.
+        tokens (list):
+            The output of ``_compile_datetime_format``.
+
+    Returns:
+        pandas.Series or None:
+            The formatted datetimes, with ``NaN`` for the missing values, or ``None`` if the
+            years can not be written with four digits.
+    """
+    is_nat = datetime_column.isna().to_numpy()
+    widths = [
+        FIXED_WIDTH_DIRECTIVES[token][1] if token in FIXED_WIDTH_DIRECTIVES else len(token)
+        for token in tokens
+    ]
+    chars = np.empty((len(datetime_column), sum(widths)), dtype=np.uint8)
+    start = 0
+    for token, width in zip(tokens, widths):
+        if token not in FIXED_WIDTH_DIRECTIVES:
+            chars[:, start:start + width] = np.frombuffer(token.encode('ascii'), dtype=np.uint8)
+        else:
+            attribute = FIXED_WIDTH_DIRECTIVES[token][0]
+            values = getattr(datetime_column.dt, attribute).to_numpy(dtype=float, na_value=0)
+            values = values.astype(np.int64)
+            if token == 'Y' and ((values[~is_nat] < 1000) | (values[~is_nat] > 9999)).any():
+                return None
+
+            for digit in range(width):
+                chars[:, start + width - digit - 1] = values // 10 ** digit % 10 + ord('0')
+
+        start += width
+
+    formatted = chars.view(f'S{chars.shape[1]}').ravel().astype(str).astype(object)
+    formatted[is_nat] = np.nan
+    return pd.Series(formatted, index=datetime_column.index, name=datetime_column.name)
+
 
 class DatetimeFormatter:
     """Formatter for datetime data.
@@ -14,6 +117,8 @@ class DatetimeFormatter:
             If ``None`` it will attempt to learn it by itself. Defaults to ``None``.
     """
 
+    _datetime_parse_cache = None
+
     def __init__(self, datetime_format=None):
         self.datetime_format = datetime_format
 
@@ -28,6 +133,41 @@ class DatetimeFormatter:
         if self.datetime_format is None:
             self.datetime_format = _get_datetime_format(column)
 
+    def _to_datetime(self, column):
+        """Parse the column with the learned format, sharing the result with the constraints.
+
+        The parsed values are only taken from and stored in the ``DatetimeParseCache`` when
+        the format has no timezone directives, since then the parsed values are not timezone
+        aware and match the ones parsed by the constraints.
+        """
+        values = column.to_numpy()
+        cache = self._datetime_parse_cache
+        has_timezone = '%z' in self.datetime_format or '%Z' in self.datetime_format
+        if cache is None or values.dtype != 'O' or has_timezone:
+            return pd.to_datetime(column, format=self.datetime_format)
+
+        parsed_values = cache.get(column.name, values, self.datetime_format)
+        if parsed_values is None:
+            datetime_column = pd.to_datetime(column, format=self.datetime_format)
+            cache.set(column.name, values, datetime_column.to_numpy(), self.datetime_format)
+            return datetime_column
+
+        return pd.Series(parsed_values, index=column.index, name=column.name)
+
+    def _strftime(self, datetime_column):
+        """Format the datetimes with the learned format.
+
+        If the format only has fixed width directives, the datetimes are formatted for all
+        the rows at once. Otherwise, ``strftime`` is used.
+        """
+        tokens = _compile_datetime_format(self.datetime_format)
+        if tokens:
+            formatted = _format_fixed_width(datetime_column, tokens)
+            if formatted is not None:
+                return formatted
+
+        return datetime_column.dt.strftime(self.datetime_format)
+
     def format_data(self, column):
         """Format a column according to the learned format.
 
@@ -41,9 +181,12 @@ class DatetimeFormatter:
         """
         if self.datetime_format:
             try:
-                datetime_column = pd.to_datetime(column, format=self.datetime_format)
-                column = datetime_column.dt.strftime(self.datetime_format)
+                datetime_column = column
+                if not is_datetime64_any_dtype(column.dtype):
+                    datetime_column = self._to_datetime(column)
+
+                column = self._strftime(datetime_column)
             except ValueError:
-                column = pd.to_datetime(column).dt.strftime(self.datetime_format)
+                column = self._strftime(pd.to_datetime(column))
 
         return column.astype(self._dtype)
@@ -2,13 +2,80 @@
 
 import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 
-from sdv._utils import _load_data_from_csv
+from sdv._utils import _get_num_workers, _load_data_from_csv, _validate_n_jobs
 
+NON_TEXT_SDTYPES = frozenset(['numerical', 'datetime', 'boolean', 'categorical', 'id'])
 
-def load_csvs(folder_name, read_csv_parameters=None):
+
+def _get_read_csv_parameters(table_metadata, read_csv_parameters):
+    """Get the ``pandas.read_csv`` parameters for a table, including dtypes from its metadata.
+
+    The ``id`` columns with a ``regex_format`` and the columns with a text based sdtype, such
+    as PII columns, are read as strings, unless the ``pyarrow`` engine is used, which handles
+    missing values differently. The ``Float`` numerical columns are read as floats. The
+    ``categorical`` and other ``id`` columns can have any type, so their dtype is inferred.
+    The ``dtype`` given in ``read_csv_parameters`` takes precedence.
+
+    Returns:
+        tuple[dict, dict]:
+            The ``read_csv`` parameters and a dictionary mapping every datetime column to
+            its datetime format, which is parsed after reading the file.
+    """
+    if table_metadata is None:
+        return read_csv_parameters, {}
+
+    read_csv_parameters = dict(read_csv_parameters or {})
+
+    use_dtypes = read_csv_parameters.get('engine') != 'pyarrow'
+    dtypes = {}
+    datetime_formats = {}
+    for column, column_metadata in table_metadata.columns.items():
+        sdtype = column_metadata['sdtype']
+        if sdtype == 'datetime':
+            datetime_formats[column] = column_metadata.get('datetime_format')
+        elif sdtype == 'numerical':
+            if column_metadata.get('computer_representation') == 'Float':
+                dtypes[column] = 'float64'
+        elif use_dtypes:
+            is_regex_id = sdtype == 'id' and column_metadata.get('regex_format')
+            if is_regex_id or sdtype not in NON_TEXT_SDTYPES:
+                dtypes[column] = 'str'
+
+    user_dtypes = read_csv_parameters.get('dtype')
+    if isinstance(user_dtypes, dict):
+        read_csv_parameters['dtype'] = {**dtypes, **user_dtypes}
+    elif user_dtypes is None and dtypes:
+        read_csv_parameters['dtype'] = dtypes
+
+    if read_csv_parameters.get('parse_dates') is not None:
+        datetime_formats = {}
+
+    return read_csv_parameters, datetime_formats
+
+
+def _load_table(filepath, table_metadata, read_csv_parameters):
+    read_csv_parameters, datetime_formats = _get_read_csv_parameters(
+        table_metadata, read_csv_parameters)
+    data = _load_data_from_csv(filepath, read_csv_parameters)
+    for column, datetime_format in datetime_formats.items():
+        if column in data.columns:
+            datetime_format = datetime_format.replace('%-', '%') if datetime_format else None
+            try:
+                data[column] = pd.to_datetime(data[column], format=datetime_format)
+            except (ValueError, TypeError, OverflowError):
+                warnings.warn(
+                    f"Could not parse the datetime column '{column}' of '{filepath}'. The "
+                    'column is loaded without parsing it.'
+                )
+
+    return data
+
+
+def load_csvs(folder_name, read_csv_parameters=None, metadata=None, n_jobs=-1):
     """Load csv files from specified folder.
 
     Args:
@@ -16,22 +83,40 @@ def load_csvs(folder_name, read_csv_parameters=None):
             The full path of the folder with the data to be loaded.
         read_csv_parameters (dict):
             A python dictionary of with string and value accepted by ``pandas.read_csv``
-            function. Defaults to ``None``.
+            function. Use ``{'engine': 'pyarrow'}`` to parse the files with ``pyarrow``.
+            Defaults to ``None``.
+        metadata (MultiTableMetadata or None):
+            If given, the dtypes of the columns of every table in the metadata are taken from
+            their sdtypes instead of being inferred, and its datetime columns are parsed using
+            their ``datetime_format``. Defaults to ``None``.
+        n_jobs (int):
+            Number of threads used to read the files, or -1 to use all the available CPUs.
+            Defaults to -1.
     """
+    _validate_n_jobs(n_jobs)
     if not os.path.exists(folder_name):
         raise ValueError(f"The folder '{folder_name}' cannot be found.")
 
     dirpath, _, filenames = list(os.walk(folder_name))[0]
-    csvs = {}
+    csv_filepaths = {}
     other_files = []
     for filename in filenames:
         base_name, ext = os.path.splitext(filename)
         if ext == '.csv':
-            filepath = os.path.join(dirpath, filename)
-            csvs[base_name] = _load_data_from_csv(filepath, read_csv_parameters)
+            csv_filepaths[base_name] = os.path.join(dirpath, filename)
         else:
             other_files.append(filename)
 
+    tables_metadata = metadata.tables if metadata is not None else {}
+    num_workers = _get_num_workers(n_jobs, len(csv_filepaths))
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = {
+            base_name: executor.submit(
+                _load_table, filepath, tables_metadata.get(base_name), read_csv_parameters)
+            for base_name, filepath in csv_filepaths.items()
+        }
+        csvs = {base_name: future.result() for base_name, future in futures.items()}
+
     if other_files:
         warnings.warn(
             f"Ignoring incompatible files {other_files} in folder '{folder_name}'."
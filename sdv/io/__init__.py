@@ -1 +1,12 @@
 """I/O module."""
+
+from sdv.io.parquet import (
+    ParquetWriter, load_parquets, read_parquet, save_parquets, write_parquet)
+
+__all__ = [
+    'ParquetWriter',
+    'load_parquets',
+    'read_parquet',
+    'save_parquets',
+    'write_parquet',
+]
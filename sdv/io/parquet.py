@@ -0,0 +1,233 @@
+"""Methods to read and write data as Parquet files."""
+
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError(
+            "Reading and writing Parquet files requires 'pyarrow'. Please install it with "
+            "'pip install sdv[parquet]'."
+        ) from error
+
+    return pyarrow
+
+
+def _to_arrow_table(data, schema=None):
+    pyarrow = _import_pyarrow()
+    if not isinstance(data, pd.DataFrame):
+        raise ValueError("'data' must be a pandas DataFrame.")
+
+    return pyarrow.Table.from_pandas(data, schema=schema, preserve_index=False)
+
+
+def read_parquet(filepath, columns=None):
+    """Read a table from a Parquet file.
+
+    The dtypes of the columns are restored from the metadata stored in the file, so
+    nullable integers, booleans, categoricals and datetimes are read without inferring them.
+
+    Args:
+        filepath (str):
+            The path of the Parquet file.
+        columns (list or None):
+            The columns to read. If ``None``, all the columns are read. Defaults to ``None``.
+
+    Returns:
+        pandas.DataFrame:
+            The data of the table.
+    """
+    pyarrow = _import_pyarrow()
+    table = pyarrow.parquet.read_table(filepath, columns=columns)
+    return table.to_pandas()
+
+
+def write_parquet(data, filepath, row_group_size=None):
+    """Write a table to a Parquet file.
+
+    The dtypes of the columns are stored in the file, so ``read_parquet`` returns the
+    same dtypes. The index of the table is not written.
+
+    Args:
+        data (pandas.DataFrame):
+            The data of the table.
+        filepath (str):
+            The path of the Parquet file.
+        row_group_size (int or None):
+            Maximum number of rows of every row group. If ``None``, the ``pyarrow`` default
+            is used. Defaults to ``None``.
+    """
+    pyarrow = _import_pyarrow()
+    table = _to_arrow_table(data)
+    pyarrow.parquet.write_table(table, filepath, row_group_size=row_group_size)
+
+
+class ParquetWriter:
+    """Write a table to a Parquet file incrementally, one row group at a time.
+
+    This allows writing the output of a synthesizer batch by batch without keeping all of it
+    in memory. The schema of the file is fixed by the first data written, and the columns
+    that only have missing values in it are written as strings. The following data is
+    converted to that schema.
+
+    Args:
+        filepath (str):
+            The path of the Parquet file.
+        dtypes (dict or pandas.Series or None):
+            The dtypes of the columns, such as the ones learned by a synthesizer. The
+            numerical, boolean and datetime dtypes are used for the schema of the file
+            instead of the types of the first data written. Defaults to ``None``.
+    """
+
+    def __init__(self, filepath, dtypes=None):
+        self._pyarrow = _import_pyarrow()
+        self.filepath = filepath
+        self._types = {}
+        for column, dtype in dict(dtypes if dtypes is not None else {}).items():
+            if isinstance(dtype, np.dtype) and dtype.kind in 'biufM':
+                self._types[column] = self._pyarrow.from_numpy_dtype(dtype)
+
+        self._writer = None
+
+    def _get_schema(self, table):
+        schema = table.schema
+        for position, field in enumerate(schema):
+            if field.name in self._types:
+                schema = schema.set(position, field.with_type(self._types[field.name]))
+            elif self._pyarrow.types.is_null(field.type):
+                schema = schema.set(position, field.with_type(self._pyarrow.string()))
+
+        return schema
+
+    def _to_file_table(self, data):
+        schema = self._writer.schema
+        try:
+            return _to_arrow_table(data, schema=schema)
+        except (self._pyarrow.ArrowInvalid, self._pyarrow.ArrowTypeError):
+            # The columns without a dtype may have a different type than in the first data
+            return _to_arrow_table(data).select(schema.names).cast(schema)
+
+    def write(self, data):
+        """Append the data to the file as a new row group.
+
+        Args:
+            data (pandas.DataFrame):
+                The rows to write.
+        """
+        if self._writer is None:
+            table = _to_arrow_table(data)
+            schema = self._get_schema(table)
+            self._writer = self._pyarrow.parquet.ParquetWriter(self.filepath, schema)
+            self._writer.write_table(table.cast(schema))
+        else:
+            self._writer.write_table(self._to_file_table(data))
+
+    def close(self):
+        """Close the file."""
+        if self._writer is not None:
+            self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def load_parquets(folder_name, columns=None):
+    """Load the Parquet files from the specified folder.
+
+    Args:
+        folder_name (str):
+            The full path of the folder with the data to be loaded.
+        columns (dict or None):
+            A dictionary mapping table names to the list of columns to read from them.
+            The tables that are not in it are read entirely. Defaults to ``None``.
+
+    Returns:
+        dict:
+            A dictionary that maps each table name to the data for that table.
+    """
+    if not os.path.exists(folder_name):
+        raise ValueError(f"The folder '{folder_name}' cannot be found.")
+
+    columns = columns or {}
+    dirpath, _, filenames = list(os.walk(folder_name))[0]
+    tables = {}
+    other_files = []
+    for filename in filenames:
+        base_name, ext = os.path.splitext(filename)
+        if ext == '.parquet':
+            filepath = os.path.join(dirpath, filename)
+            tables[base_name] = read_parquet(filepath, columns.get(base_name))
+        else:
+            other_files.append(filename)
+
+    if other_files:
+        warnings.warn(
+            f"Ignoring incompatible files {other_files} in folder '{folder_name}'."
+        )
+
+    if not tables:
+        raise ValueError(
+            f"No Parquet files exist in '{folder_name}'. Please make sure your files end in "
+            "the '.parquet' suffix."
+        )
+
+    return tables
+
+
+def save_parquets(data, folder_name, suffix=None):
+    """Save dataframes to Parquet files in the specified folder.
+
+    Args:
+        data (dict):
+            A dictionary that maps each table name (string) to the data for that
+            table (pandas.DataFrame).
+        folder_name (str):
+            The full path of the folder where the data will be saved.
+        suffix (str):
+            A string to be appended to the name of the file. Defaults to ``None``.
+    """
+    error_message_data = "'data' must be a dictionary that maps table names to pandas DataFrames."
+    if not isinstance(data, dict):
+        raise ValueError(error_message_data)
+
+    for table in data.values():
+        if not isinstance(table, pd.DataFrame):
+            raise ValueError(error_message_data)
+
+    _import_pyarrow()
+    if not os.path.exists(folder_name):
+        os.makedirs(folder_name)
+
+    table_name_to_filepath = {}
+    errors = []
+    for table_name in data:
+        filename = f'{table_name}{suffix}.parquet' if suffix else f'{table_name}.parquet'
+        filepath = os.path.join(folder_name, filename)
+        if os.path.exists(filepath):
+            errors.append(filename)
+
+        table_name_to_filepath[table_name] = filepath
+
+    if errors:
+        end_message = 'Please remove them or specify a different suffix.'
+        filename_to_print = '\n'.join(errors[:3])
+        if len(errors) > 3:
+            end_message = ''.join([f'+ {len(errors) - 3} more files.', end_message])
+
+        raise FileExistsError(
+            f"The following files already exist in '{folder_name}':\n{filename_to_print}"
+            f'\n{end_message}'
+        )
+
+    for table_name, filepath in table_name_to_filepath.items():
+        write_parquet(data[table_name], filepath)
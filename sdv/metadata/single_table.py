@@ -5,26 +5,34 @@ import logging
 import re
 import warnings
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 from rdt.transformers._validators import AddressValidator, GPSValidator
 from rdt.transformers.pii.anonymization import SDTYPE_ANONYMIZERS, is_faker_function
 
 from sdv._utils import (
-    _cast_to_iterable, _format_invalid_values_string, _get_datetime_format, _is_boolean_type,
-    _is_datetime_type, _is_numerical_type, _load_data_from_csv, _validate_datetime_format)
+    _cast_to_iterable, _format_invalid_values_string, _get_datetime_format, _get_num_workers,
+    _is_boolean_type, _is_datetime_type, _is_numerical_type, _load_data_from_csv,
+    _validate_datetime_format, _validate_n_jobs)
 from sdv.errors import InvalidDataError
 from sdv.logging import get_sdv_logger
 from sdv.metadata.errors import InvalidMetadataError
 from sdv.metadata.metadata_upgrader import convert_metadata
-from sdv.metadata.utils import read_json, validate_file_does_not_exist
+from sdv.metadata.utils import (
+    HYPERLOGLOG_PRECISION, estimate_nunique, read_json, validate_file_does_not_exist)
 from sdv.metadata.visualization import (
     create_columns_node, create_summarized_columns_node, visualize_graph)
 
 LOGGER = logging.getLogger(__name__)
 SINGLETABLEMETADATA_LOGGER = get_sdv_logger('SingleTableMetadata')
+DETECTION_RANDOM_STATE = 0
+# Columns whose estimated number of distinct values is within this relative distance of the
+# number of rows may be unique, so their distinct values are counted exactly.
+UNIQUE_TOLERANCE = 5 * 1.04 / np.sqrt(2 ** HYPERLOGLOG_PRECISION)
 
 
 class SingleTableMetadata:
@@ -457,15 +465,22 @@ class SingleTableMetadata:
             if reference in tokens
         ), None)
 
-    def _determine_sdtype_for_numbers(self, data):
+    def _determine_sdtype_for_numbers(self, data, num_unique=None, num_rows=None):
         """Determine the sdtype for a numerical column.
 
         Args:
             data (pandas.Series):
                 The data to be analyzed.
+            num_unique (int or None):
+                The number of distinct values of the column. If ``None``, it is computed from
+                ``data``. Defaults to ``None``.
+            num_rows (int or None):
+                The number of rows of the column. If ``None``, it is the length of ``data``.
+                Defaults to ``None``.
         """
         sdtype = 'numerical'
-        if len(data) > 5:
+        num_rows = len(data) if num_rows is None else num_rows
+        if num_rows > 5:
             is_not_null = ~data.isna()
             clean_data = (data == data.round()).loc[is_not_null]
             if clean_data.empty:
@@ -474,30 +489,37 @@ class SingleTableMetadata:
             whole_values = clean_data.all()
             positive_values = (data >= 0).loc[is_not_null].all()
 
-            unique_values = data.nunique()
-            unique_lt_categorical_threshold = unique_values <= min(round(len(data) / 10), 10)
+            unique_values = data.nunique() if num_unique is None else num_unique
+            unique_lt_categorical_threshold = unique_values <= min(round(num_rows / 10), 10)
 
             if whole_values and positive_values and unique_lt_categorical_threshold:
                 sdtype = 'categorical'
-            elif unique_values == len(data) and whole_values:
+            elif unique_values == num_rows and whole_values:
                 sdtype = 'id'
 
         return sdtype
 
-    def _determine_sdtype_for_objects(self, data):
+    def _determine_sdtype_for_objects(self, data, num_unique=None, num_rows=None):
         """Determine the sdtype for an object column.
 
         Args:
             data (pandas.Series):
                 The data to be analyzed.
+            num_unique (int or None):
+                The number of distinct values of the column. If ``None``, it is computed from
+                ``data``. Defaults to ``None``.
+            num_rows (int or None):
+                The number of rows of the column. If ``None``, it is the length of ``data``.
+                Defaults to ``None``.
         """
-        if len(data) <= 5:
+        num_rows = len(data) if num_rows is None else num_rows
+        if num_rows <= 5:
             sdtype = 'categorical'
         else:
-            unique_values = data.nunique()
-            if unique_values == len(data):
+            unique_values = data.nunique() if num_unique is None else num_unique
+            if unique_values == num_rows:
                 sdtype = 'id'
-            elif unique_values <= round(len(data) / 5):
+            elif unique_values <= round(num_rows / 5):
                 sdtype = 'categorical'
             else:
                 sdtype = 'unknown'
@@ -517,43 +539,148 @@ class SingleTableMetadata:
 
         return sdtype
 
-    def _detect_columns(self, data):
+    @staticmethod
+    def _count_unique(column_data, sample_data, dtype, has_nan):
+        """Count the distinct values of a column from a sample of it.
+
+        The full column is only scanned, with ``estimate_nunique``, when the sample is not
+        enough to tell which side of the categorical thresholds the count falls on:
+
+            * If all the sampled values are different and the column has no missing values,
+              it is counted as unique, so it is detected as a candidate id. Its uniqueness is
+              checked exactly afterwards, only if it can change the detected metadata.
+            * Numerical columns with more than 10 sampled values cannot be categorical.
+            * If every sampled value appears at least twice, the values missing from the
+              sample are estimated to be negligible (Good-Turing), so the sample count is used.
+
+        Args:
+            column_data (pandas.Series):
+                The data of the column.
+            sample_data (pandas.Series):
+                A sample of the rows of the column.
+            dtype (str):
+                The dtype kind of the column.
+            has_nan (bool):
+                Whether the column has missing values.
+
+        Returns:
+            int:
+                The number of distinct values of the column.
+        """
+        num_rows = len(column_data)
+        sample_counts = sample_data.value_counts()
+        if not has_nan and len(sample_counts) == len(sample_data):
+            return num_rows
+
+        if (dtype in ['i', 'f'] and len(sample_counts) > 10) or (sample_counts > 1).all():
+            return len(sample_counts)
+
+        num_unique = estimate_nunique(column_data)
+        if num_unique >= (1 - UNIQUE_TOLERANCE) * num_rows:
+            return num_rows - 1 if has_nan else num_rows
+
+        return round(num_unique)
+
+    def _detect_column(self, field, column_data, sample_data=None):
+        """Detect the sdtype of a single column.
+
+        Args:
+            field (str):
+                The name of the column.
+            column_data (pandas.Series):
+                The data of the column.
+            sample_data (pandas.Series or None):
+                A sample of the rows of the column. If given, the dtype and the values are
+                analyzed on it, and the number of distinct values of the column is estimated
+                with ``estimate_nunique``. Defaults to ``None``.
+
+        Returns:
+            tuple[str, str, bool]:
+                The sdtype, the dtype kind and whether the column has missing values.
+        """
+        has_nan = column_data.isna().any()
+        analyzed_data = column_data if sample_data is None else sample_data
+        clean_data = analyzed_data.dropna()
+        dtype = clean_data.infer_objects().dtype.kind
+
+        sdtype = self._detect_pii_column(field)
+        if sdtype is None:
+            if dtype in self._DTYPES_TO_SDTYPES:
+                return self._DTYPES_TO_SDTYPES[dtype], dtype, has_nan
+
+            num_unique = num_rows = None
+            if sample_data is not None and dtype in ['i', 'f', 'O']:
+                num_unique = self._count_unique(column_data, sample_data, dtype, has_nan)
+                num_rows = len(column_data)
+
+            if dtype in ['i', 'f']:
+                sdtype = self._determine_sdtype_for_numbers(analyzed_data, num_unique, num_rows)
+
+            elif dtype == 'O':
+                sdtype = self._determine_sdtype_for_objects(analyzed_data, num_unique, num_rows)
+
+            if sdtype is None:
+                raise InvalidMetadataError(
+                    f"Unsupported data type for column '{field}' (kind: {dtype})."
+                    "The valid data types are: 'object', 'int', 'float', 'datetime', 'bool'."
+                )
+
+        return sdtype, dtype, has_nan
+
+    def _detect_columns(self, data, sample_size=None, n_jobs=1):
         """Detect the columns' sdtype and the primary key from the data.
 
         Args:
             data (pandas.DataFrame):
                 The data to be analyzed.
+            sample_size (int or None):
+                Maximum number of rows analyzed to detect the sdtypes. If the data has more
+                rows, a random sample of them is analyzed and the number of distinct values of
+                every column is estimated, so only the candidate primary keys are checked
+                against all the rows. If ``None``, all the rows are analyzed.
+                Defaults to ``None``.
+            n_jobs (int):
+                Number of threads used to detect the sdtypes of the columns. If ``-1``, use all
+                the available CPUs. Defaults to ``1``.
         """
+        sample = None
+        if sample_size is not None and len(data) > sample_size:
+            random_state = np.random.default_rng(DETECTION_RANDOM_STATE)
+            positions = np.sort(random_state.choice(len(data), sample_size, replace=False))
+            sample = data.iloc[positions]
+
+        def detect_column(field):
+            sample_data = None if sample is None else sample[field]
+            return self._detect_column(field, data[field], sample_data)
+
+        num_workers = _get_num_workers(n_jobs, len(data.columns))
+        if num_workers == 1:
+            detected = [detect_column(field) for field in data.columns]
+        else:
+            # Threads share the data of the columns instead of copying it to worker processes.
+            # ``warnings.catch_warnings`` is not thread safe, so the filters are restored here.
+            with warnings.catch_warnings(), ThreadPoolExecutor(num_workers) as executor:
+                warnings.simplefilter('ignore', category=UserWarning)
+                detected = list(executor.map(detect_column, data.columns))
+
         first_pii_field = None
-        for field in data:
+        for field, (sdtype, dtype, has_nan) in zip(data.columns, detected):
             column_data = data[field]
-            has_nan = column_data.isna().any()
-            valid_potential_primary_key = column_data.is_unique and not has_nan
-            clean_data = column_data.dropna()
-            dtype = clean_data.infer_objects().dtype.kind
-
-            sdtype = self._detect_pii_column(field)
-            if sdtype is None:
-                if dtype in self._DTYPES_TO_SDTYPES:
-                    sdtype = self._DTYPES_TO_SDTYPES[dtype]
-                elif dtype in ['i', 'f']:
-                    sdtype = self._determine_sdtype_for_numbers(column_data)
-
-                elif dtype == 'O':
-                    sdtype = self._determine_sdtype_for_objects(column_data)
-
-                if sdtype is None:
-                    raise InvalidMetadataError(
-                        f"Unsupported data type for column '{field}' (kind: {dtype})."
-                        "The valid data types are: 'object', 'int', 'float', 'datetime', 'bool'."
-                    )
-
-                # Set the first ID column we detect to be the primary key
-                if sdtype == 'id':
-                    if self.primary_key is None and valid_potential_primary_key:
-                        self.primary_key = field
-                    else:
-                        sdtype = 'unknown'
+            valid_potential_primary_key = None
+            if sdtype == 'id':
+                # The uniqueness of the ids detected from a sample is confirmed here. It only
+                # matters if the column can be the primary key or it is numerical, since the
+                # ids that are not the primary key and non unique objects are both unknown.
+                if self.primary_key is None or dtype in ['i', 'f']:
+                    valid_potential_primary_key = column_data.is_unique and not has_nan
+
+                if valid_potential_primary_key is False and dtype in ['i', 'f']:
+                    sdtype = 'numerical'
+                elif self.primary_key is None and valid_potential_primary_key:
+                    # Set the first ID column we detect to be the primary key
+                    self.primary_key = field
+                else:
+                    sdtype = 'unknown'
 
             column_dict = {'sdtype': sdtype}
             sdtype_in_reference = sdtype in self._REFERENCE_TO_SDTYPE.values()
@@ -569,12 +696,16 @@ class SingleTableMetadata:
             self.columns[field] = deepcopy(column_dict)
 
         # When no primary key column was set, choose the first pii field
-        if self.primary_key is None and first_pii_field and valid_potential_primary_key:
-            self.primary_key = first_pii_field
+        if self.primary_key is None and first_pii_field:
+            if valid_potential_primary_key is None:
+                valid_potential_primary_key = column_data.is_unique and not has_nan
+
+            if valid_potential_primary_key:
+                self.primary_key = first_pii_field
 
         self._updated = True
 
-    def detect_from_dataframe(self, data):
+    def detect_from_dataframe(self, data, sample_size=None, n_jobs=1):
         """Detect the metadata from a ``pd.DataFrame`` object.
 
         This method automatically detects the ``sdtypes`` for the given ``pandas.DataFrame``.
@@ -582,6 +713,15 @@ class SingleTableMetadata:
         Args:
             data (pandas.DataFrame):
                 ``pandas.DataFrame`` to detect the metadata from.
+            sample_size (int or None):
+                Maximum number of rows analyzed to detect the ``sdtypes``. If the data has more
+                rows, the ``sdtypes`` are detected from a random sample of them and an estimate
+                of the number of distinct values of every column, which makes the detection
+                faster on large data. The uniqueness of the primary key is always checked on
+                all the rows. If ``None``, all the rows are analyzed. Defaults to ``None``.
+            n_jobs (int):
+                Number of threads used to detect the ``sdtypes`` of the columns. If ``-1``,
+                use all the available CPUs. Defaults to ``1``.
         """
         if self.columns:
             raise InvalidMetadataError(
@@ -589,7 +729,16 @@ class SingleTableMetadata:
                 'object to detect from other data sources.'
             )
 
-        self._detect_columns(data)
+        _validate_n_jobs(n_jobs)
+        if sample_size is not None and (
+                isinstance(sample_size, bool) or not isinstance(sample_size, int) or
+                sample_size < 1):
+            raise ValueError(
+                f"Invalid value '{sample_size}' for parameter 'sample_size'. Please provide a "
+                'positive integer.'
+            )
+
+        self._detect_columns(data, sample_size, n_jobs)
 
         LOGGER.info('Detected metadata:')
         LOGGER.info(json.dumps(self.to_dict(), indent=4))
@@ -3,6 +3,11 @@
 import json
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
+HYPERLOGLOG_PRECISION = 14
+
 
 def read_json(filepath):
     """Validate and open a file path."""
@@ -25,3 +30,45 @@ def validate_file_does_not_exist(filepath):
             f"A file named '{filepath.name}' already exists in this folder. Please specify "
             'a different filename.'
         )
+
+
+def estimate_nunique(values, precision=HYPERLOGLOG_PRECISION, chunk_size=2 ** 20):
+    """Estimate the number of distinct non-null values with a HyperLogLog sketch.
+
+    The values are hashed ``chunk_size`` at a time into ``2 ** precision`` registers, so the
+    memory used does not depend on the number of values. The relative standard error of the
+    estimate is ``1.04 / sqrt(2 ** precision)``, about 0.8% with the default precision.
+
+    Args:
+        values (pandas.Series):
+            The values to count.
+        precision (int):
+            Number of bits of the hashes used to select the register. Defaults to ``14``.
+        chunk_size (int):
+            Number of values hashed at a time. Defaults to ``2 ** 20``.
+
+    Returns:
+        float:
+            The estimated number of distinct values.
+    """
+    num_registers = 1 << precision
+    num_bits = 64 - precision
+    registers = np.zeros(num_registers, dtype=np.uint8)
+    for start in range(0, len(values), chunk_size):
+        chunk = values.iloc[start:start + chunk_size]
+        chunk = chunk[chunk.notna()]
+        hashes = pd.util.hash_pandas_object(chunk, index=False, categorize=False).to_numpy()
+        positions = (hashes >> np.uint64(num_bits)).astype(np.intp)
+        remainders = hashes & np.uint64((1 << num_bits) - 1)
+        # The rank is the position of the leftmost 1 bit of the remainder
+        _, bit_lengths = np.frexp(remainders.astype(np.float64))
+        ranks = (num_bits + 1 - bit_lengths).astype(np.uint8)
+        np.maximum.at(registers, positions, ranks)
+
+    alpha = 0.7213 / (1 + 1.079 / num_registers)
+    estimate = alpha * num_registers ** 2 / np.exp2(-registers.astype(np.float64)).sum()
+    num_empty_registers = np.count_nonzero(registers == 0)
+    if estimate <= 2.5 * num_registers and num_empty_registers:
+        estimate = num_registers * np.log(num_registers / num_empty_registers)
+
+    return float(estimate)
@@ -0,0 +1,525 @@
+"""Batched ``GaussianCopula`` utilities for multi table synthesizers."""
+import inspect
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from copulas.univariate import (
+    BetaUnivariate, GammaUnivariate, GaussianUnivariate, TruncatedGaussian, UniformUnivariate)
+from scipy import stats
+
+# Same as ``copulas.EPSILON``, which is not importable from the same module in all versions.
+EPSILON = np.finfo(np.float32).eps
+
+FITTED = 0
+CONSTANT = 1
+FALLBACK = 2
+
+# Order in which every univariate stores its parameters, which is the order in which they are
+# flattened. It depends on whether the univariate was fitted to a constant column or not.
+PARAMETER_ORDER = {
+    GaussianUnivariate: {FITTED: ('loc', 'scale'), CONSTANT: ('loc', 'scale')},
+    UniformUnivariate: {FITTED: ('loc', 'scale'), CONSTANT: ('loc', 'scale')},
+    BetaUnivariate: {FITTED: ('loc', 'scale', 'a', 'b'), CONSTANT: ('a', 'b', 'loc', 'scale')},
+    TruncatedGaussian: {FITTED: ('a', 'b', 'loc', 'scale'), CONSTANT: ('a', 'b', 'loc', 'scale')},
+    GammaUnivariate: {FITTED: ('a', 'loc', 'scale'), CONSTANT: ('a', 'loc', 'scale')},
+}
+FALLBACK_PARAMETER_ORDER = ('loc', 'scale')
+SUPPORTED_DISTRIBUTIONS = tuple(PARAMETER_ORDER)
+SAMPLE_CHUNK_SIZE = 2 ** 22
+
+
+class GroupedData:
+    """Rows of a table sorted so that the rows of every group are contiguous.
+
+    Args:
+        groups (pandas.Series or numpy.ndarray):
+            The group value of every row.
+    """
+
+    def __init__(self, groups):
+        codes, self.group_values = pd.factorize(groups, sort=False)
+        self.order = np.argsort(codes, kind='stable')
+        self.counts = np.bincount(codes, minlength=len(self.group_values))
+        self.starts = np.concatenate([[0], np.cumsum(self.counts)[:-1]])
+        self.codes = codes[self.order]
+
+    def __len__(self):
+        return len(self.group_values)
+
+    def sort(self, values):
+        """Sort the values of a column so that every group is contiguous."""
+        return np.asarray(values)[self.order]
+
+    def sum(self, values):
+        """Sum the sorted values of every group."""
+        return np.add.reduceat(values, self.starts)
+
+    def mean(self, values):
+        """Compute the mean of the sorted values of every group."""
+        counts = self.counts.reshape((-1,) + (1,) * (np.ndim(values) - 1))
+        return self.sum(values) / counts
+
+    def split(self, values):
+        """Split the sorted values in one array per group."""
+        return np.split(values, self.starts[1:])
+
+
+def _fit_univariates(univariate_class, groups):
+    """Fit a univariate to every group of values.
+
+    Args:
+        univariate_class (type):
+            The ``copulas.univariate`` class to fit.
+        groups (list[numpy.ndarray]):
+            The values of every group.
+
+    Returns:
+        list:
+            The learned parameters of every group, or ``None`` if the fit failed.
+    """
+    parameters = []
+    for values in groups:
+        univariate = univariate_class()
+        try:
+            # Fit a ``pandas.Series`` since some univariates compute ``X.std()`` from it
+            univariate.fit(pd.Series(values))
+            parameters.append(univariate._params)
+        except Exception:
+            parameters.append(None)
+
+    return parameters
+
+
+def _fit_iterative_univariates(univariate_class, groups, num_workers=1):
+    if num_workers == 1 or len(groups) < 2:
+        return _fit_univariates(univariate_class, groups)
+
+    chunks = np.array_split(np.arange(len(groups)), min(num_workers, len(groups)))
+    parameters = []
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = [
+            executor.submit(_fit_univariates, univariate_class, [groups[i] for i in chunk])
+            for chunk in chunks
+        ]
+        for future in futures:
+            parameters.extend(future.result())
+
+    return parameters
+
+
+def _fit_column(values, grouped, univariate_class, num_workers=1):
+    """Fit the univariate of a single column for every group.
+
+    The constant groups and the closed form distributions (``norm`` and ``uniform``) are
+    computed with ``numpy`` for all the groups at once. Distributions that require an
+    iterative fit are fitted group by group, falling back to a ``norm`` distribution when
+    the fit fails, as ``copulas.multivariate.GaussianMultivariate`` does.
+
+    Args:
+        values (numpy.ndarray):
+            The values of the column, sorted by group.
+        grouped (GroupedData):
+            The grouping of the rows.
+        univariate_class (type):
+            The ``copulas.univariate`` class to fit.
+        num_workers (int):
+            Number of processes to use for the iterative fits.
+
+    Returns:
+        tuple[numpy.ndarray, dict]:
+            The state (``FITTED``, ``CONSTANT`` or ``FALLBACK``) of every group and a dictionary
+            mapping every parameter name to its values per group.
+    """
+    minimum = np.minimum.reduceat(values, grouped.starts)
+    maximum = np.maximum.reduceat(values, grouped.starts)
+    constant = minimum == maximum
+    states = np.where(constant, CONSTANT, FITTED)
+    num_groups = len(grouped)
+    names = set(PARAMETER_ORDER[univariate_class][FITTED]) | {'loc', 'scale'}
+    parameters = {name: np.full(num_groups, np.nan) for name in names}
+
+    if univariate_class is GaussianUnivariate:
+        mean = grouped.mean(values)
+        parameters['loc'] = mean
+        parameters['scale'] = np.sqrt(grouped.mean((values - mean[grouped.codes]) ** 2))
+
+    elif univariate_class is UniformUnivariate:
+        parameters['loc'] = minimum
+        parameters['scale'] = maximum - minimum
+
+    else:
+        fitted = np.flatnonzero(~constant)
+        groups = grouped.split(values)
+        fitted_parameters = _fit_iterative_univariates(
+            univariate_class, [groups[index] for index in fitted], num_workers)
+        for index, group_parameters in zip(fitted, fitted_parameters):
+            if group_parameters is None:
+                states[index] = FALLBACK
+                group_parameters = {'loc': np.mean(groups[index]), 'scale': np.std(groups[index])}
+
+            for name, value in group_parameters.items():
+                parameters[name][index] = value
+
+    parameters['loc'][constant] = minimum[constant]
+    parameters['scale'][constant] = 0.0
+    if univariate_class in (BetaUnivariate, TruncatedGaussian):
+        constant_a = 1.0 if univariate_class is BetaUnivariate else minimum[constant]
+        constant_b = 1.0 if univariate_class is BetaUnivariate else minimum[constant]
+        parameters['a'][constant] = constant_a
+        parameters['b'][constant] = constant_b
+    elif univariate_class is GammaUnivariate:
+        parameters['a'][constant] = 0.0
+
+    return states, parameters
+
+
+def _get_cdf(values, grouped, univariate_class, states, parameters):
+    """Compute the cumulative distribution of every value using the parameters of its group."""
+    cdf = np.ones(len(values))
+    distributions = (
+        (FITTED, univariate_class.MODEL_CLASS, PARAMETER_ORDER[univariate_class][FITTED]),
+        (FALLBACK, stats.norm, FALLBACK_PARAMETER_ORDER)
+    )
+    row_states = states[grouped.codes]
+    for state, model_class, names in distributions:
+        is_state = row_states == state
+        if is_state.any():
+            codes = grouped.codes[is_state]
+            kwargs = {name: parameters[name][codes] for name in names}
+            cdf[is_state] = model_class.cdf(values[is_state], **kwargs)
+
+    return cdf
+
+
+def _get_correlations(normal, grouped):
+    """Compute the lower triangle of the pearson correlation matrix of every group.
+
+    Args:
+        normal (numpy.ndarray):
+            Array of shape ``(num_rows, num_columns)`` with the data transformed to the standard
+            normal space, sorted by group.
+        grouped (GroupedData):
+            The grouping of the rows.
+
+    Returns:
+        dict:
+            Dictionary mapping the flattened name of every correlation to its values per group.
+    """
+    deviations = normal - grouped.mean(normal)[grouped.codes]
+    squares = grouped.sum(deviations ** 2)
+    correlations = {}
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for row in range(1, normal.shape[1]):
+            for column in range(row):
+                covariance = grouped.sum(deviations[:, row] * deviations[:, column])
+                correlation = covariance / np.sqrt(squares[:, row] * squares[:, column])
+                correlations[f'correlation__{row - 1}__{column}'] = np.nan_to_num(
+                    correlation, nan=0.0)
+
+    return correlations
+
+
+def get_grouped_copula_parameters(data, groups, distributions, num_workers=1):
+    """Compute the flattened ``GaussianCopula`` parameters of every group of rows.
+
+    The output matches flattening the parameters of a ``GaussianCopulaSynthesizer`` fitted
+    to the rows of every group, but it avoids creating a synthesizer per group.
+
+    Args:
+        data (pandas.DataFrame):
+            The numerical data to model.
+        groups (pandas.Series or numpy.ndarray):
+            The group value of every row.
+        distributions (dict):
+            Dictionary mapping every column to the ``copulas.univariate`` class to use for it.
+        num_workers (int):
+            Number of processes to use for the distributions that require an iterative fit.
+            Defaults to 1.
+
+    Returns:
+        pandas.DataFrame:
+            A DataFrame indexed by the group values, in order of appearance, with one column per
+            flattened parameter.
+    """
+    grouped = GroupedData(groups)
+    columns = list(data.columns)
+    if not columns:
+        return pd.DataFrame({'num_rows': grouped.counts}, index=grouped.group_values)
+
+    states = {}
+    parameters = {}
+    normal = np.empty((len(data), len(columns)))
+    for position, column in enumerate(columns):
+        values = grouped.sort(data[column].to_numpy(dtype=float))
+        univariate_class = distributions[column]
+        states[column], parameters[column] = _fit_column(
+            values, grouped, univariate_class, num_workers)
+        cdf = _get_cdf(values, grouped, univariate_class, states[column], parameters[column])
+        normal[:, position] = stats.norm.ppf(cdf.clip(EPSILON, 1 - EPSILON))
+
+    flattened = _get_correlations(normal, grouped)
+    state_matrix = np.column_stack([states[column] for column in columns])
+    has_parameter = {}
+    for column in columns:
+        order = PARAMETER_ORDER[distributions[column]]
+        for name, values in parameters[column].items():
+            key = f'univariates__{column}__{name}'
+            flattened[key] = values
+            has_parameter[key] = np.isin(
+                states[column],
+                [state for state, names in order.items() if name in names] + (
+                    [FALLBACK] if name in FALLBACK_PARAMETER_ORDER else []
+                )
+            )
+
+    # Every group lists its parameters in the order of its univariates, and the rows are combined
+    # in order of appearance, so the column order is built from the first group of every layout.
+    _, first_groups = np.unique(state_matrix, axis=0, return_index=True)
+    keys = {key: None for key in flattened if key.startswith('correlation__')}
+    for group in sorted(first_groups):
+        for column, state in zip(columns, state_matrix[group]):
+            order = PARAMETER_ORDER[distributions[column]].get(state, FALLBACK_PARAMETER_ORDER)
+            keys.update({f'univariates__{column}__{name}': None for name in order})
+
+    keys['num_rows'] = None
+    flattened['num_rows'] = grouped.counts
+    for key, mask in has_parameter.items():
+        flattened[key] = np.where(mask, flattened[key], np.nan)
+
+    return pd.DataFrame(
+        {key: flattened[key] for key in keys},
+        index=grouped.group_values
+    ).astype(float)
+
+
+class StackedGaussianCopulas:
+    """Many ``GaussianCopula`` models with the same columns, stacked into arrays.
+
+    Every model is rebuilt from its flattened parameters in the same way that
+    ``GaussianCopulaSynthesizer._set_parameters`` does it, but the univariates and the
+    correlation matrices of all the models are kept in arrays so that the densities of many
+    rows under all the models can be computed at once, and rows can be sampled from all the
+    models at once.
+
+    Args:
+        parameters (pandas.DataFrame):
+            A DataFrame with one row per model and one column per flattened parameter.
+        distributions (dict):
+            Dictionary mapping every column to the ``copulas.univariate`` class to use for it.
+        default_parameters (dict or None):
+            Flattened univariate parameters to use for the models whose parameters are
+            rejected by the scipy distribution. If ``None``, the parameters are used as they are.
+    """
+
+    def __init__(self, parameters, distributions, default_parameters=None):
+        self.columns = list(distributions)
+        self.distributions = distributions
+        self.num_models = len(parameters)
+        self.univariates = {}
+        for column, univariate_class in distributions.items():
+            names = PARAMETER_ORDER[univariate_class][FITTED]
+            column_parameters = {}
+            for name in names:
+                key = f'univariates__{column}__{name}'
+                values = parameters[key] if key in parameters else np.nan
+                column_parameters[name] = np.broadcast_to(
+                    np.asarray(values, dtype=float), (self.num_models,)).copy()
+
+            if default_parameters is not None:
+                self._replace_invalid_parameters(
+                    column, univariate_class, column_parameters, default_parameters)
+
+            column_parameters['scale'] = np.maximum(column_parameters['scale'], 0)
+            if univariate_class is TruncatedGaussian:
+                constant = column_parameters['a'] == column_parameters['b']
+            else:
+                constant = column_parameters['scale'] == 0
+
+            self.univariates[column] = (column_parameters, constant)
+
+        self.correlations = self._get_correlations(parameters)
+        self._decompose(self.correlations.copy())
+
+    @staticmethod
+    def _replace_invalid_parameters(column, univariate_class, column_parameters,
+                                    default_parameters):
+        """Replace the parameters that the scipy model rejects with the default ones."""
+        prefix = f'univariates__{column}__'
+        if not any(key.startswith(prefix) for key in default_parameters):
+            return
+
+        model = univariate_class.MODEL_CLASS
+        if not hasattr(model, '_argcheck'):
+            return
+
+        to_check = {
+            name: column_parameters[name]
+            for name in inspect.signature(model._argcheck).parameters.keys()
+            if name in column_parameters
+        }
+        with np.errstate(invalid='ignore'):
+            is_valid = np.asarray(model._argcheck(**to_check), dtype=bool)
+
+        for name, values in column_parameters.items():
+            is_invalid = ~np.broadcast_to(is_valid, values.shape)
+            values[is_invalid] = default_parameters.get(f'{prefix}{name}', np.nan)
+
+    def _get_correlations(self, parameters):
+        """Rebuild the correlation matrix of every model."""
+        # Imported here to avoid a circular import
+        from sdv.single_table.copulas import GaussianCopulaSynthesizer
+
+        size = len(self.columns)
+        correlations = np.tile(np.identity(size), (self.num_models, 1, 1))
+        self.is_valid = np.ones(self.num_models, dtype=bool)
+        if size == 1:
+            return correlations
+
+        keys = [
+            [f'correlation__{row}__{column}' for column in range(row + 1)]
+            for row in range(size - 1)
+        ]
+        if not all(key in parameters for row in keys for key in row):
+            self.is_valid[:] = False
+            return correlations
+
+        triangles = [parameters[row].to_numpy(dtype=float) for row in keys]
+        for model in range(self.num_models):
+            triangle = [row[model].tolist() for row in triangles]
+            try:
+                correlations[model] = GaussianCopulaSynthesizer._rebuild_correlation_matrix(
+                    triangle)
+            except (np.linalg.LinAlgError, ValueError):
+                self.is_valid[model] = False
+
+        self.is_valid &= np.isfinite(correlations).all(axis=(1, 2))
+        return correlations
+
+    def _decompose(self, correlations):
+        """Compute the pseudo inverse and pseudo determinant of every correlation matrix.
+
+        This follows ``scipy.stats.multivariate_normal`` with ``allow_singular=True``, so
+        negligible eigenvalues are ignored and rows outside of the support get a zero density.
+        """
+        correlations[~self.is_valid] = np.identity(len(self.columns))
+        eigenvalues, eigenvectors = np.linalg.eigh(correlations)
+        eps = 1e6 * np.finfo(float).eps * np.abs(eigenvalues).max(axis=1)
+        self._has_density = self.is_valid & (eigenvalues.min(axis=1) >= -eps)
+        positive = eigenvalues > eps[:, None]
+        with np.errstate(divide='ignore'):
+            pseudo_inverse = np.where(positive, 1 / eigenvalues, 0)
+            log_eigenvalues = np.where(positive, np.log(eigenvalues), 0)
+
+        self.whitening = eigenvectors * np.sqrt(pseudo_inverse)[:, None, :]
+        self.null_space = eigenvectors * ~positive[:, None, :]
+        self.rank = positive.sum(axis=1)
+        self.log_pseudo_determinant = log_eigenvalues.sum(axis=1)
+        self.support_eps = 1e3 * eps
+
+    def _transform_to_normal(self, data):
+        """Transform the rows to the standard normal space of every model.
+
+        Returns:
+            numpy.ndarray:
+                Array of shape ``(num_rows, num_models, num_columns)``.
+        """
+        normal = np.empty((len(data), self.num_models, len(self.columns)))
+        for position, column in enumerate(self.columns):
+            values = data[column].to_numpy(dtype=float)[:, None]
+            parameters, constant = self.univariates[column]
+            model_class = self.distributions[column].MODEL_CLASS
+            with np.errstate(all='ignore'):
+                cdf = model_class.cdf(values, **{
+                    name: values_per_model[None, :]
+                    for name, values_per_model in parameters.items()
+                })
+
+            constant_cdf = 1 - (values < parameters['loc'][None, :])
+            cdf = np.where(constant[None, :], constant_cdf, cdf)
+            normal[:, :, position] = stats.norm.ppf(cdf.clip(EPSILON, 1 - EPSILON))
+
+        return normal
+
+    def log_probability_density(self, data):
+        """Compute the log probability density of every row under every model.
+
+        Args:
+            data (pandas.DataFrame):
+                The rows to evaluate. Must contain all the model columns.
+
+        Returns:
+            numpy.ndarray:
+                Array of shape ``(num_rows, num_models)``. Models that could not be rebuilt
+                have ``NaN`` values.
+        """
+        normal = self._transform_to_normal(data)
+        whitened = np.einsum('nmk,mkj->nmj', normal, self.whitening)
+        mahalanobis = np.square(whitened).sum(axis=-1)
+        log_density = -0.5 * (
+            self.rank * np.log(2 * np.pi) + self.log_pseudo_determinant + mahalanobis
+        )
+        is_singular = self.rank < len(self.columns)
+        if is_singular.any():
+            residual = np.linalg.norm(
+                np.einsum('nmk,mkj->nmj', normal, self.null_space), axis=-1)
+            # Like in scipy, rows with ``NaN`` values are outside of the support of singular models
+            out_of_support = is_singular[None, :] & ~(residual < self.support_eps[None, :])
+            log_density[out_of_support] = -np.inf
+
+        log_density[:, ~self._has_density] = np.nan
+        return log_density
+
+    def sample(self, num_rows, random_state, max_chunk_elements=SAMPLE_CHUNK_SIZE):
+        """Sample rows from every model.
+
+        The standard normal values are drawn once, for the largest number of rows, and every
+        model uses the first ones. This gives the same values as sampling every model
+        separately, starting from the same random state, with ``numpy.random.multivariate_normal``.
+
+        Args:
+            num_rows (numpy.ndarray):
+                The number of rows to sample from every model.
+            random_state (numpy.random.RandomState):
+                The random state used to draw the standard normal values.
+            max_chunk_elements (int):
+                Maximum number of elements of the arrays used to transform the values.
+
+        Returns:
+            pandas.DataFrame:
+                The sampled rows, with the rows of every model one after the other.
+        """
+        num_rows = np.asarray(num_rows, dtype=int)
+        size = len(self.columns)
+        models = np.repeat(np.arange(self.num_models), num_rows)
+        positions = np.arange(len(models)) - np.repeat(np.cumsum(num_rows) - num_rows, num_rows)
+        standard_normal = random_state.standard_normal((num_rows.max(initial=0), size))
+
+        _, singular_values, right_vectors = np.linalg.svd(self.correlations)
+        factors = np.sqrt(singular_values)[:, :, None] * right_vectors
+        normal = np.empty((len(models), size))
+        chunk_size = max(1, max_chunk_elements // (size * size))
+        for start in range(0, len(models), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            normal[chunk] = np.einsum(
+                'nk,nkj->nj', standard_normal[positions[chunk]], factors[models[chunk]])
+
+        sampled = {}
+        cdf = stats.norm.cdf(normal)
+        for position, column in enumerate(self.columns):
+            parameters, constant = self.univariates[column]
+            model_class = self.distributions[column].MODEL_CLASS
+            with np.errstate(all='ignore'):
+                values = model_class.ppf(cdf[:, position], **{
+                    name: values_per_model[models]
+                    for name, values_per_model in parameters.items()
+                })
+
+            sampled[column] = np.where(constant[models], parameters['loc'][models], values)
+
+        return pd.DataFrame(sampled, columns=self.columns)
+
+    def get_chunk_size(self, max_chunk_elements):
+        """Get how many rows can be evaluated at once without exceeding the given size."""
+        row_size = max(1, self.num_models * len(self.columns))
+        return max(1, max_chunk_elements // row_size)
@@ -1,6 +1,7 @@
 """Hierarchical Modeling Algorithms."""
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 
 import numpy as np
@@ -8,13 +9,84 @@ import pandas as pd
 from rdt.transformers import FloatFormatter
 from tqdm import tqdm
 
-from sdv._utils import _get_root_tables
+from sdv._utils import _get_num_workers, _get_root_tables, _validate_n_jobs
 from sdv.errors import SynthesizerInputError
+from sdv.logging import disable_single_table_logger
 from sdv.multi_table.base import BaseMultiTableSynthesizer
+from sdv.multi_table.copula_utils import (
+    SUPPORTED_DISTRIBUTIONS, StackedGaussianCopulas, get_grouped_copula_parameters)
 from sdv.sampling import BaseHierarchicalSampler
+from sdv.single_table.base import FIXED_RNG_SEED
+from sdv.single_table.copulas import GaussianCopulaSynthesizer
+from sdv.single_table.utils import unflatten_dict
 
 LOGGER = logging.getLogger(__name__)
 MAX_NUMBER_OF_COLUMNS = 1000
+CHUNKS_PER_JOB = 4
+
+
+def _get_extension_rows(synthesizer_class, table_meta, synthesizer_parameters,
+                        child_name, foreign_key, child_groups):
+    """Fit a synthesizer for every group of child rows and flatten its parameters.
+
+    This function is defined at the module level so it can be sent to worker processes.
+
+    Args:
+        synthesizer_class (type):
+            The single table synthesizer class to fit for every group.
+        table_meta (sdv.metadata.SingleTableMetadata):
+            Metadata of the child table.
+        synthesizer_parameters (dict):
+            Parameters used to instantiate the synthesizer.
+        child_name (str):
+            Name of the child table.
+        foreign_key (str):
+            Name of the foreign key field.
+        child_groups (list[tuple]):
+            List of ``(foreign_key_value, child_rows)`` tuples.
+
+    Returns:
+        tuple[list, list]:
+            The foreign key values and the extension rows (``pandas.Series``) computed for them.
+    """
+    extension_rows = []
+    index = []
+    scale_columns = None
+    for foreign_key_value, child_rows in child_groups:
+        try:
+            if child_rows.empty:
+                row = pd.Series({'num_rows': len(child_rows)})
+                row.index = f'__{child_name}__{foreign_key}__' + row.index
+            else:
+                synthesizer = synthesizer_class(table_meta, **synthesizer_parameters)
+                synthesizer.fit_processed_data(child_rows.reset_index(drop=True))
+                row = synthesizer._get_parameters()
+                row = pd.Series(row)
+                row.index = f'__{child_name}__{foreign_key}__' + row.index
+
+                if scale_columns is None:
+                    scale_columns = [
+                        column
+                        for column in row.index
+                        if column.endswith('scale')
+                    ]
+
+                if len(child_rows) == 1:
+                    row.loc[scale_columns] = None
+
+            extension_rows.append(row)
+            index.append(foreign_key_value)
+        except Exception:
+            # Skip children rows subsets that fail
+            pass
+
+    return index, extension_rows
+
+
+def _get_extension_rows_in_worker(*args):
+    """Run ``_get_extension_rows`` without logging the single table synthesizers."""
+    with disable_single_table_logger():
+        return _get_extension_rows(*args)
 
 
 class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
@@ -29,11 +101,18 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
             Defaults to ``['en_US']``.
         verbose (bool):
             Whether to print progress for fitting or not.
+        n_jobs (int):
+            Number of worker processes used to fit the child table models of every
+            relationship. If ``-1``, use all the available CPUs. Defaults to ``1``, which
+            fits them in the current process.
     """
 
     DEFAULT_SYNTHESIZER_KWARGS = {
         'default_distribution': 'beta'
     }
+    # Maximum number of elements of the arrays used to compute the likelihoods of the child
+    # rows under the models of all the parent rows. Bounds the memory used to find parent ids.
+    LIKELIHOOD_CHUNK_SIZE = 2 ** 22
     DISTRIBUTIONS_TO_NUM_PARAMETER_COLUMNS = {
         'beta': 4,
         'truncnorm': 4,
@@ -151,7 +230,8 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
 
         return columns_per_table
 
-    def __init__(self, metadata, locales=['en_US'], verbose=True):
+    def __init__(self, metadata, locales=['en_US'], verbose=True, n_jobs=1):
+        _validate_n_jobs(n_jobs)
         BaseMultiTableSynthesizer.__init__(self, metadata, locales=locales)
         self._table_sizes = {}
         self._max_child_rows = {}
@@ -160,6 +240,7 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
         self._learned_relationships = 0
         self._default_parameters = {}
         self.verbose = verbose
+        self.n_jobs = n_jobs
         BaseHierarchicalSampler.__init__(
             self,
             self.metadata,
@@ -273,6 +354,58 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
 
         return processed_data
 
+    def _get_num_workers(self, num_groups):
+        return _get_num_workers(getattr(self, 'n_jobs', 1), num_groups)
+
+    def _get_batched_distributions(self, data, foreign_key_values, table_meta,
+                                   synthesizer_parameters):
+        """Get the univariate of every column if the extension can be computed in batch.
+
+        The extension can be computed for all the foreign key values at once when the child
+        tables are modeled with a ``GaussianCopulaSynthesizer`` that only uses parametric
+        distributions, and the data is numerical without missing values.
+
+        Returns:
+            dict or None:
+                Dictionary mapping each column to its ``copulas.univariate`` class, or ``None``
+                if the extension has to be computed one foreign key value at a time.
+        """
+        if foreign_key_values.isna().any():
+            return None
+
+        if data.columns.empty:
+            return {}
+
+        values = data.to_numpy()
+        is_numerical = values.dtype.kind in 'fiu'
+        if not is_numerical or np.isnan(values).any():
+            return None
+
+        return self._get_parametric_distributions(table_meta, synthesizer_parameters, data.columns)
+
+    def _get_parametric_distributions(self, table_meta, synthesizer_parameters, columns):
+        """Get the univariate of every column if they are all parametric ``GaussianCopula`` ones.
+
+        Returns:
+            dict or None:
+                Dictionary mapping each column to its ``copulas.univariate`` class, or ``None``
+                if the tables are not modeled with a ``GaussianCopulaSynthesizer`` or any of
+                the univariates is not supported by ``sdv.multi_table.copula_utils``.
+        """
+        if not issubclass(self._synthesizer, GaussianCopulaSynthesizer):
+            return None
+
+        synthesizer = self._synthesizer(table_meta, **synthesizer_parameters)
+        distributions = {
+            column: synthesizer._numerical_distributions.get(
+                column, synthesizer._default_distribution)
+            for column in columns
+        }
+        if not all(dist in SUPPORTED_DISTRIBUTIONS for dist in distributions.values()):
+            return None
+
+        return distributions
+
     def _get_extension(self, child_name, child_table, foreign_key, progress_bar_desc):
         """Generate the extension columns for this child table.
 
@@ -280,6 +413,15 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
         The values for a given index are generated by flattening a synthesizer fitted with
         the child rows with that foreign key value.
 
+        When the child table is modeled using parametric ``GaussianCopula`` distributions, the
+        parameters of all the foreign key values are computed at once by
+        ``get_grouped_copula_parameters`` instead of fitting a synthesizer for each one of them.
+
+        Otherwise, if ``n_jobs`` is greater than 1, the foreign key values are split in
+        contiguous chunks which are fitted in a pool of worker processes. The chunks are put
+        back together in their original order, so the result is the same as fitting them
+        serially.
+
         Args:
             child_name (str):
                 Name of the child table.
@@ -294,50 +436,67 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
             pandas.DataFrame
         """
         table_meta = self._table_synthesizers[child_name].get_metadata()
+        synthesizer_parameters = self._table_parameters[child_name]
+        synthesizer_parameters.update({'table_name': child_name})
 
-        extension_rows = []
         foreign_key_columns = self.metadata._get_all_foreign_keys(child_name)
         foreign_key_values = child_table[foreign_key].unique()
+        pbar_args = self._get_pbar_args(desc=progress_bar_desc)
+        num_workers = self._get_num_workers(len(foreign_key_values))
+        data_columns = child_table.columns.difference(foreign_key_columns)
+        distributions = self._get_batched_distributions(
+            child_table[data_columns],
+            child_table[foreign_key],
+            table_meta,
+            synthesizer_parameters
+        )
+        if distributions is not None:
+            with tqdm(total=len(foreign_key_values), **pbar_args) as progress_bar:
+                extension = get_grouped_copula_parameters(
+                    child_table[data_columns],
+                    child_table[foreign_key],
+                    distributions,
+                    num_workers
+                )
+                progress_bar.update(len(extension))
+
+            extension.columns = f'__{child_name}__{foreign_key}__' + extension.columns
+            num_rows = extension[f'__{child_name}__{foreign_key}__num_rows']
+            scale_columns = [column for column in extension if column.endswith('scale')]
+            extension.loc[num_rows == 1, scale_columns] = None
+            return extension
+
         child_table = child_table.set_index(foreign_key)
+        child_table = child_table[data_columns]
+
+        def get_child_groups(values):
+            return [(value, child_table.loc[[value]]) for value in values]
 
+        args = (self._synthesizer, table_meta, synthesizer_parameters, child_name, foreign_key)
         index = []
-        scale_columns = None
-        pbar_args = self._get_pbar_args(desc=progress_bar_desc)
-        for foreign_key_value in tqdm(foreign_key_values, **pbar_args):
-            child_rows = child_table.loc[[foreign_key_value]]
-            child_rows = child_rows[child_rows.columns.difference(foreign_key_columns)]
-
-            try:
-                if child_rows.empty:
-                    row = pd.Series({'num_rows': len(child_rows)})
-                    row.index = f'__{child_name}__{foreign_key}__' + row.index
-                else:
-                    synthesizer_parameters = self._table_parameters[child_name]
-                    synthesizer_parameters.update({'table_name': child_name})
-                    synthesizer = self._synthesizer(
-                        table_meta,
-                        **synthesizer_parameters
-                    )
-                    synthesizer.fit_processed_data(child_rows.reset_index(drop=True))
-                    row = synthesizer._get_parameters()
-                    row = pd.Series(row)
-                    row.index = f'__{child_name}__{foreign_key}__' + row.index
-
-                    if scale_columns is None:
-                        scale_columns = [
-                            column
-                            for column in row.index
-                            if column.endswith('scale')
-                        ]
-
-                    if len(child_rows) == 1:
-                        row.loc[scale_columns] = None
-
-                extension_rows.append(row)
-                index.append(foreign_key_value)
-            except Exception:
-                # Skip children rows subsets that fail
-                pass
+        extension_rows = []
+        if num_workers == 1:
+            for foreign_key_value in tqdm(foreign_key_values, **pbar_args):
+                chunk_index, chunk_rows = _get_extension_rows(
+                    *args, get_child_groups([foreign_key_value]))
+                index.extend(chunk_index)
+                extension_rows.extend(chunk_rows)
+
+        else:
+            num_chunks = min(len(foreign_key_values), num_workers * CHUNKS_PER_JOB)
+            chunks = np.array_split(foreign_key_values, num_chunks)
+            with tqdm(total=len(foreign_key_values), **pbar_args) as progress_bar:
+                with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                    futures = [
+                        executor.submit(
+                            _get_extension_rows_in_worker, *args, get_child_groups(chunk))
+                        for chunk in chunks
+                    ]
+                    for chunk, future in zip(chunks, futures):
+                        chunk_index, chunk_rows = future.result()
+                        index.extend(chunk_index)
+                        extension_rows.extend(chunk_rows)
+                        progress_bar.update(len(chunk))
 
         return pd.DataFrame(extension_rows, index=index)
 
@@ -534,6 +693,69 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
 
         return synthesizer
 
+    def _sample_all_child_rows(self, child_name, parent_name, parent_rows):
+        """Sample the child rows of all the parent rows at once.
+
+        When the child table is modeled using parametric ``GaussianCopula`` distributions and
+        has no constraints, the child models of all the parent rows are rebuilt as a
+        ``StackedGaussianCopulas``. The rows of all of them are sampled together and reverse
+        transformed in a single call.
+
+        Every child synthesizer recreated by ``_recreate_child_synthesizer`` samples with the
+        ``FIXED_RNG_SEED`` random state, so the same random state is used to sample all the
+        models, which produces the same rows as sampling them one parent row at a time.
+
+        Args:
+            child_name (str):
+                The name of the child table.
+            parent_name (str):
+                The name of the parent table.
+            parent_rows (pandas.DataFrame):
+                The sampled rows of the parent table.
+
+        Returns:
+            pandas.DataFrame or None:
+                The sampled child rows, including the foreign key to the parent table, or
+                ``None`` if they have to be sampled one parent row at a time.
+        """
+        foreign_key = self.metadata._get_foreign_keys(parent_name, child_name)[0]
+        num_rows_key = f'__{child_name}__{foreign_key}__num_rows'
+        data_processor = self._table_synthesizers[child_name]._data_processor
+        if num_rows_key not in parent_rows or data_processor._constraints:
+            return None
+
+        num_rows = parent_rows[num_rows_key].to_numpy(dtype=float)
+        if np.isnan(num_rows).any():
+            return None
+
+        parameters = self._get_child_parameters(parent_rows, child_name, foreign_key)
+        columns = list(unflatten_dict(dict.fromkeys(parameters.columns)).get('univariates', {}))
+        table_meta = self._table_synthesizers[child_name].get_metadata()
+        synthesizer_parameters = self._table_parameters[child_name]
+        synthesizer_parameters.update({'table_name': child_name})
+        distributions = self._get_parametric_distributions(
+            table_meta, synthesizer_parameters, columns)
+        if not distributions:
+            return None
+
+        default_parameters = getattr(self, '_default_parameters', {}).get(child_name, {})
+        copulas = StackedGaussianCopulas(parameters, distributions, default_parameters)
+        if not copulas.is_valid.all():
+            return None
+
+        num_rows = np.maximum(np.round(num_rows), 0).astype(int)
+        raw_sampled = copulas.sample(num_rows, np.random.RandomState(FIXED_RNG_SEED))
+        sampled = data_processor.reverse_transform(raw_sampled)
+        input_columns = data_processor._hyper_transformer._input_columns
+        missing_cols = list(
+            set(raw_sampled.columns) - set(input_columns) - set(sampled.columns)
+        )
+        sampled = pd.concat([sampled, raw_sampled[missing_cols]], axis=1)
+
+        parent_key = self.metadata.tables[parent_name].primary_key
+        sampled[foreign_key] = np.repeat(parent_rows[parent_key].to_numpy(), num_rows)
+        return sampled
+
     @staticmethod
     def _find_parent_id(likelihoods, num_rows):
         """Find the parent id for one row based on the likelihoods of parent id values.
@@ -541,57 +763,91 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
         If likelihoods are invalid, fall back to the num_rows.
 
         Args:
-            likelihoods (pandas.Series):
-                The likelihood of parent id values.
-            num_rows (pandas.Series):
-                The number of times each parent id value appears in the data.
+            likelihoods (numpy.ndarray):
+                The likelihood of every parent id value.
+            num_rows (numpy.ndarray):
+                The number of rows that every parent id value can still be assigned to.
+                The count of the chosen parent is decreased in place.
 
         Returns:
             int:
-                The parent id for this row, chosen based on likelihoods.
+                The position of the parent id for this row, chosen based on likelihoods.
         """
-        mean = likelihoods.mean()
+        is_nan = np.isnan(likelihoods)
+        mean = np.nan if is_nan.all() else likelihoods[~is_nan].mean()
         if (likelihoods == 0).all():
             # All rows got 0 likelihood, fallback to num_rows
             likelihoods = num_rows
-        elif pd.isna(mean) or mean == 0:
+        elif np.isnan(mean) or mean == 0:
             # Some rows got singular matrix error and the rest were 0
             # Fallback to num_rows on the singular matrix rows and
             # keep 0s on the rest.
-            likelihoods = likelihoods.fillna(num_rows)
+            likelihoods = np.where(is_nan, num_rows, likelihoods)
         else:
             # at least one row got a valid likelihood, so fill the
             # rows that got a singular matrix error with the mean
-            likelihoods = likelihoods.fillna(mean)
+            likelihoods = np.where(is_nan, mean, likelihoods)
 
-        total = likelihoods.sum()
+        total = np.nansum(likelihoods)
         if total == 0:
             # Worse case scenario: we have no likelihoods
             # and all num_rows are 0, so we fallback to uniform
             length = len(likelihoods)
             weights = np.ones(length) / length
         else:
-            weights = likelihoods.to_numpy() / total
+            weights = likelihoods / total
 
-        candidates, candidate_weights = [], []
-        for parent, weight in zip(likelihoods.index.to_list(), weights):
-            if num_rows[parent] > 0:
-                candidates.append(parent)
-                candidate_weights.append(weight)
+        candidates = np.flatnonzero(num_rows > 0)
+        candidate_weights = weights[candidates]
 
         # All available candidates were assigned 0 likelihood of being the parent id
-        if sum(candidate_weights) == 0:
+        if candidate_weights.sum() == 0:
             chosen_parent = np.random.choice(candidates)
         else:
-            candidate_weights = np.array(candidate_weights) / np.sum(candidate_weights)
+            candidate_weights = candidate_weights / np.sum(candidate_weights)
             chosen_parent = np.random.choice(candidates, p=candidate_weights)
 
         num_rows[chosen_parent] -= 1
 
         return chosen_parent
 
-    def _get_likelihoods(self, table_rows, parent_rows, table_name, foreign_key):
-        """Calculate the likelihood of each parent id value appearing in the data.
+    def _get_child_parameters(self, parent_rows, table_name, foreign_key):
+        """Get the parameters of the child table model of every parent row.
+
+        The parameters are processed in the same way as ``_extract_parameters`` does for a
+        single parent row, except for the number of rows, which is dropped.
+
+        Returns:
+            pandas.DataFrame:
+                A DataFrame with the flattened model parameters of every parent row.
+        """
+        prefix = f'__{table_name}__{foreign_key}__'
+        keys = [
+            key for key in parent_rows.columns
+            if key.startswith(prefix) and key != f'{prefix}num_rows'
+        ]
+        formatters = [self.extended_columns[table_name][key] for key in keys]
+        parameters = parent_rows[keys].astype(float).fillna(1e-6).to_numpy()
+        parameters = np.clip(
+            parameters,
+            np.array([formatter._min_value for formatter in formatters], dtype=float),
+            np.array([formatter._max_value for formatter in formatters], dtype=float)
+        )
+
+        return pd.DataFrame(
+            parameters,
+            index=parent_rows.index,
+            columns=[key[len(prefix):] for key in keys]
+        )
+
+    def _iter_likelihoods(self, table_rows, parent_rows, table_name, foreign_key):
+        """Calculate the likelihood of each parent id value, a chunk of child rows at a time.
+
+        When the child table is modeled using parametric ``GaussianCopula`` distributions, the
+        likelihoods of a chunk of child rows under all the parent models are computed at once
+        by a ``StackedGaussianCopulas``. The chunks are sized so that none of the arrays used
+        to compute them has more than ``LIKELIHOOD_CHUNK_SIZE`` elements. Otherwise, a
+        synthesizer is built for every parent row and evaluated on every chunk.
 
         Args:
             table_rows (pandas.DataFrame):
@@ -603,13 +859,12 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
             foreign_key (str):
                 The foreign key column in the child table.
 
-        Returns:
-            pandas.DataFrame:
-                A DataFrame of the likelihood of each parent id.
+        Yields:
+            tuple[pandas.Index, numpy.ndarray]:
+                The index of the child rows in the chunk and the likelihood of each parent
+                id value for each one of them, with one column per parent row.
         """
-        likelihoods = {}
         table_rows = table_rows.copy()
-
         data_processor = self._table_synthesizers[table_name]._data_processor
         transformed = data_processor.transform(table_rows)
         if transformed.index.name:
@@ -619,29 +874,77 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
             [transformed, table_rows.drop(columns=transformed.columns)],
             axis=1
         )
-        for parent_id, row in parent_rows.iterrows():
-            parameters = self._extract_parameters(row, table_name, foreign_key)
-            table_meta = self._table_synthesizers[table_name].get_metadata()
-            synthesizer_parameters = self._table_parameters[table_name]
-            synthesizer_parameters.update({'table_name': table_name})
-            synthesizer = self._synthesizer(
-                table_meta,
-                **synthesizer_parameters
-            )
-            synthesizer._set_parameters(parameters)
-            try:
-                likelihoods[parent_id] = synthesizer._get_likelihood(table_rows)
 
-            except (AttributeError, np.linalg.LinAlgError):
-                likelihoods[parent_id] = None
+        table_meta = self._table_synthesizers[table_name].get_metadata()
+        synthesizer_parameters = self._table_parameters[table_name]
+        synthesizer_parameters.update({'table_name': table_name})
+        parameters = self._get_child_parameters(parent_rows, table_name, foreign_key)
+        columns = list(unflatten_dict(dict.fromkeys(parameters.columns)).get('univariates', {}))
+        distributions = self._get_parametric_distributions(
+            table_meta, synthesizer_parameters, columns)
+
+        max_chunk_size = self.LIKELIHOOD_CHUNK_SIZE
+        if distributions:
+            copulas = StackedGaussianCopulas(parameters, distributions)
+            chunk_size = copulas.get_chunk_size(max_chunk_size)
+            for start in range(0, len(table_rows), chunk_size):
+                chunk = table_rows.iloc[start:start + chunk_size]
+                yield chunk.index, np.exp(copulas.log_probability_density(chunk))
+
+            return
+
+        synthesizers = []
+        for _, row in parameters.iterrows():
+            synthesizer = self._synthesizer(table_meta, **synthesizer_parameters)
+            synthesizer._set_parameters(row.to_dict())
+            synthesizers.append(synthesizer)
+
+        chunk_size = max(1, max_chunk_size // max(1, len(synthesizers) * len(columns)))
+        for start in range(0, len(table_rows), chunk_size):
+            chunk = table_rows.iloc[start:start + chunk_size]
+            likelihoods = np.full((len(chunk), len(synthesizers)), np.nan)
+            for position, synthesizer in enumerate(synthesizers):
+                try:
+                    likelihoods[:, position] = synthesizer._get_likelihood(chunk)
+                except (AttributeError, np.linalg.LinAlgError):
+                    pass
+
+            yield chunk.index, likelihoods
+
+    def _get_likelihoods(self, table_rows, parent_rows, table_name, foreign_key):
+        """Calculate the likelihood of each parent id value appearing in the data.
+
+        Args:
+            table_rows (pandas.DataFrame):
+                The rows in the child table.
+            parent_rows (pandas.DataFrame):
+                The rows in the parent table.
+            table_name (str):
+                The name of the child table.
+            foreign_key (str):
+                The foreign key column in the child table.
 
-        return pd.DataFrame(likelihoods, index=table_rows.index)
+        Returns:
+            pandas.DataFrame:
+                A DataFrame of the likelihood of each parent id.
+        """
+        chunks = list(self._iter_likelihoods(table_rows, parent_rows, table_name, foreign_key))
+        if not chunks:
+            return pd.DataFrame(columns=parent_rows.index, dtype=float)
+
+        indexes, likelihoods = zip(*chunks)
+        return pd.DataFrame(
+            np.concatenate(likelihoods),
+            index=indexes[0].append(list(indexes[1:])),
+            columns=parent_rows.index
+        )
 
     def _find_parent_ids(self, child_table, parent_table, child_name, parent_name, foreign_key):
         """Find parent ids for the given table and foreign key.
 
         The parent ids are chosen randomly based on the likelihood of the available
-        parent ids in the parent table.
+        parent ids in the parent table. The likelihoods are computed a chunk of child rows at
+        a time, so the complete likelihood matrix is never held in memory.
 
         Args:
             child_table (pd.DataFrame):
@@ -662,10 +965,21 @@ class HMASynthesizer(BaseHierarchicalSampler, BaseMultiTableSynthesizer):
         # Create a copy of the parent table with the primary key as index to calculate likelihoods
         primary_key = self.metadata.tables[parent_name].primary_key
         parent_table = parent_table.set_index(primary_key)
-        num_rows = parent_table[f'__{child_name}__{foreign_key}__num_rows'].copy()
+        num_rows_key = f'__{child_name}__{foreign_key}__num_rows'
+        num_rows = parent_table[num_rows_key].to_numpy(dtype=float, copy=True)
+
+        index = []
+        positions = []
+        chunks = self._iter_likelihoods(child_table, parent_table, child_name, foreign_key)
+        for chunk_index, likelihoods in chunks:
+            index.append(chunk_index)
+            positions.extend(
+                self._find_parent_id(row_likelihoods, num_rows)
+                for row_likelihoods in likelihoods
+            )
 
-        likelihoods = self._get_likelihoods(child_table, parent_table, child_name, foreign_key)
-        return likelihoods.apply(self._find_parent_id, axis=1, num_rows=num_rows)
+        index = index[0].append(index[1:]) if index else child_table.index[:0]
+        return pd.Series(parent_table.index[positions], index=index)
 
     def _add_foreign_key_columns(self, child_table, parent_table, child_name, parent_name):
         for foreign_key in self.metadata._get_foreign_keys(parent_name, child_name):
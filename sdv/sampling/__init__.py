@@ -2,10 +2,11 @@
 
 from sdv.sampling.hierarchical_sampler import BaseHierarchicalSampler
 from sdv.sampling.independent_sampler import BaseIndependentSampler
-from sdv.sampling.tabular import Condition
+from sdv.sampling.tabular import BatchConditions, Condition
 
 __all__ = [
     'BaseHierarchicalSampler',
     'BaseIndependentSampler',
+    'BatchConditions',
     'Condition',
 ]
@@ -1,11 +1,67 @@
 """Hierarchical Samplers."""
 import logging
 
+import numpy as np
 import pandas as pd
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _rebalance_num_rows(num_rows, total_num_rows, min_rows, max_rows):
+    """Adjust the number of rows of every parent so that they add up to the total.
+
+    The result is the same as adding (or subtracting) 1 to every value that has not reached
+    ``max_rows`` (or ``min_rows``) until the total is reached, starting from the lowest (or
+    highest) values. It is computed in closed form by finding how many complete rounds of
+    increments fit before the total is reached. If the total cannot be reached within the
+    bounds, all the values are set to the bound and the rest is spread evenly ignoring it.
+
+    Args:
+        num_rows (numpy.ndarray):
+            The number of rows of every parent, within ``min_rows`` and ``max_rows``.
+        total_num_rows (int):
+            The number of rows that the values have to add up to.
+        min_rows (int):
+            The minimum number of rows of a parent.
+        max_rows (int):
+            The maximum number of rows of a parent.
+
+    Returns:
+        numpy.ndarray:
+            The adjusted number of rows of every parent.
+    """
+    length = len(num_rows)
+    difference = total_num_rows - num_rows.sum()
+    if difference == 0 or length == 0:
+        return num_rows
+
+    sign = 1 if difference > 0 else -1
+    difference = abs(difference)
+    room = max_rows - num_rows if sign > 0 else num_rows - min_rows
+    if difference >= room.sum():
+        rounds, remainder = divmod(difference - room.sum(), length)
+        change = room + rounds
+    else:
+        # The values that fill up their room in less than ``rounds`` increments contribute
+        # their room, and the rest contribute ``rounds`` each.
+        sorted_room = np.sort(room)
+        filled = np.cumsum(sorted_room)
+        totals = filled + sorted_room * np.arange(length - 1, -1, -1)
+        num_full = np.searchsorted(totals, difference, side='right')
+        previous = filled[num_full - 1] if num_full else 0
+        rounds = (difference - previous) // (length - num_full)
+        change = np.minimum(room, rounds)
+        remainder = difference - change.sum()
+
+    num_rows = (num_rows + sign * change).astype(num_rows.dtype)
+    order = np.argsort(num_rows, kind='stable')
+    if sign < 0:
+        order = order[::-1]
+
+    num_rows[order[:int(remainder)]] += sign
+    return num_rows
+
+
 class BaseHierarchicalSampler():
     """Hierarchical sampler mixin.
 
@@ -110,6 +166,28 @@ class BaseHierarchicalSampler():
                 sampled_data[child_name] = pd.concat(
                     [previous, sampled_rows]).reset_index(drop=True)
 
+    def _sample_all_child_rows(self, child_name, parent_name, parent_rows):
+        """Sample the child rows of all the parent rows at once.
+
+        Samplers that can sample the children of all the parent rows in a single pass
+        should implement this method. Otherwise, the child rows are sampled one parent row
+        at a time with ``_add_child_rows``.
+
+        Args:
+            child_name (str):
+                The name of the child table.
+            parent_name (str):
+                The name of the parent table.
+            parent_rows (pandas.DataFrame):
+                The sampled rows of the parent table.
+
+        Returns:
+            pandas.DataFrame or None:
+                The sampled child rows, including the foreign key to the parent table, or
+                ``None`` if they have to be sampled one parent row at a time.
+        """
+        return None
+
     def _enforce_table_size(self, child_name, table_name, scale, sampled_data):
         """Ensure the child table has the same size as in the real data times the scale factor.
 
@@ -128,6 +206,9 @@ class BaseHierarchicalSampler():
            highest to the lowest until the sum is reached, while respecting the minimum values
            observed in the real data when possible.
 
+        The adjustment is computed in closed form by ``_rebalance_num_rows``, so it takes
+        ``O(n log n)`` time on the number of parent rows.
+
         Args:
             child_name (str):
                 The name of the child table.
@@ -146,34 +227,12 @@ class BaseHierarchicalSampler():
             key_data = sampled_data[table_name][num_rows_key].fillna(0).round()
             sampled_data[table_name][num_rows_key] = key_data.clip(min_rows, max_rows).astype(int)
 
-            while sum(sampled_data[table_name][num_rows_key]) != total_num_rows:
-                num_rows_column = sampled_data[table_name][num_rows_key].argsort()
-
-                if sum(sampled_data[table_name][num_rows_key]) < total_num_rows:
-                    for i in num_rows_column:
-                        # If the number of rows is already at the maximum, skip
-                        # The exception is when the smallest value is already at the maximum,
-                        # in which case we ignore the boundary
-                        if sampled_data[table_name].loc[i, num_rows_key] >= max_rows and \
-                           sampled_data[table_name][num_rows_key].min() < max_rows:
-                            break
-
-                        sampled_data[table_name].loc[i, num_rows_key] += 1
-                        if sum(sampled_data[table_name][num_rows_key]) == total_num_rows:
-                            break
-
-                else:
-                    for i in num_rows_column[::-1]:
-                        # If the number of rows is already at the minimum, skip
-                        # The exception is when the highest value is already at the minimum,
-                        # in which case we ignore the boundary
-                        if sampled_data[table_name].loc[i, num_rows_key] <= min_rows and \
-                           sampled_data[table_name][num_rows_key].max() > min_rows:
-                            break
-
-                        sampled_data[table_name].loc[i, num_rows_key] -= 1
-                        if sum(sampled_data[table_name][num_rows_key]) == total_num_rows:
-                            break
+            sampled_data[table_name][num_rows_key] = _rebalance_num_rows(
+                sampled_data[table_name][num_rows_key].to_numpy(),
+                total_num_rows,
+                min_rows,
+                max_rows
+            )
 
     def _sample_children(self, table_name, sampled_data, scale=1.0):
         """Recursively sample the children of a table.
@@ -192,13 +251,19 @@ class BaseHierarchicalSampler():
             self._enforce_table_size(child_name, table_name, scale, sampled_data)
 
             if child_name not in sampled_data:  # Sample based on only 1 parent
-                for _, row in sampled_data[table_name].iterrows():
-                    self._add_child_rows(
-                        child_name=child_name,
-                        parent_name=table_name,
-                        parent_row=row,
-                        sampled_data=sampled_data
-                    )
+                child_rows = self._sample_all_child_rows(
+                    child_name, table_name, sampled_data[table_name])
+                if child_rows is None:
+                    for _, row in sampled_data[table_name].iterrows():
+                        self._add_child_rows(
+                            child_name=child_name,
+                            parent_name=table_name,
+                            parent_row=row,
+                            sampled_data=sampled_data
+                        )
+
+                elif len(child_rows):
+                    sampled_data[child_name] = child_rows
 
                 if child_name not in sampled_data:  # No child rows sampled, force row creation
                     foreign_key = self.metadata._get_foreign_keys(table_name, child_name)[0]
@@ -0,0 +1,122 @@
+"""Reject sampling controller."""
+
+import math
+
+
+class RejectSamplingController:
+    """Track the acceptance rate of reject sampling and choose how many rows to sample.
+
+    The number of sampled and valid rows is accumulated for every condition signature, which
+    is the set of conditioning values, so the first round of a new reject-sampling loop can
+    already oversample as much as needed. The statistics are also aggregated for every set of
+    condition columns, which are used instead if a signature has not been seen yet or if it
+    was not stored because ``max_signatures`` had already been reached.
+
+    Args:
+        max_oversampling (int):
+            Maximum number of rows to sample in a single round, as a multiple of the number
+            of rows requested. Defaults to 10.
+        z_score (float):
+            Number of standard deviations of the number of valid rows that are added as a
+            margin, so the target is reached in one round with high probability.
+            Defaults to 2.
+        max_signatures (int):
+            Maximum number of condition signatures whose statistics are stored individually.
+            Defaults to 1000.
+    """
+
+    def __init__(self, max_oversampling=10, z_score=2, max_signatures=1000):
+        self.max_oversampling = max_oversampling
+        self.z_score = z_score
+        self.max_signatures = max_signatures
+        self._statistics = {}
+        self._column_statistics = {}
+
+    @staticmethod
+    def _get_signature(conditions):
+        if not conditions:
+            return ()
+
+        return tuple(sorted((str(column), value) for column, value in conditions.items()))
+
+    def update(self, conditions, num_sampled, num_valid):
+        """Record the result of a round of reject sampling.
+
+        Args:
+            conditions (dict or None):
+                The conditioning values used to sample the rows.
+            num_sampled (int):
+                The number of rows sampled.
+            num_valid (int):
+                The number of sampled rows that were valid.
+        """
+        signature = self._get_signature(conditions)
+        columns = tuple(column for column, _ in signature)
+        statistics = [self._column_statistics.setdefault(columns, [0, 0])]
+        if signature in self._statistics or len(self._statistics) < self.max_signatures:
+            statistics.append(self._statistics.setdefault(signature, [0, 0]))
+
+        for counts in statistics:
+            counts[0] += num_sampled
+            counts[1] += num_valid
+
+    def get_acceptance_rate(self, conditions=None):
+        """Get the estimated fraction of sampled rows that are valid.
+
+        Args:
+            conditions (dict or None):
+                The conditioning values. Defaults to ``None``.
+
+        Returns:
+            float or None:
+                The acceptance rate, or ``None`` if there are no statistics for the conditions.
+        """
+        signature = self._get_signature(conditions)
+        if signature in self._statistics:
+            num_sampled, num_valid = self._statistics[signature]
+        else:
+            columns = tuple(column for column, _ in signature)
+            num_sampled, num_valid = self._column_statistics.get(columns, (0, 0))
+
+        if not num_sampled:
+            return None
+
+        return max(num_valid, 1) / (num_sampled + int(num_valid == 0))
+
+    def get_num_rows_to_sample(self, num_rows, batch_size, conditions=None):
+        """Get how many rows to sample to obtain the given number of valid rows.
+
+        Args:
+            num_rows (int):
+                The number of valid rows that are still needed.
+            batch_size (int):
+                The number of rows requested for the whole reject-sampling loop, used to
+                cap the number of rows to sample.
+            conditions (dict or None):
+                The conditioning values. Defaults to ``None``.
+
+        Returns:
+            int:
+                The number of rows to sample.
+        """
+        acceptance_rate = self.get_acceptance_rate(conditions)
+        if num_rows <= 0 or acceptance_rate is None or acceptance_rate >= 1:
+            return num_rows
+
+        margin = self.z_score * math.sqrt(num_rows * (1 - acceptance_rate))
+        num_rows_to_sample = math.ceil((num_rows + margin) / acceptance_rate)
+        return max(num_rows, min(num_rows_to_sample, self.max_oversampling * batch_size))
+
+    def to_dict(self):
+        """Get the acceptance rate of every set of condition columns.
+
+        Returns:
+            dict:
+                A dictionary mapping the string representation of every list of condition
+                columns to its acceptance rate.
+        """
+        return {
+            str(list(columns)): num_valid / num_sampled
+            for columns, (num_sampled, num_valid) in self._column_statistics.items()
+            if num_sampled
+        }
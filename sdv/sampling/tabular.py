@@ -1,5 +1,8 @@
 """SDV Condition class for sampling."""
 
+import numpy as np
+import pandas as pd
+
 
 class Condition():
     """Condition class.
@@ -29,3 +32,90 @@ class Condition():
     def get_num_rows(self):
         """Get the desired number of rows for this condition."""
         return self.num_rows
+
+
+class BatchConditions():
+    """Many conditions over the same columns, stored as columns of a table.
+
+    This class represents a batch of conditions that is used for sampling. Every row
+    of ``column_values`` is a condition, so building it does not require creating one
+    ``Condition`` object per condition.
+
+    Attributes:
+        column_values (pandas.DataFrame):
+            A table with the desired conditions. Every row maps the column names to the
+            column values that will be satisfied in that condition.
+        num_rows_column (str or None):
+            The name of the column of ``column_values`` with the number of rows to generate
+            for every condition. If ``None``, one row is generated for every condition.
+            Defaults to ``None``.
+    """
+
+    def __init__(self, column_values, num_rows_column=None):
+        if not isinstance(column_values, pd.DataFrame):
+            raise ValueError("'column_values' must be a pandas DataFrame.")
+
+        if num_rows_column is not None and num_rows_column not in column_values.columns:
+            raise ValueError(f"The column '{num_rows_column}' is not in 'column_values'.")
+
+        if num_rows_column is not None:
+            self._validate_num_rows(column_values[num_rows_column])
+
+        self.column_values = column_values
+        self.num_rows_column = num_rows_column
+
+    @staticmethod
+    def _validate_num_rows(num_rows):
+        is_valid = False
+        is_number = pd.api.types.is_numeric_dtype(num_rows)
+        if is_number and not pd.api.types.is_bool_dtype(num_rows):
+            values = num_rows.to_numpy(dtype=float, na_value=np.nan)
+            is_integer = np.isfinite(values) & (values == np.floor(values))
+            is_valid = bool(np.all(is_integer & (values >= 0)))
+
+        if not is_valid:
+            raise ValueError(
+                f"The column '{num_rows.name}' must only contain non-negative integers, with "
+                'the number of rows to generate for every condition.'
+            )
+
+    def get_column_values(self):
+        """Get the condition values, without the number of rows column.
+
+        Returns:
+            pandas.DataFrame:
+                A table with one row per condition.
+        """
+        if self.num_rows_column is None:
+            return self.column_values
+
+        return self.column_values.drop(columns=[self.num_rows_column])
+
+    def get_num_rows_per_condition(self):
+        """Get the desired number of rows of every condition.
+
+        Returns:
+            numpy.ndarray:
+                The number of rows of every condition.
+        """
+        if self.num_rows_column is None:
+            return np.ones(len(self.column_values), dtype=int)
+
+        return self.column_values[self.num_rows_column].to_numpy(dtype=int)
+
+    def get_num_rows(self):
+        """Get the desired number of rows for all the conditions."""
+        return int(self.get_num_rows_per_condition().sum())
+
+    def to_dataframe(self):
+        """Get the conditions with one row per row to generate.
+
+        Returns:
+            pandas.DataFrame:
+                The condition values, with every condition repeated as many times as
+                rows to generate for it, and a ``RangeIndex``.
+        """
+        positions = np.repeat(
+            np.arange(len(self.column_values)), self.get_num_rows_per_condition())
+        conditions = self.get_column_values().take(positions)
+        return conditions.reset_index(drop=True)
@@ -4,24 +4,362 @@ import inspect
 import logging
 import uuid
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 import pandas as pd
+import torch
 import tqdm
 from deepecho import PARModel
+from deepecho.models.par import PARNet
 from deepecho.sequences import assemble_sequences
 from rdt.transformers import FloatFormatter
 
-from sdv._utils import _cast_to_iterable, _groupby_list
+from sdv._utils import (
+    _cast_to_iterable, _get_num_workers, _groupby_list, _validate_n_jobs)
 from sdv.errors import SamplingError, SynthesizerInputError
+from sdv.io import ParquetWriter
 from sdv.metadata.single_table import SingleTableMetadata
-from sdv.sampling import Condition
+from sdv.sampling import BatchConditions
 from sdv.single_table import GaussianCopulaSynthesizer
 from sdv.single_table.base import BaseSynthesizer
 from sdv.single_table.ctgan import LossValuesMixin
+from sdv.single_table.utils import handle_sampling_error, validate_file_path
 
 LOGGER = logging.getLogger(__name__)
 
+CONTINUOUS_TYPES = ('continuous', 'timestamp', 'datetime')
+CATEGORICAL_TYPES = ('categorical', 'ordinal')
+SHARDS_PER_JOB = 4
+
+
+def _assemble_sequences(data, entity_columns, context_columns, segment_size, sequence_index):
+    """Build the sequences used to fit a ``PARModel``.
+
+    Equivalent to ``deepecho.sequences.assemble_sequences`` with ``drop_sequence_index=False``,
+    but the data is sorted by entity once and every sequence is sliced out of the sorted
+    column values using its offsets, instead of copying each entity into its own
+    ``pandas.DataFrame``. Time based segments are delegated to ``deepecho``.
+
+    Args:
+        data (pandas.DataFrame):
+            Data to assemble in sequences.
+        entity_columns (list):
+            Names of the columns that form each sequence key.
+        context_columns (list):
+            Names of the columns whose values are constant within each sequence.
+        segment_size (int, pandas.Timedelta or None):
+            Size of each segment.
+        sequence_index (str or None):
+            Name of the column used to sort each sequence.
+
+    Raises:
+        ValueError:
+            If context columns are not constant within each entity.
+
+    Returns:
+        list:
+            List of dicts with the ``context`` values and the ``data`` lists of each sequence.
+    """
+    if not entity_columns or not (segment_size is None or isinstance(segment_size, int)):
+        return assemble_sequences(
+            data,
+            entity_columns,
+            context_columns,
+            segment_size,
+            sequence_index,
+            drop_sequence_index=False
+        )
+
+    codes = data.groupby(entity_columns).ngroup().fillna(-1).to_numpy(dtype=np.int64)
+    if context_columns:
+        unique_contexts = data[entity_columns + context_columns].drop_duplicates()
+        unique_contexts = unique_contexts.dropna(subset=entity_columns)
+        if len(unique_contexts) > codes.max(initial=-1) + 1:
+            raise ValueError('Context columns are not constant within each entity.')
+
+    sort_keys = pd.DataFrame({'code': codes})
+    if sequence_index is not None:
+        sort_keys['sequence_index'] = data[sequence_index].to_numpy()
+
+    sort_keys = sort_keys[codes >= 0]
+    order = sort_keys.sort_values(list(sort_keys.columns), kind='mergesort').index.to_numpy()
+    offsets = np.flatnonzero(np.diff(codes[order], prepend=-1, append=-1))
+    starts, ends = offsets[:-1], offsets[1:]
+    if segment_size is not None:
+        num_segments = (ends - starts) // segment_size
+        segment_offsets = np.arange(num_segments.sum()) - np.repeat(
+            num_segments.cumsum() - num_segments, num_segments)
+        starts = np.repeat(starts, num_segments) + segment_offsets * segment_size
+        ends = starts + segment_size
+
+    if context_columns:
+        contexts = data[context_columns].to_numpy()[order[starts]]
+    else:
+        contexts = [[]] * len(starts)
+
+    data_columns = [
+        column for column in data.columns if column not in entity_columns + context_columns
+    ]
+    values = [data[column].to_numpy()[order].tolist() for column in data_columns]
+
+    return [
+        {'context': context, 'data': [column[start:end] for column in values]}
+        for context, start, end in zip(contexts, starts.tolist(), ends.tolist())
+    ]
+
+
+def _can_sample_in_batches(model):
+    """Whether the sequences of a ``PARModel`` can be sampled by ``_sample_sequences``."""
+    if not isinstance(model, PARModel) or not isinstance(getattr(model, '_model', None), PARNet):
+        return False
+
+    supported_types = CONTINUOUS_TYPES + CATEGORICAL_TYPES + ('count',)
+    props = list(model._data_map.values()) + list(model._ctx_map.values())
+    return all(prop['type'] in supported_types for prop in props)
+
+
+def _context_to_array(model, context):
+    """Encode the rows of ``context`` as ``PARModel._context_to_tensor`` does, all at once."""
+    encoded = np.zeros((len(context), model._ctx_dims), dtype=np.float32)
+    for key, props in model._ctx_map.items():
+        values = context.iloc[:, key]
+        is_null = values.isna().to_numpy()
+        if props['type'] in CATEGORICAL_TYPES:
+            indices = [props['indices'][None if null else value] for value, null in zip(
+                values.tolist(), is_null)]
+            encoded[np.arange(len(context)), indices] = 1.0
+            continue
+
+        first_idx, _second_idx, missing_idx = props['indices']
+        values = values.to_numpy(dtype=float, na_value=np.nan)
+        if props['type'] == 'count':
+            scale, shift = props['range'], props['min']
+        else:
+            scale, shift = props['std'], props['mu']
+
+        if scale != 0:
+            encoded[:, first_idx] = np.where(is_null, 0.0, (values - shift) / scale)
+
+        encoded[:, missing_idx] = is_null
+
+    return encoded
+
+
+def _sample_states(model, x):
+    """Sample the next state of a batch of sequences, as ``PARModel._sample_state`` does.
+
+    Args:
+        model (deepecho.PARModel):
+            The fitted model.
+        x (torch.Tensor):
+            Output of the network for each sequence, of shape ``(batch_size, data_dims)``.
+            It is replaced by the sampled states.
+
+    Returns:
+        torch.Tensor:
+            The log likelihood of the sampled state of each sequence.
+    """
+    log_likelihood = torch.zeros(x.shape[0], device=x.device)
+    for props in model._data_map.values():
+        if props['type'] in CATEGORICAL_TYPES:
+            idx = list(props['indices'].values())
+            p = torch.nn.functional.softmax(x[:, idx], dim=1)
+            x_new = torch.zeros_like(p)
+            x_new.scatter_(dim=1, index=torch.multinomial(p, 1), value=1)
+            x[:, idx] = x_new
+            log_likelihood += torch.sum(torch.log(p) * x_new, dim=1)
+            continue
+
+        first_idx, second_idx, missing_idx = props['indices']
+        if props['type'] == 'count':
+            r = torch.nn.functional.softplus(x[:, first_idx]) * props['range']
+            p = torch.sigmoid(x[:, second_idx])
+            dist = torch.distributions.negative_binomial.NegativeBinomial(r, p)
+            sample = dist.sample()
+            log_likelihood += dist.log_prob(sample)
+            sample = sample / props['range']
+        else:
+            mu = x[:, first_idx]
+            sigma = torch.nn.functional.softplus(x[:, second_idx])
+            dist = torch.distributions.normal.Normal(mu, sigma)
+            sample = dist.sample()
+            log_likelihood += dist.log_prob(sample)
+
+        dist = torch.distributions.Bernoulli(torch.sigmoid(x[:, missing_idx]))
+        missing = dist.sample()
+        log_likelihood += dist.log_prob(missing)
+        x[:, first_idx] = sample * (1.0 - missing)
+        x[:, second_idx] = 0.0
+        x[:, missing_idx] = missing
+
+    return log_likelihood
+
+
+def _sample_batch(model, num_sequences, context, min_length, max_length):
+    """Sample one sequence for each context, advancing all of them in the same steps.
+
+    The recurrent network keeps its hidden state between steps, so each step only runs
+    the network over the last sampled state of the sequences that have not ended yet.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+            The sampled states of all the sequences, one after the other, the length of
+            each sequence and their log likelihood.
+    """
+    network = model._model
+    tokens = model._data_map['<TOKEN>']['indices']
+    states = torch.zeros(num_sequences, model._data_dims, device=model.device)
+    states[:, tokens['<START>']] = 1.0
+    log_likelihood = torch.zeros(num_sequences, device=model.device)
+    lengths = np.full(num_sequences, max_length)
+    active = torch.arange(num_sequences, device=model.device)
+    steps = []
+    hidden = None
+    for step in range(max_length):
+        network_input = states.unsqueeze(0)
+        if network.context_size:
+            network_input = torch.cat([network_input, context[active].unsqueeze(0)], dim=2)
+
+        output, hidden = network.rnn(network.down(network_input), hidden)
+        states = network.up(output)[0]
+        log_likelihood[active] += _sample_states(model, states)
+        steps.append((active, states))
+
+        if min_length <= step + 1:
+            ended = states[:, tokens['<END>']] > 0.0
+            lengths[active[ended].cpu().numpy()] = step + 1
+            states, hidden, active = states[~ended], hidden[:, ~ended], active[~ended]
+            if not len(active):
+                break
+
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    data = np.empty((lengths.sum(), model._data_dims), dtype=np.float32)
+    for step, (sequences, step_states) in enumerate(steps):
+        data[starts[sequences.cpu().numpy()] + step] = step_states.cpu().numpy()
+
+    return data, lengths, log_likelihood.cpu().numpy()
+
+
+def _select_best_samples(best, sample):
+    """Keep, for each sequence, the sample with the highest log likelihood."""
+    best_data, best_lengths, best_log_likelihood = best
+    data, lengths, log_likelihood = sample
+    is_better = log_likelihood > best_log_likelihood
+    new_lengths = np.where(is_better, lengths, best_lengths)
+    sequence_ids = np.repeat(np.arange(len(new_lengths)), new_lengths)
+    steps = np.arange(len(sequence_ids)) - np.repeat(np.cumsum(new_lengths) - new_lengths,
+                                                     new_lengths)
+    from_sample = is_better[sequence_ids]
+    starts = (np.cumsum(lengths) - lengths)[sequence_ids]
+    best_starts = (np.cumsum(best_lengths) - best_lengths)[sequence_ids]
+
+    new_data = np.empty((len(sequence_ids), data.shape[1]), dtype=data.dtype)
+    new_data[from_sample] = data[starts[from_sample] + steps[from_sample]]
+    new_data[~from_sample] = best_data[best_starts[~from_sample] + steps[~from_sample]]
+    new_log_likelihood = np.where(is_better, log_likelihood, best_log_likelihood)
+
+    return new_data, new_lengths, new_log_likelihood
+
+
+def _states_to_columns(model, states):
+    """Decode the sampled states as ``PARModel._tensor_to_data`` does, for all rows at once.
+
+    Returns:
+        list[list]:
+            The values of each data column.
+    """
+    columns = [None] * (len(model._data_map) - 1)
+    for key, props in model._data_map.items():
+        if key == '<TOKEN>':
+            continue
+
+        if props['type'] in CATEGORICAL_TYPES:
+            categories = np.empty(len(props['indices']), dtype=object)
+            categories[:] = list(props['indices'].keys())
+            idx = list(props['indices'].values())
+            columns[key] = categories[states[:, idx].argmax(axis=1)].tolist()
+            continue
+
+        first_idx, _second_idx, missing_idx = props['indices']
+        if props['type'] == 'count':
+            values = np.trunc(states[:, first_idx] * props['range'] + props['min'])
+            values = values.astype(np.int64).astype(object)
+        else:
+            values = states[:, first_idx].astype(np.float64) * props['std'] + props['mu']
+            values = values.astype(object)
+
+        if props['nulls']:
+            values[states[:, missing_idx] > 0] = None
+
+        columns[key] = values.tolist()
+
+    return columns
+
+
+def _sample_sequences(model, context, sequence_length=None):
+    """Sample one sequence for each row of ``context`` with a ``PARModel``.
+
+    This is equivalent to calling ``model.sample_sequence`` for each row, but the
+    sequences are sampled together in batches.
+
+    Args:
+        model (deepecho.PARModel):
+            The fitted model.
+        context (pandas.DataFrame):
+            The context values, with the columns in the order the model was fitted with.
+        sequence_length (int):
+            Length of each sequence to sample. If ``None``, the length is sampled.
+
+    Returns:
+        tuple[list[list], numpy.ndarray]:
+            The values of each data column for all the sequences, one after the other, and
+            the length of each sequence.
+    """
+    if sequence_length is not None:
+        min_length = max_length = sequence_length
+    else:
+        min_length, max_length = model._min_length, model._max_length
+
+    encoded_context = None
+    if model._ctx_dims:
+        encoded_context = torch.from_numpy(_context_to_array(model, context)).to(model.device)
+
+    best = None
+    for _ in range(model.sample_size):
+        with torch.no_grad():
+            sample = _sample_batch(model, len(context), encoded_context, min_length, max_length)
+
+        best = sample if best is None else _select_best_samples(best, sample)
+
+    states, lengths, _ = best
+    return _states_to_columns(model, states), lengths
+
+
+def _sample_shard(synthesizer, context, sequence_length, seed):
+    """Sample the sequences of a shard of the context in a worker process.
+
+    This function is defined at the module level so it can be sent to worker processes.
+
+    Args:
+        synthesizer (PARSynthesizer):
+            The fitted synthesizer.
+        context (pandas.DataFrame):
+            Context values of the sequences in the shard.
+        sequence_length (int or None):
+            Length of each sequence to sample.
+        seed (int):
+            Seed of the random number generators of the worker.
+
+    Returns:
+        pandas.DataFrame:
+            The reverse transformed sequences of the shard.
+    """
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+    torch.set_num_threads(1)
+    return synthesizer._sample(context, sequence_length, show_progress_bar=False)
+
 
 class PARSynthesizer(LossValuesMixin, BaseSynthesizer):
     """Synthesizer for sequential data.
@@ -69,6 +407,7 @@ class PARSynthesizer(LossValuesMixin, BaseSynthesizer):
         'numerical': None,
         'boolean': None
     }
+    _sample_batch_size = 1000
 
     def _get_context_metadata(self):
         context_columns_dict = {}
@@ -146,13 +485,15 @@ class PARSynthesizer(LossValuesMixin, BaseSynthesizer):
     def _validate_context_columns(self, data):
         errors = []
         if self.context_columns:
-            for sequence_key_value, data_values in data.groupby(_groupby_list(self._sequence_key)):
-                for context_column in self.context_columns:
-                    if len(data_values[context_column].unique()) > 1:
-                        errors.append((
-                            f"Context column '{context_column}' is changing inside sequence "
-                            f'({self._sequence_key}={sequence_key_value}).'
-                        ))
+            num_values = data.groupby(_groupby_list(self._sequence_key))[self.context_columns]
+            num_values = num_values.nunique(dropna=False)
+            changing = num_values > 1
+            for sequence_key_value, row in changing[changing.any(axis=1)].iterrows():
+                for context_column in row.index[row]:
+                    errors.append((
+                        f"Context column '{context_column}' is changing inside sequence "
+                        f'({self._sequence_key}={sequence_key_value}).'
+                    ))
 
         return errors
 
@@ -160,29 +501,22 @@ class PARSynthesizer(LossValuesMixin, BaseSynthesizer):
         return self._validate_context_columns(data)
 
     def _transform_sequence_index(self, data):
-        sequence_index = data[self._sequence_key + [self._sequence_index]]
-        sequence_index_context = sequence_index.groupby(self._sequence_key).agg('first')
-        sequence_index_context = sequence_index_context.rename(
-            columns={self._sequence_index: f'{self._sequence_index}.context'}
-        )
-        if all(sequence_index[self._sequence_key].nunique() == 1):
-            sequence_index_sequence = sequence_index[[self._sequence_index]].diff().bfill()
-        else:
-            sequence_index_sequence = sequence_index.groupby(self._sequence_key).apply(
-                lambda x: x[self._sequence_index].diff().bfill()
-            ).droplevel(1).reset_index()
-
-        if all(sequence_index_sequence[self._sequence_index].isna()):
+        null_keys = data[self._sequence_key].isna().any(axis=1)
+        if null_keys.any():
+            data = data[~null_keys].copy()
+
+        grouped = data.groupby(self._sequence_key, sort=False)[self._sequence_index]
+        sequence_index_context = grouped.transform('first')
+        sequence_index_sequence = grouped.diff()
+        sequence_index_sequence = sequence_index_sequence.groupby(grouped.ngroup()).bfill()
+        if sequence_index_sequence.isna().all():
             fill_value = 0
         else:
-            fill_value = min(sequence_index_sequence[self._sequence_index].dropna())
-        sequence_index_sequence = sequence_index_sequence.fillna(fill_value)
+            fill_value = sequence_index_sequence.min()
 
+        sequence_index_sequence = sequence_index_sequence.fillna(fill_value).to_frame()
         data[self._sequence_index] = sequence_index_sequence[self._sequence_index]
-        data = data.merge(
-            sequence_index_context,
-            left_on=self._sequence_key,
-            right_index=True)
+        data[f'{self._sequence_index}.context'] = sequence_index_context
 
         self.extended_columns[self._sequence_index] = FloatFormatter(
             enforce_min_max_values=True)
@@ -274,13 +608,12 @@ class PARSynthesizer(LossValuesMixin, BaseSynthesizer):
             )
         ]
 
-        sequences = assemble_sequences(
+        sequences = _assemble_sequences(
             timeseries_data,
             self._sequence_key,
             self.context_columns + list(self._extra_context_columns.keys()),
             self.segment_size,
-            self._sequence_index,
-            drop_sequence_index=False
+            self._sequence_index
         )
         data_types = []
         context_types = []
@@ -316,7 +649,7 @@ class PARSynthesizer(LossValuesMixin, BaseSynthesizer):
         LOGGER.debug(f'Fitting {self.__class__.__name__} model to table')
         self._fit_sequence_columns(processed_data)
 
-    def _sample_from_par(self, context, sequence_length=None):
+    def _sample_from_par(self, context, sequence_length=None, show_progress_bar=True):
         """Sample new sequences.
 
         Args:
@@ -326,6 +659,9 @@ class PARSynthesizer(LossValuesMixin, BaseSynthesizer):
                 Length of each sequence to sample. If not
                 given, the sequence length will be sampled from
                 the model.
+            show_progress_bar (bool):
+                Whether to show the progress bar when the synthesizer is verbose.
+                Defaults to ``True``.
 
         Returns:
             pandas.DataFrame:
@@ -339,46 +675,117 @@ class PARSynthesizer(LossValuesMixin, BaseSynthesizer):
             context_columns = self.context_columns + list(self._extra_context_columns.keys())
             context = context[context_columns]
 
-        should_disable = not self._model_kwargs['verbose']
-        iterator = tqdm.tqdm(context.iterrows(), disable=should_disable, total=len(context))
+        should_disable = not (show_progress_bar and self._model_kwargs['verbose'])
+        if _can_sample_in_batches(self._model):
+            sequences, lengths = self._sample_sequences_in_batches(
+                context, sequence_length, should_disable)
+        else:
+            sequences, lengths = self._sample_sequences_one_by_one(
+                context, sequence_length, should_disable)
 
-        output = []
-        for sequence_key_values, context_values in iterator:
-            context_values = context_values.tolist()
-            sequence = self._model.sample_sequence(context_values, sequence_length)
-            if self._sequence_index:
-                sequence_index_idx = self._data_columns.index(self._sequence_index)
-                diffs = sequence[sequence_index_idx]
-                float_formatter = self.extended_columns[self._sequence_index]
-                diffs = float_formatter.reverse_transform(
-                    pd.DataFrame({self._sequence_index: diffs})
-                )[self._sequence_index].to_numpy()
-                start_index = context_columns.index(f'{self._sequence_index}.context')
-                start = context_values[start_index]
-                sequence[sequence_index_idx] = np.cumsum(diffs) - diffs[0] + start
-
-            # Reformat as a DataFrame
-            sequence_df = pd.DataFrame(
-                dict(zip(self._data_columns, sequence)),
-                columns=self._data_columns
-            )
-            sequence_df[self._sequence_key] = sequence_key_values
-            context_columns = self.context_columns + list(self._extra_context_columns.keys())
-            for column, value in zip(context_columns, context_values):
-                sequence_df[column] = value
+        output = pd.DataFrame(
+            dict(zip(self._data_columns, sequences)),
+            columns=self._data_columns
+        )
+        sequence_ids = np.repeat(np.arange(len(context)), lengths)
+        if self._sequence_index:
+            float_formatter = self.extended_columns[self._sequence_index]
+            diffs = float_formatter.reverse_transform(
+                pd.DataFrame({self._sequence_index: output[self._sequence_index].to_numpy()})
+            )[self._sequence_index].to_numpy()
+            starts = context[f'{self._sequence_index}.context'].to_numpy()
+            first_diffs = np.zeros(len(lengths))
+            has_rows = lengths > 0
+            first_diffs[has_rows] = diffs[(np.cumsum(lengths) - lengths)[has_rows]]
+            cumulative_diffs = pd.Series(diffs).groupby(sequence_ids).cumsum(skipna=False)
+            output[self._sequence_index] = (
+                cumulative_diffs.to_numpy() - np.repeat(first_diffs - starts, lengths))
 
-            output.append(sequence_df)
+        if self._sequence_key:
+            context = context.reset_index()
 
-        output = pd.concat(output)
-        output = output[self._output_columns].reset_index(drop=True)
+        context = context.iloc[sequence_ids]
+        for column in context.columns:
+            output[column] = context[column].to_numpy()
 
-        return output
+        return output[self._output_columns]
 
-    def _sample(self, context_columns, sequence_length=None):
-        sampled = self._sample_from_par(context_columns, sequence_length)
+    def _sample_sequences_one_by_one(self, context, sequence_length, should_disable):
+        iterator = tqdm.tqdm(context.iterrows(), disable=should_disable, total=len(context))
+        sequences = [[] for _ in self._data_columns]
+        lengths = np.zeros(len(context), dtype=int)
+        for position, (_, context_values) in enumerate(iterator):
+            sequence = self._model.sample_sequence(context_values.tolist(), sequence_length)
+            for column_values, sequence_values in zip(sequences, sequence):
+                column_values.extend(sequence_values)
+
+            lengths[position] = len(sequence[0]) if sequence else 0
+
+        return sequences, lengths
+
+    def _sample_sequences_in_batches(self, context, sequence_length, should_disable):
+        sequences = [[] for _ in self._data_columns]
+        lengths = []
+        with tqdm.tqdm(total=len(context), disable=should_disable) as progress_bar:
+            for start in range(0, len(context), self._sample_batch_size):
+                batch_context = context.iloc[start:start + self._sample_batch_size]
+                batch_sequences, batch_lengths = _sample_sequences(
+                    self._model, batch_context, sequence_length)
+                for column_values, sequence_values in zip(sequences, batch_sequences):
+                    column_values.extend(sequence_values)
+
+                lengths.append(batch_lengths)
+                progress_bar.update(len(batch_context))
+
+        lengths = np.concatenate(lengths) if lengths else np.zeros(0, dtype=int)
+        return sequences, lengths
+
+    def _sample(self, context_columns, sequence_length=None, show_progress_bar=True):
+        sampled = self._sample_from_par(context_columns, sequence_length, show_progress_bar)
         return self._data_processor.reverse_transform(sampled)
 
-    def sample(self, num_sequences, sequence_length=None):
+    def _sample_in_shards(self, context, sequence_length, num_workers, show_progress_bar=True):
+        """Sample the sequences of contiguous shards of the context in worker processes.
+
+        Every shard is sampled and reverse transformed by a worker with its own seed, drawn
+        from the global ``numpy`` random state. The shards are put back together in the
+        order of the context.
+
+        Args:
+            context (pandas.DataFrame):
+                Context values to use when generating the sequences.
+            sequence_length (int or None):
+                Length of each sequence to sample.
+            num_workers (int):
+                Number of worker processes.
+            show_progress_bar (bool):
+                Whether to show the progress bar when the synthesizer is verbose.
+                Defaults to ``True``.
+
+        Returns:
+            pandas.DataFrame:
+                Table containing the sampled sequences.
+        """
+        num_shards = min(len(context), num_workers * SHARDS_PER_JOB)
+        shards = np.array_split(np.arange(len(context)), num_shards)
+        seed_sequence = np.random.SeedSequence(np.random.randint(np.iinfo(np.int32).max))
+        seeds = [int(child.generate_state(1)[0]) for child in seed_sequence.spawn(num_shards)]
+        should_disable = not (show_progress_bar and self._model_kwargs['verbose'])
+        sampled = []
+        with tqdm.tqdm(total=len(context), disable=should_disable) as progress_bar:
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                futures = [
+                    executor.submit(
+                        _sample_shard, self, context.iloc[shard], sequence_length, seed)
+                    for shard, seed in zip(shards, seeds)
+                ]
+                for shard, future in zip(shards, futures):
+                    sampled.append(future.result())
+                    progress_bar.update(len(shard))
+
+        return pd.concat(sampled, ignore_index=True)
+
+    def sample(self, num_sequences, sequence_length=None, n_jobs=1):
         """Sample new sequences.
 
         Args:
@@ -387,11 +794,34 @@ class PARSynthesizer(LossValuesMixin, BaseSynthesizer):
             sequence_length (int):
                 If passed, sample sequences of this length. If ``None``, the sequence length will
                 be sampled from the model.
+            n_jobs (int):
+                Number of worker processes used to sample the sequences. The sampled contexts
+                are split in contiguous shards that are sampled and reverse transformed in
+                parallel. If ``-1``, use all the available CPUs. Models that run on a GPU are
+                always sampled in the current process. Defaults to ``1``.
 
         Returns:
             pandas.DataFrame:
                 Table containing the sampled sequences in the same format as the fitted data.
         """
+        _validate_n_jobs(n_jobs)
+        context_columns = self._sample_context(num_sequences)
+        return self._sample_with_n_jobs(context_columns, sequence_length, n_jobs)
+
+    def _sample_context(self, num_sequences, first_sequence=0):
+        """Sample the context of ``num_sequences`` sequences.
+
+        Args:
+            num_sequences (int):
+                Number of sequences to sample.
+            first_sequence (int):
+                Position of the first sequence, used to number the sequence keys that are not
+                sampled by the context synthesizer. Defaults to ``0``.
+
+        Returns:
+            pandas.DataFrame:
+                The context of the sequences.
+        """
         if self._sequence_key:
             context_columns = self._context_synthesizer._sample_with_progress_bar(
                 num_sequences,
@@ -404,9 +834,106 @@ class PARSynthesizer(LossValuesMixin, BaseSynthesizer):
 
         for column in self._sequence_key or []:
             if column not in context_columns:
-                context_columns[column] = range(len(context_columns))
+                context_columns[column] = range(
+                    first_sequence, first_sequence + len(context_columns))
+
+        return context_columns
+
+    def _sample_with_n_jobs(self, context, sequence_length, n_jobs, show_progress_bar=True):
+        num_workers = _get_num_workers(n_jobs, len(context))
+        if num_workers > 1 and self._model.device.type == 'cpu':
+            return self._sample_in_shards(
+                context, sequence_length, num_workers, show_progress_bar)
+
+        return self._sample(context, sequence_length, show_progress_bar)
+
+    def sample_in_chunks(self, num_sequences, sequence_length=None, chunk_size=10000,
+                         n_jobs=1):
+        """Sample new sequences in chunks of complete sequences.
+
+        The context of every chunk is sampled right before its sequences, so only the rows of
+        one chunk are kept in memory at a time. A sequence is never split across chunks.
+
+        Args:
+            num_sequences (int):
+                Number of sequences to sample.
+            sequence_length (int):
+                If passed, sample sequences of this length. If ``None``, the sequence length will
+                be sampled from the model.
+            chunk_size (int):
+                Maximum number of sequences in every chunk. Defaults to ``10000``.
+            n_jobs (int):
+                Number of worker processes used to sample the sequences of every chunk. If
+                ``-1``, use all the available CPUs. Defaults to ``1``.
+
+        Returns:
+            generator:
+                Generator of tables containing the sampled sequences of every chunk in the
+                same format as the fitted data.
+        """
+        _validate_n_jobs(n_jobs)
+        if isinstance(chunk_size, bool) or not isinstance(chunk_size, int) or chunk_size < 1:
+            raise SynthesizerInputError(
+                f"Invalid value '{chunk_size}' for parameter 'chunk_size'. Please provide a "
+                'positive integer.'
+            )
+
+        return self._sample_chunks(num_sequences, sequence_length, chunk_size, n_jobs)
+
+    def _sample_chunks(self, num_sequences, sequence_length, chunk_size, n_jobs):
+        should_disable = not self._model_kwargs['verbose']
+        with tqdm.tqdm(total=num_sequences, disable=should_disable) as progress_bar:
+            for first_sequence in range(0, num_sequences, chunk_size):
+                num_chunk_sequences = min(chunk_size, num_sequences - first_sequence)
+                context = self._sample_context(num_chunk_sequences, first_sequence)
+                sampled = self._sample_with_n_jobs(
+                    context, sequence_length, n_jobs, show_progress_bar=False)
+                progress_bar.update(num_chunk_sequences)
+                yield sampled
+
+    def sample_to_file(self, num_sequences, output_file_path, sequence_length=None,
+                       chunk_size=10000, n_jobs=1):
+        """Sample new sequences and write them to a CSV or Parquet file.
+
+        The sequences are sampled with ``sample_in_chunks`` and every chunk is appended to the
+        file as soon as it is sampled, so the memory used does not grow with the number of
+        sequences. If the path ends in ``.parquet``, every chunk is written as a row group of
+        a Parquet file. Otherwise, the chunks are written as CSV.
+
+        Args:
+            num_sequences (int):
+                Number of sequences to sample.
+            output_file_path (str):
+                The file to write the sampled sequences to. It must not exist.
+            sequence_length (int):
+                If passed, sample sequences of this length. If ``None``, the sequence length will
+                be sampled from the model.
+            chunk_size (int):
+                Maximum number of sequences in every chunk. Defaults to ``10000``.
+            n_jobs (int):
+                Number of worker processes used to sample the sequences of every chunk. If
+                ``-1``, use all the available CPUs. Defaults to ``1``.
+        """
+        if not output_file_path:
+            raise SynthesizerInputError("Please provide an 'output_file_path'.")
+
+        chunks = self.sample_in_chunks(num_sequences, sequence_length, chunk_size, n_jobs)
+        output_file_path = validate_file_path(output_file_path)
+        try:
+            if output_file_path.endswith('.parquet'):
+                dtypes = self._data_processor._dtypes
+                with ParquetWriter(output_file_path, dtypes) as writer:
+                    for chunk in chunks:
+                        writer.write(chunk)
+
+            else:
+                header = True
+                for chunk in chunks:
+                    chunk.to_csv(output_file_path, mode='a', header=header, index=False)
+                    header = False
 
-        return self._sample(context_columns, sequence_length)
+        except (Exception, KeyboardInterrupt) as error:
+            handle_sampling_error(False, output_file_path, error)
 
     def sample_sequential_columns(self, context_columns, sequence_length=None):
         """Sample the sequential columns based ont he provided context columns.
@@ -431,9 +958,8 @@ class PARSynthesizer(LossValuesMixin, BaseSynthesizer):
         condition_columns = list(set.intersection(
             set(context_columns.columns), set(self._context_synthesizer._model.columns)
         ))
-        condition_columns = context_columns[condition_columns].to_dict('records')
         context = self._context_synthesizer.sample_from_conditions(
-            [Condition(conditions) for conditions in condition_columns]
+            [BatchConditions(context_columns[condition_columns])]
         )
         context.update(context_columns)
         return self._sample(context, sequence_length)
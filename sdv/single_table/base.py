@@ -10,6 +10,8 @@ import os
 import uuid
 import warnings
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
 
 import cloudpickle
 import copulas
@@ -20,11 +22,14 @@ from copulas.multivariate import GaussianMultivariate
 
 from sdv import version
 from sdv._utils import (
-    _groupby_list, check_sdv_versions_and_warn, check_synthesizer_version, generate_synthesizer_id)
+    _get_num_workers, _groupby_list, _validate_n_jobs, check_sdv_versions_and_warn,
+    check_synthesizer_version, generate_synthesizer_id)
 from sdv.constraints.errors import AggregateConstraintsError
 from sdv.data_processing.data_processor import DataProcessor
 from sdv.errors import ConstraintsNotMetError, InvalidDataError, SynthesizerInputError
 from sdv.logging.utils import get_sdv_logger
+from sdv.sampling.reject_sampling import RejectSamplingController
+from sdv.sampling.tabular import BatchConditions
 from sdv.single_table.utils import check_num_rows, handle_sampling_error, validate_file_path
 
 LOGGER = logging.getLogger(__name__)
@@ -35,6 +40,29 @@ FIXED_RNG_SEED = 73251
 TMP_FILE_NAME = '.sample.csv.temp'
 DISABLE_TMP_FILE = 'disable'
 
+# Synthesizer used by the current sampling worker process
+_worker_synthesizer = None
+
+
+def _get_seed_sequence(random_state):
+    """Get a ``numpy.random.SeedSequence`` with the entropy of the given random state."""
+    if isinstance(random_state, tuple):
+        random_state = random_state[0]
+
+    if isinstance(random_state, np.random.RandomState):
+        random_state = random_state.get_state()[1]
+
+    return np.random.SeedSequence(random_state)
+
+
+def _initialize_sampling_worker(synthesizer):
+    global _worker_synthesizer
+    _worker_synthesizer = synthesizer
+
+
+def _sample_batch_in_worker(seed, batch_size, max_tries_per_batch):
+    return _worker_synthesizer._sample_seeded_batch(seed, batch_size, max_tries_per_batch)
+
 
 class BaseSynthesizer:
     """Base class for all ``Synthesizers``.
@@ -106,6 +134,8 @@ class BaseSynthesizer:
         )
         self._fitted = False
         self._random_state_set = False
+        self._seed_sequence = None
+        self._reject_sampling = RejectSamplingController()
         self._update_default_transformers()
         self._creation_date = datetime.datetime.today().strftime('%Y-%m-%d')
         self._fitted_date = None
@@ -339,6 +369,13 @@ class BaseSynthesizer:
 
         return ordered_field_transformers
 
+    def _get_reject_sampling(self):
+        # Synthesizers saved before the controller existed do not have it
+        if getattr(self, '_reject_sampling', None) is None:
+            self._reject_sampling = RejectSamplingController()
+
+        return self._reject_sampling
+
     def get_info(self):
         """Get dictionary with information regarding the synthesizer.
 
@@ -350,6 +387,9 @@ class BaseSynthesizer:
                 * ``last_fit_date``: date for the last time it was fit.
                 * ``fitted_sdv_version``: version of sdv it was on when fitted.
                 * ``fitted_sdv_enterprise_version``: version of sdv enterprsie if available.
+                * ``acceptance_rates``: fraction of the rows sampled since the last fit that
+                  were valid, for every set of condition columns. Only if any rows have been
+                  sampled.
         """
         info = {
             'class_name': self.__class__.__name__,
@@ -361,6 +401,10 @@ class BaseSynthesizer:
         if self._fitted_sdv_enterprise_version is not None:
             info['fitted_sdv_enterprise_version'] = self._fitted_sdv_enterprise_version
 
+        acceptance_rates = self._get_reject_sampling().to_dict()
+        if acceptance_rates:
+            info['acceptance_rates'] = acceptance_rates
+
         return info
 
     def _preprocess(self, data):
@@ -423,6 +467,7 @@ class BaseSynthesizer:
         if not processed_data.empty:
             self._fit(processed_data)
 
+        self._reject_sampling = RejectSamplingController()
         self._fitted = True
         self._fitted_date = datetime.datetime.today().strftime('%Y-%m-%d')
         self._fitted_sdv_version = getattr(version, 'public', None)
@@ -456,6 +501,7 @@ class BaseSynthesizer:
         self._fitted = False
         self._data_processor.reset_sampling()
         self._random_state_set = False
+        self._seed_sequence = None
         processed_data = self._preprocess(data)
         self.fit_processed_data(processed_data)
 
@@ -524,17 +570,21 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
     def _set_random_state(self, random_state):
         """Set the random state of the model's random number generator.
 
+        The seeds of the batches sampled in parallel are also spawned from this random state.
+
         Args:
             random_state (int, tuple[np.random.RandomState, torch.Generator], or None):
                 Seed or tuple of random states to use.
         """
         self._model.set_random_state(random_state)
         self._random_state_set = True
+        self._seed_sequence = _get_seed_sequence(random_state)
 
     def reset_sampling(self):
         """Reset the sampling to the state that was left right after fitting."""
         self._data_processor.reset_sampling()
         self._random_state_set = False
+        self._seed_sequence = None
 
     @staticmethod
     def _filter_conditions(sampled, conditions, float_rtol):
@@ -578,6 +628,9 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         If condition columns are float values, consider a match anything that
         is closer than the given ``float_rtol`` and then make the value exact.
 
+        The anonymized columns, keys and columns not used by the constraints or conditions
+        are only reverse transformed for the valid rows.
+
         If the model does not have any data columns, the result of this call
         is a dataframe of the requested length with no columns in it.
 
@@ -594,7 +647,8 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
             float_rtol (float):
                 Maximum tolerance when considering a float match.
             previous_rows (pandas.DataFrame):
-                Valid rows sampled in the previous iterations.
+                Valid rows sampled in the previous iterations. They are not validated again,
+                only prepended to the new valid rows.
             keep_extra_columns (bool):
                 Whether to keep extra columns from the sampled data. Defaults to False.
 
@@ -619,22 +673,26 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
                 except NotImplementedError:
                     raw_sampled = self._sample(num_rows)
 
-            sampled = self._data_processor.reverse_transform(raw_sampled)
+            condition_columns = None
+            filter_conditions = None
+            if conditions is not None:
+                condition_columns = list(conditions)
+                filter_conditions = functools.partial(
+                    self._filter_conditions, conditions=conditions, float_rtol=float_rtol)
+
+            sampled = self._data_processor.reverse_transform_valid(
+                raw_sampled, condition_columns, filter_conditions)
             if keep_extra_columns:
                 input_columns = self._data_processor._hyper_transformer._input_columns
                 missing_cols = list(
                     set(raw_sampled.columns) - set(input_columns) - set(sampled.columns)
                 )
-                sampled = pd.concat([sampled, raw_sampled[missing_cols]], axis=1)
+                extra_columns = raw_sampled.loc[sampled.index, missing_cols]
+                sampled = pd.concat([sampled, extra_columns], axis=1)
 
             if previous_rows is not None:
                 sampled = pd.concat([previous_rows, sampled], ignore_index=True)
 
-            sampled = self._data_processor.filter_valid(sampled)
-
-            if conditions is not None:
-                sampled = self._filter_conditions(sampled, conditions, float_rtol)
-
             num_valid = len(sampled)
 
             return sampled, num_valid
@@ -652,7 +710,12 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         This will enter a reject-sampling loop in which rows will be sampled until
         all of them are valid and match the requested conditions. If ``max_tries``
         is exceeded, it will return as many rows as it has sampled, which may be less
-        than the target number of rows.
+        than the target number of rows. Only the newly sampled rows are validated in
+        every iteration, and the valid ones are concatenated once at the end.
+
+        The number of rows to sample in every iteration is chosen from the acceptance rate
+        observed for the same conditions since the synthesizer was fitted, so that the batch
+        is usually completed in one or two iterations.
 
         Input conditions is taken both in the raw input format, which will be used
         for filtering during the reject-sampling loop, and already transformed
@@ -692,33 +755,34 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
             pandas.DataFrame:
                 Sampled data.
         """
-        num_rows_to_sample = batch_size
+        reject_sampling = self._get_reject_sampling()
+        num_rows_to_sample = reject_sampling.get_num_rows_to_sample(
+            batch_size, batch_size, conditions)
 
         counter = 0
         num_valid = 0
-        prev_num_valid = None
         remaining = batch_size
-        sampled = pd.DataFrame()
+        valid_chunks = []
 
         while num_valid < batch_size and counter < max_tries:
-            prev_num_valid = num_valid
-            sampled, num_valid = self._sample_rows(
+            new_rows, num_new_valid_rows = self._sample_rows(
                 num_rows_to_sample,
                 conditions,
                 transformed_conditions,
                 float_rtol,
-                sampled,
+                None,
                 keep_extra_columns
             )
 
-            num_new_valid_rows = num_valid - prev_num_valid
+            valid_chunks.append(new_rows)
+            num_valid += num_new_valid_rows
+            reject_sampling.update(conditions, num_rows_to_sample, num_new_valid_rows)
             num_increase = min(num_new_valid_rows, remaining)
-            num_sampled = min(len(sampled), batch_size)
             if num_increase > 0:
                 if output_file_path:
                     append_kwargs = {'mode': 'a', 'header': False}
                     append_kwargs = append_kwargs if os.path.getsize(output_file_path) > 0 else {}
-                    sampled.head(num_sampled).tail(num_increase).to_csv(
+                    new_rows.head(num_increase).to_csv(
                         output_file_path,
                         index=False,
                         **append_kwargs,
@@ -728,8 +792,8 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
                     progress_bar.update(num_increase)
 
             remaining = batch_size - num_valid
-            valid_rate = max(num_new_valid_rows, 1) / max(num_rows_to_sample, 1)
-            num_rows_to_sample = min(10 * batch_size, int(remaining / valid_rate))
+            num_rows_to_sample = reject_sampling.get_num_rows_to_sample(
+                remaining, batch_size, conditions)
 
             if remaining > 0:
                 LOGGER.info(
@@ -737,37 +801,77 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
 
             counter += 1
 
+        if not valid_chunks:
+            return pd.DataFrame()
+
+        sampled = pd.concat(valid_chunks, ignore_index=True)
         return sampled.head(min(len(sampled), batch_size))
 
     @staticmethod
     def _make_condition_dfs(conditions):
         """Transform ``conditions`` into a list of dataframes.
 
+        The conditions are grouped by their columns and every group is built as a single
+        dataframe, where every condition is repeated as many times as rows to generate.
+
         Args:
-            conditions (list[sdv.sampling.Condition]):
+            conditions (list[sdv.sampling.Condition or sdv.sampling.BatchConditions]):
                 A list of ``sdv.sampling.Condition``, where each ``Condition`` object
                 represents a desired column value mapping and the number of rows
-                to generate for that condition.
+                to generate for that condition, or ``sdv.sampling.BatchConditions``,
+                which represent many of them at once.
 
         Returns:
             list[pandas.DataFrame]:
                 A list of ``conditions`` as dataframes.
         """
-        condition_dataframes = defaultdict(list)
+        grouped_conditions = defaultdict(list)
         for condition in conditions:
-            column_values = condition.get_column_values()
-            condition_dataframes[tuple(column_values.keys())].append(
-                pd.DataFrame(column_values, index=range(condition.get_num_rows())))
-
-        return [
-            pd.concat(condition_list, ignore_index=True)
-            for condition_list in condition_dataframes.values()
-        ]
-
-    def _sample_in_batches(self, num_rows, batch_size, max_tries_per_batch, conditions=None,
-                           transformed_conditions=None, float_rtol=0.01, progress_bar=None,
-                           output_file_path=None):
-        sampled = []
+            if isinstance(condition, BatchConditions):
+                columns = tuple(condition.get_column_values().columns)
+                grouped_conditions[columns].append(condition)
+            else:
+                column_values = condition.get_column_values()
+                group = grouped_conditions[tuple(column_values)]
+                if not group or isinstance(group[-1], BatchConditions):
+                    group.append([])
+
+                group[-1].append((column_values, condition.get_num_rows()))
+
+        condition_dataframes = []
+        for columns, group in grouped_conditions.items():
+            dataframes = []
+            for batch in group:
+                if isinstance(batch, BatchConditions):
+                    dataframes.append(batch.to_dataframe())
+                    continue
+
+                column_values = pd.DataFrame({
+                    column: [values[column] for values, _ in batch]
+                    for column in columns
+                }, index=range(len(batch)))
+                num_rows = [num_rows for _, num_rows in batch]
+                positions = np.repeat(np.arange(len(batch)), num_rows)
+                dataframes.append(column_values.take(positions))
+
+            condition_dataframes.append(pd.concat(dataframes, ignore_index=True))
+
+        return condition_dataframes
+
+    def _iter_batches(self, num_rows, batch_size, max_tries_per_batch, conditions=None,
+                      transformed_conditions=None, float_rtol=0.01, progress_bar=None,
+                      output_file_path=None):
+        """Sample ``num_rows`` in batches of ``batch_size``, yielding one batch at a time.
+
+        The index of every batch continues the one of the previous batch, and the rows
+        beyond ``num_rows`` are dropped, so concatenating all the batches gives the same
+        result as sampling all the rows at once.
+
+        Yields:
+            pandas.DataFrame:
+                The valid rows sampled in every batch.
+        """
+        num_sampled = 0
         batch_size = batch_size if num_rows > batch_size else num_rows
         for step in range(math.ceil(num_rows / batch_size)):
             sampled_rows = self._sample_batch(
@@ -779,11 +883,158 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
                 progress_bar=progress_bar,
                 output_file_path=output_file_path,
             )
-            sampled.append(sampled_rows)
+            sampled_rows = sampled_rows.head(num_rows - num_sampled)
+            sampled_rows.index = pd.RangeIndex(num_sampled, num_sampled + len(sampled_rows))
+            num_sampled += len(sampled_rows)
+            yield sampled_rows
 
+    def _sample_in_batches(self, num_rows, batch_size, max_tries_per_batch, conditions=None,
+                           transformed_conditions=None, float_rtol=0.01, progress_bar=None,
+                           output_file_path=None):
+        sampled = list(self._iter_batches(
+            num_rows=num_rows,
+            batch_size=batch_size,
+            max_tries_per_batch=max_tries_per_batch,
+            conditions=conditions,
+            transformed_conditions=transformed_conditions,
+            float_rtol=float_rtol,
+            progress_bar=progress_bar,
+            output_file_path=output_file_path
+        ))
         sampled = pd.concat(sampled, ignore_index=True) if len(sampled) > 0 else pd.DataFrame()
         return sampled.head(num_rows)
 
+    def _sample_seeded_batch(self, seed, batch_size, max_tries_per_batch):
+        """Sample a batch after seeding the model and the reverse transformers with ``seed``."""
+        if self._model:
+            self._model.set_random_state(seed)
+            self._random_state_set = True
+
+        for transformer in self._data_processor._hyper_transformer.field_transformers.values():
+            if transformer:
+                transformer.set_random_state(np.random.RandomState(seed), 'reverse_transform')
+
+        return self._sample_batch(batch_size=batch_size, max_tries=max_tries_per_batch)
+
+    def _sample_seeded_batches(self, seeds, batch_size, max_tries_per_batch):
+        """Sample a batch for every seed in this process, as a worker process would.
+
+        The batches are reverse transformed with a copy of the ``HyperTransformer``, and the
+        random state of the model is restored after every batch, so sampling them does not
+        change the rows sampled afterwards.
+        """
+        data_processor = self._data_processor
+        hyper_transformer = data_processor._hyper_transformer
+        batches_hyper_transformer = deepcopy(hyper_transformer)
+        random_state_set = self._random_state_set
+        # Copulas models keep their random state in ``random_state`` and CTGAN in ``random_states``
+        model_random_states = {
+            name: getattr(self._model, name)
+            for name in ('random_state', 'random_states')
+            if hasattr(self._model, name)
+        }
+        for seed in seeds:
+            data_processor._hyper_transformer = batches_hyper_transformer
+            try:
+                batch = self._sample_seeded_batch(seed, batch_size, max_tries_per_batch)
+            finally:
+                data_processor._hyper_transformer = hyper_transformer
+                self._random_state_set = random_state_set
+                for name, model_random_state in model_random_states.items():
+                    setattr(self._model, name, model_random_state)
+
+            yield batch
+
+    def _regenerate_columns(self, sampled):
+        """Generate the primary keys and anonymized columns of ``sampled`` in order.
+
+        The batches sampled in parallel generate these columns independently from each other,
+        so they are generated again for all the rows to continue the sequences of the keys and
+        the anonymized values, as if the rows had been sampled in a single process.
+        """
+        field_transformers = self._data_processor._hyper_transformer.field_transformers
+        column_names = [
+            column for column in sampled.columns
+            if field_transformers.get(column) and field_transformers[column].is_generator()
+        ]
+        if not column_names or sampled.empty:
+            return sampled
+
+        generated = self._data_processor._hyper_transformer.create_anonymized_columns(
+            num_rows=len(sampled),
+            column_names=column_names
+        )
+        for column in column_names:
+            values = generated[column].to_numpy()
+            try:
+                sampled[column] = pd.Series(values, index=sampled.index).astype(
+                    sampled[column].dtype)
+            except (TypeError, ValueError):
+                sampled[column] = values
+
+        return sampled
+
+    def _sample_in_parallel(self, num_rows, batch_size, max_tries_per_batch, n_jobs,
+                            progress_bar=None, output_file_path=None):
+        """Sample ``num_rows`` in batches of ``batch_size`` using ``n_jobs`` processes.
+
+        Every batch is sampled, reverse transformed and filtered by the constraints in a
+        worker process, using its own random state spawned from a ``numpy.random.SeedSequence``
+        of the random state of the synthesizer. The random state of every batch only depends on
+        its position, so the sampled rows are the same regardless of the number of processes.
+        """
+        if self._model and not self._random_state_set:
+            self._set_random_state(FIXED_RNG_SEED)
+
+        num_batches = math.ceil(num_rows / batch_size)
+        if getattr(self, '_seed_sequence', None) is None:
+            self._seed_sequence = np.random.SeedSequence(FIXED_RNG_SEED)
+
+        seeds = [
+            int(seed_sequence.generate_state(1)[0])
+            for seed_sequence in self._seed_sequence.spawn(num_batches)
+        ]
+        num_workers = _get_num_workers(n_jobs, num_batches)
+        if num_workers == 1:
+            batches = self._sample_seeded_batches(seeds, batch_size, max_tries_per_batch)
+            sampled = self._collect_batches(batches, num_rows, progress_bar, output_file_path)
+
+        else:
+            with ProcessPoolExecutor(
+                max_workers=num_workers,
+                initializer=_initialize_sampling_worker,
+                initargs=(self,)
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _sample_batch_in_worker, seed, batch_size, max_tries_per_batch)
+                    for seed in seeds
+                ]
+                batches = (future.result() for future in futures)
+                sampled = self._collect_batches(
+                    batches, num_rows, progress_bar, output_file_path)
+
+        return sampled
+
+    def _collect_batches(self, batches, num_rows, progress_bar=None, output_file_path=None):
+        """Concatenate the sampled batches, in order, into ``num_rows`` rows."""
+        sampled = []
+        num_sampled = 0
+        for batch in batches:
+            batch = self._regenerate_columns(batch.head(num_rows - num_sampled))
+            num_sampled += len(batch)
+            if len(batch) and output_file_path:
+                append_kwargs = {'mode': 'a', 'header': False}
+                append_kwargs = append_kwargs if os.path.getsize(output_file_path) > 0 else {}
+                batch.to_csv(output_file_path, index=False, **append_kwargs)
+
+            if progress_bar is not None:
+                progress_bar.update(len(batch))
+
+            sampled.append(batch)
+
+        return pd.concat(sampled, ignore_index=True) if len(sampled) > 0 else pd.DataFrame()
+
     def _conditionally_sample_rows(self, dataframe, condition, transformed_condition,
                                    max_tries_per_batch=None, batch_size=None, float_rtol=0.01,
                                    graceful_reject_sampling=True, progress_bar=None,
@@ -825,7 +1076,7 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         return sampled_rows
 
     def _sample_with_progress_bar(self, num_rows, max_tries_per_batch=100, batch_size=None,
-                                  output_file_path=None, show_progress_bar=True):
+                                  output_file_path=None, show_progress_bar=True, n_jobs=None):
         if num_rows is None:
             raise ValueError('You must specify the number of rows to sample (e.g. num_rows=100).')
 
@@ -839,13 +1090,23 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         try:
             with tqdm.tqdm(total=num_rows, disable=not show_progress_bar) as progress_bar:
                 progress_bar.set_description('Sampling rows')
-                sampled = self._sample_in_batches(
-                    num_rows=num_rows,
-                    batch_size=batch_size,
-                    max_tries_per_batch=max_tries_per_batch,
-                    progress_bar=progress_bar,
-                    output_file_path=output_file_path
-                )
+                if n_jobs is None:
+                    sampled = self._sample_in_batches(
+                        num_rows=num_rows,
+                        batch_size=batch_size,
+                        max_tries_per_batch=max_tries_per_batch,
+                        progress_bar=progress_bar,
+                        output_file_path=output_file_path
+                    )
+                else:
+                    sampled = self._sample_in_parallel(
+                        num_rows=num_rows,
+                        batch_size=batch_size,
+                        max_tries_per_batch=max_tries_per_batch,
+                        n_jobs=n_jobs,
+                        progress_bar=progress_bar,
+                        output_file_path=output_file_path
+                    )
 
         except (Exception, KeyboardInterrupt) as error:
             handle_sampling_error(output_file_path == TMP_FILE_NAME, output_file_path, error)
@@ -856,7 +1117,8 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
 
         return sampled
 
-    def sample(self, num_rows, max_tries_per_batch=100, batch_size=None, output_file_path=None):
+    def sample(self, num_rows, max_tries_per_batch=100, batch_size=None, output_file_path=None,
+               n_jobs=None):
         """Sample rows from this table.
 
         Args:
@@ -869,11 +1131,19 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
             output_file_path (str or None):
                 The file to periodically write sampled rows to. If None, does not
                 write rows anywhere.
+            n_jobs (int or None):
+                Number of processes used to sample the batches in parallel, or -1 to use all
+                the available CPUs. Every batch uses its own random state, so the sampled rows
+                do not depend on the number of processes. If None, the batches are sampled
+                one after the other using a single random state. Defaults to None.
 
         Returns:
             pandas.DataFrame:
                 Sampled data.
         """
+        if n_jobs is not None:
+            _validate_n_jobs(n_jobs)
+
         sample_timestamp = datetime.datetime.now()
         has_constraints = bool(self._data_processor._constraints)
         has_batches = batch_size is not None and batch_size != num_rows
@@ -884,7 +1154,8 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
             max_tries_per_batch,
             batch_size,
             output_file_path,
-            show_progress_bar=show_progress_bar
+            show_progress_bar=show_progress_bar,
+            n_jobs=n_jobs
         )
 
         SYNTHESIZER_LOGGER.info(
@@ -905,6 +1176,218 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
 
         return sampled_data
 
+    def iter_sample(self, num_rows, batch_size=None, max_tries_per_batch=100):
+        """Sample rows from this table, yielding them in batches.
+
+        Only one batch is kept in memory at a time, which allows sampling more rows than
+        would fit in memory. Every batch is reverse transformed and filtered by the
+        constraints, and concatenating all the batches gives the same rows as calling
+        ``sample`` with the same ``batch_size``.
+
+        Args:
+            num_rows (int):
+                Number of rows to sample. This parameter is required.
+            batch_size (int or None):
+                The number of rows to sample in every batch. Defaults to ``num_rows``, if None.
+            max_tries_per_batch (int):
+                Number of times to retry sampling until the batch size is met. Defaults to 100.
+
+        Yields:
+            pandas.DataFrame:
+                The sampled rows of every batch.
+        """
+        if num_rows is None:
+            raise ValueError('You must specify the number of rows to sample (e.g. num_rows=100).')
+
+        if num_rows == 0:
+            return
+
+        sample_timestamp = datetime.datetime.now()
+        batch_size = min(batch_size, num_rows) if batch_size else num_rows
+        total_rows = 0
+        num_columns = 0
+        for sampled_rows in self._iter_batches(num_rows, batch_size, max_tries_per_batch):
+            total_rows += len(sampled_rows)
+            num_columns = len(sampled_rows.columns)
+            yield sampled_rows
+
+        SYNTHESIZER_LOGGER.info(
+            '\nSample:\n'
+            '  Timestamp: %s\n'
+            '  Synthesizer class name: %s\n'
+            '  Statistics of the sample size:\n'
+            '    Total number of tables: 1\n'
+            '    Total number of rows: %s\n'
+            '    Total number of columns: %s\n'
+            '  Synthesizer id: %s',
+            sample_timestamp,
+            self.__class__.__name__,
+            total_rows,
+            num_columns,
+            self._synthesizer_id,
+        )
+
+    def _can_sample_conditioned_rows(self, transformed_columns=None):
+        """Whether the model can sample rows with different conditions in a single call.
+
+        Synthesizers that return ``True`` must implement ``_sample_conditioned_rows``.
+
+        Args:
+            transformed_columns (list or None):
+                The columns of the conditions, transformed to the model format. If ``None``,
+                only whether the model supports it at all is checked. Defaults to ``None``.
+
+        Returns:
+            bool:
+                Whether ``_sample_conditioned_rows`` can be used.
+        """
+        return False
+
+    def _sample_conditioned_rows(self, transformed_conditions):
+        """Sample one row for each row of conditions from the model.
+
+        Args:
+            transformed_conditions (pandas.DataFrame):
+                The conditioning values of every row, transformed to the model format.
+
+        Returns:
+            pandas.DataFrame:
+                The sampled rows in the model format, with the same index as the conditions.
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def _filter_row_conditions(sampled, conditions, float_rtol):
+        """Filter the sampled rows that match the conditions of their own row.
+
+        Args:
+            sampled (pandas.DataFrame):
+                The sampled rows, reverse transformed.
+            conditions (pandas.DataFrame):
+                The conditioning values, with one row for each index value of ``sampled``.
+            float_rtol (float):
+                Maximum tolerance when considering a float match.
+
+        Returns:
+            pandas.DataFrame:
+                Rows from the sampled data that match their conditions.
+        """
+        expected = conditions.loc[sampled.index]
+        valid = np.ones(len(sampled), dtype=bool)
+        float_columns = []
+        for column in conditions.columns:
+            column_values = sampled[column]
+            values = expected[column]
+            if column_values.dtype.kind == 'f':
+                distance = np.abs(values.to_numpy(dtype=float)) * float_rtol
+                difference = np.abs(column_values.to_numpy() - values.to_numpy(dtype=float))
+                valid &= difference <= distance
+                float_columns.append(column)
+            else:
+                valid &= (column_values == values).to_numpy()
+
+        sampled = sampled[valid].copy()
+        for column in float_columns:
+            sampled[column] = expected.loc[sampled.index, column].to_numpy(dtype=float)
+
+        return sampled
+
+    def _sample_with_row_conditions(self, conditions, condition_columns, max_tries_per_batch,
+                                    batch_size=None, float_rtol=0.01, progress_bar=None,
+                                    output_file_path=None):
+        """Sample rows with a different set of conditioning values for every row.
+
+        Every distinct set of conditioning values is transformed once and the model samples
+        one row per row of conditions in a single call. The rows that are not valid are
+        sampled again until ``max_tries_per_batch`` is reached.
+
+        Args:
+            conditions (pandas.DataFrame):
+                The conditions, with the original index stored in the ``COND_IDX`` column.
+            condition_columns (list):
+                The columns of the conditions.
+            max_tries_per_batch (int):
+                Number of times to retry sampling the rows that are not valid.
+            batch_size (int or None):
+                Maximum number of conditions to sample at once. Defaults to all of them.
+            float_rtol (float):
+                Maximum tolerance when considering a float match. Defaults to 0.01.
+            progress_bar (tqdm.tqdm or None):
+                The progress bar to update.
+            output_file_path (str or None):
+                The file to periodically write sampled rows to.
+
+        Returns:
+            pandas.DataFrame or None:
+                Sampled data, or ``None`` if the model cannot sample these conditions.
+        """
+        # Like the grouped conditions, the rows with missing conditioning values are skipped
+        conditions = conditions[conditions[condition_columns].notna().all(axis=1)]
+        if conditions.empty:
+            return pd.DataFrame()
+
+        raw_conditions = conditions[condition_columns].reset_index(drop=True)
+        condition_codes = raw_conditions.groupby(
+            _groupby_list(condition_columns), sort=False).ngroup().to_numpy()
+        _, first_positions = np.unique(condition_codes, return_index=True)
+        try:
+            transformed_conditions = self._data_processor.transform(
+                raw_conditions.iloc[first_positions],
+                is_condition=True
+            )
+        except ConstraintsNotMetError as error:
+            raise ConstraintsNotMetError(
+                'Provided conditions are not valid for the given constraints.'
+            ) from error
+
+        if transformed_conditions.empty or len(transformed_conditions) != len(first_positions):
+            return None
+
+        transformed_conditions = transformed_conditions.iloc[condition_codes]
+        transformed_conditions.index = raw_conditions.index
+        if not self._can_sample_conditioned_rows(list(transformed_conditions.columns)):
+            return None
+
+        if self._model and not self._random_state_set:
+            self._set_random_state(FIXED_RNG_SEED)
+
+        filter_conditions = functools.partial(
+            self._filter_row_conditions, conditions=raw_conditions, float_rtol=float_rtol)
+        batch_size = batch_size or len(raw_conditions)
+        all_sampled_rows = []
+        for start in range(0, len(raw_conditions), batch_size):
+            remaining = transformed_conditions.iloc[start:start + batch_size]
+            for _ in range(max_tries_per_batch or 100):
+                if remaining.empty:
+                    break
+
+                raw_sampled = self._sample_conditioned_rows(remaining)
+                sampled = self._data_processor.reverse_transform_valid(
+                    raw_sampled, condition_columns, filter_conditions)
+                remaining = remaining[~remaining.index.isin(sampled.index)]
+                if sampled.empty:
+                    continue
+
+                if output_file_path:
+                    append_kwargs = {'mode': 'a', 'header': False}
+                    append_kwargs = append_kwargs if os.path.getsize(output_file_path) > 0 else {}
+                    sampled.to_csv(output_file_path, index=False, **append_kwargs)
+
+                if progress_bar is not None:
+                    progress_bar.update(len(sampled))
+
+                sampled = sampled.copy()
+                sampled[COND_IDX] = conditions[COND_IDX].to_numpy()[sampled.index]
+                all_sampled_rows.append(sampled)
+
+        if not all_sampled_rows:
+            return pd.DataFrame()
+
+        all_sampled_rows = pd.concat(all_sampled_rows)
+        all_sampled_rows = all_sampled_rows.set_index(COND_IDX)
+        all_sampled_rows.index.name = conditions.index.name
+        return all_sampled_rows.sort_index()
+
     def _sample_with_conditions(self, conditions, max_tries_per_batch, batch_size,
                                 progress_bar=None, output_file_path=None):
         """Sample rows with conditions.
@@ -937,6 +1420,14 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         condition_columns = list(conditions.columns)
         conditions.index.name = COND_IDX
         conditions = conditions.reset_index()
+        if self._can_sample_conditioned_rows():
+            sampled = self._sample_with_row_conditions(
+                conditions, condition_columns, max_tries_per_batch, batch_size,
+                progress_bar=progress_bar, output_file_path=output_file_path
+            )
+            if sampled is not None:
+                return sampled
+
         grouped_conditions = conditions.groupby(_groupby_list(condition_columns))
 
         # sample
@@ -1034,10 +1525,11 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         """Sample rows from this table with the given conditions.
 
         Args:
-            conditions (list[sdv.sampling.Condition]):
+            conditions (list[sdv.sampling.Condition] or sdv.sampling.BatchConditions):
                 A list of sdv.sampling.Condition objects, which specify the column
                 values in a condition, along with the number of rows for that
-                condition.
+                condition. ``sdv.sampling.BatchConditions`` objects, which specify many
+                conditions at once as a table, can be used instead of, or together with them.
             max_tries_per_batch (int):
                 Number of times to retry sampling until the batch size is met. Defaults to 100.
             batch_size (int):
@@ -1059,6 +1551,8 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
                     * no rows could be generated.
         """
         output_file_path = validate_file_path(output_file_path)
+        if isinstance(conditions, BatchConditions):
+            conditions = [conditions]
 
         num_rows = functools.reduce(
             lambda num_rows, condition: condition.get_num_rows() + num_rows, conditions, 0)
@@ -1070,15 +1564,18 @@ class BaseSingleTableSynthesizer(BaseSynthesizer):
         try:
             with tqdm.tqdm(total=num_rows) as progress_bar:
                 progress_bar.set_description('Sampling conditions')
-                for condition_dataframe in conditions:
-                    sampled_for_condition = self._sample_with_conditions(
+                sampled_for_conditions = [
+                    self._sample_with_conditions(
                         condition_dataframe,
                         max_tries_per_batch,
                         batch_size,
                         progress_bar,
                         output_file_path,
                     )
-                    sampled = pd.concat([sampled, sampled_for_condition], ignore_index=True)
+                    for condition_dataframe in conditions
+                ]
+                if sampled_for_conditions:
+                    sampled = pd.concat(sampled_for_conditions, ignore_index=True)
 
             is_reject_sampling = bool(
                 hasattr(self, '_model') and not isinstance(self._model, GaussianMultivariate))
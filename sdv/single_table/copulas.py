@@ -10,6 +10,7 @@ import numpy as np
 import pandas as pd
 import scipy
 from copulas import multivariate
+from copulas.multivariate import GaussianMultivariate
 from rdt.transformers import OneHotEncoder
 
 from sdv.errors import NonParametricError
@@ -110,6 +111,8 @@ class GaussianCopulaSynthesizer(BaseSingleTableSynthesizer):
             for field, distribution in self.numerical_distributions.items()
         }
         self._num_rows = None
+        self._conditional_model = None
+        self._conditional_factors = {}
 
     def _fit(self, processed_data):
         """Fit the model to the table.
@@ -167,6 +170,95 @@ class GaussianCopulaSynthesizer(BaseSingleTableSynthesizer):
         """
         return self._model.sample(num_rows, conditions=conditions)
 
+    def _can_sample_conditioned_rows(self, transformed_columns=None):
+        if not isinstance(self._model, GaussianMultivariate):
+            return False
+
+        if transformed_columns is None:
+            return True
+
+        # At least one column must be left to sample from the conditional distribution
+        return set(transformed_columns) < set(self._model.columns)
+
+    def _get_conditional_factors(self, condition_columns):
+        """Get the matrices to sample the other columns conditioned on the given columns.
+
+        The conditional distribution of a multivariate normal is computed as specified here:
+        https://en.wikipedia.org/wiki/Multivariate_normal_distribution#Conditional_distributions
+        The matrices are cached for every set of condition columns until the model changes.
+
+        Args:
+            condition_columns (tuple):
+                The condition columns, in the order of the model columns.
+
+        Returns:
+            tuple:
+                * list: The positions of the columns to sample in the model columns.
+                * numpy.ndarray: The matrix that maps the normal values of the conditions
+                  to the conditional means.
+                * numpy.ndarray: A square root of the conditional covariance matrix.
+        """
+        # Synthesizers saved before the factors were cached do not have the attribute
+        if getattr(self, '_conditional_model', None) is not self._model:
+            self._conditional_model = self._model
+            self._conditional_factors = {}
+
+        if condition_columns not in self._conditional_factors:
+            correlation = self._model.correlation.to_numpy()
+            conditioned = [self._model.columns.index(column) for column in condition_columns]
+            sampled = [
+                position for position in range(len(self._model.columns))
+                if position not in conditioned
+            ]
+            sigma11 = correlation[np.ix_(sampled, sampled)]
+            sigma12 = correlation[np.ix_(sampled, conditioned)]
+            sigma22 = correlation[np.ix_(conditioned, conditioned)]
+            regression = sigma12 @ np.linalg.pinv(sigma22)
+            covariance = sigma11 - regression @ sigma12.T
+            eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+            factor = eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
+            self._conditional_factors[condition_columns] = (sampled, regression, factor)
+
+        return self._conditional_factors[condition_columns]
+
+    def _sample_conditioned_rows(self, transformed_conditions):
+        """Sample one row for each row of conditions in a single pass.
+
+        Args:
+            transformed_conditions (pandas.DataFrame):
+                The conditioning values of every row, transformed to the model format.
+
+        Returns:
+            pandas.DataFrame:
+                The sampled rows in the model format, with the same index as the conditions.
+        """
+        condition_columns = tuple(
+            column for column in self._model.columns if column in transformed_conditions
+        )
+        sampled, regression, factor = self._get_conditional_factors(condition_columns)
+        normal_conditions = self._model._transform_to_normal(
+            transformed_conditions[list(condition_columns)])
+        num_rows = len(transformed_conditions)
+        random_state = self._model.random_state
+        if random_state is None:
+            noise = np.random.standard_normal((num_rows, len(sampled)))
+        else:
+            with copulas.set_random_state(random_state, self._model.set_random_state):
+                noise = np.random.standard_normal((num_rows, len(sampled)))
+
+        samples = normal_conditions @ regression.T + noise @ factor.T
+        output = {
+            column: transformed_conditions[column].to_numpy() for column in condition_columns
+        }
+        for sample_position, position in enumerate(sampled):
+            cdf = scipy.stats.norm.cdf(samples[:, sample_position])
+            column = self._model.columns[position]
+            output[column] = self._model.univariates[position].percent_point(cdf)
+
+        output = {column: output[column] for column in self._model.columns}
+
+        return pd.DataFrame(output, index=transformed_conditions.index)
+
     def _get_valid_columns_from_metadata(self, columns):
         valid_columns = []
         for column in columns:
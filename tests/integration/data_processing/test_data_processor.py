@@ -1,6 +1,7 @@
 """Integration tests for the ``DataProcessor``."""
 import itertools
 import re
+from unittest.mock import Mock
 
 import numpy as np
 import pandas as pd
@@ -10,6 +11,7 @@ from rdt.transformers import (
     UnixTimestampEncoder)
 
 from sdv._utils import _get_datetime_format
+from sdv.constraints import create_custom_constraint_class
 from sdv.data_processing import DataProcessor
 from sdv.data_processing.datetime_formatter import DatetimeFormatter
 from sdv.data_processing.numerical_formatter import NumericalFormatter
@@ -409,3 +411,120 @@ class TestDataProcessor:
         )
         with pytest.raises(SynthesizerInputError, match=error_msg):
             dp.update_transformers({'user_id': UniformEncoder()})
+
+    def _get_fitted_data_processor(self, column_name=None, is_valid_fn=None):
+        data = pd.DataFrame({
+            'user_id': list(range(10)),
+            'email': [f'user{i}@gmail.com' for i in range(10)],
+            'amount': [1, 3, 5, 2, 4, 6, 8, 7, 9, 10],
+            'date': pd.date_range('2020-01-01', periods=10).strftime('%Y-%m-%d'),
+        })
+        metadata = SingleTableMetadata.load_from_dict({
+            'primary_key': 'user_id',
+            'columns': {
+                'user_id': {'sdtype': 'id', 'regex_format': '[0-9]{2}'},
+                'email': {'sdtype': 'email', 'pii': True},
+                'amount': {'sdtype': 'numerical'},
+                'date': {'sdtype': 'datetime', 'datetime_format': '%Y-%m-%d'},
+            }
+        })
+        dp = DataProcessor(metadata, enforce_min_max_values=False)
+        limits = {'minimum': -np.inf}
+        if column_name is not None:
+            dp.add_custom_constraint_class(create_custom_constraint_class(
+                is_valid_fn or (
+                    lambda column_names, data: data[column_names[0]] >= limits['minimum']
+                ),
+            ), 'Minimum')
+            dp.add_constraints([{
+                'constraint_class': 'Minimum',
+                'constraint_parameters': {'column_names': [column_name]},
+            }])
+
+        dp.fit(data)
+        transformed = dp.transform(data)
+        transformed['amount'] = np.arange(-5, 5, dtype=float)
+        return dp, transformed, limits
+
+    def test_reverse_transform_valid(self):
+        """Test that the anonymized columns and keys are only generated for the valid rows."""
+        # Setup
+        dp, transformed, _ = self._get_fitted_data_processor()
+
+        def filter_conditions(data):
+            return data[(data['date'] != '2020-01-08') & (data['amount'] >= 1)]
+
+        expected = filter_conditions(dp.reverse_transform(transformed))
+        dp.reset_sampling()
+
+        # Run
+        result = dp.reverse_transform_valid(
+            transformed,
+            condition_columns=['amount', 'date'],
+            filter_conditions=filter_conditions
+        )
+
+        # Assert
+        assert result['amount'].tolist() == [1, 3, 4]
+        assert result.index.tolist() == [6, 8, 9]
+        assert sorted(result['user_id']) == [0, 1, 2]
+        assert result['email'].notna().all()
+        assert result.columns.tolist() == expected.columns.tolist()
+        assert result.dtypes.to_dict() == expected.dtypes.to_dict()
+        pd.testing.assert_frame_equal(
+            result[['amount', 'date']],
+            expected[['amount', 'date']].loc[[6, 8, 9]]
+        )
+
+    def test_reverse_transform_valid_custom_constraint(self):
+        """Test that all the columns are generated first if there are custom constraints.
+
+        Custom constraints get the whole table, so they can read columns that are not
+        part of their ``column_names``, like the primary key.
+        """
+        # Setup
+        def is_valid(column_names, data):
+            return (data[column_names[0]] >= 1) & data['user_id'].notna()
+
+        dp, transformed, _ = self._get_fitted_data_processor('amount', is_valid)
+
+        # Run
+        result = dp.reverse_transform_valid(transformed)
+
+        # Assert
+        assert result['amount'].tolist() == [1, 2, 3, 4]
+        assert result.index.tolist() == [6, 7, 8, 9]
+        assert result['user_id'].notna().all()
+
+    def test_reverse_transform_valid_custom_constraint_reverse_transforms_once(self):
+        """Test that the data is only reverse transformed once if there are custom constraints."""
+        # Setup
+        def is_valid(column_names, data):
+            return data[column_names[0]] >= 1
+
+        dp, transformed, _ = self._get_fitted_data_processor('amount', is_valid)
+        hyper_transformer = dp._hyper_transformer
+        hyper_transformer.reverse_transform_subset = Mock(
+            wraps=hyper_transformer.reverse_transform_subset)
+        dp.reverse_transform = Mock(wraps=dp.reverse_transform)
+
+        # Run
+        result = dp.reverse_transform_valid(transformed)
+
+        # Assert
+        assert result['amount'].tolist() == [1, 2, 3, 4]
+        hyper_transformer.reverse_transform_subset.assert_called_once()
+        dp.reverse_transform.assert_not_called()
+
+    def test_reverse_transform_valid_constraint_on_key(self):
+        """Test that all the columns are generated first if a constraint depends on a key."""
+        # Setup
+        dp, transformed, limits = self._get_fitted_data_processor('user_id')
+        limits['minimum'] = 3
+
+        # Run
+        result = dp.reverse_transform_valid(transformed)
+
+        # Assert
+        assert sorted(result['user_id']) == [3, 4, 5, 6, 7, 8, 9]
+        assert result['email'].notna().all()
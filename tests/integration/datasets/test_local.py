@@ -1,7 +1,8 @@
 import pandas as pd
 import pytest
 
-from sdv.datasets.local import save_csvs
+from sdv.datasets.local import load_csvs, save_csvs
+from sdv.metadata import MultiTableMetadata
 
 
 @pytest.fixture
@@ -47,3 +48,23 @@ def test_save_csvs(data, tmpdir):
     assert len(folder.listdir()) == 4
     for table in data:
         assert (folder / f'{table}-synthetic.csv').check()
+
+
+@pytest.mark.parametrize('engine', ['c', 'pyarrow'])
+def test_load_csvs_with_metadata(data, tmp_path, engine):
+    """Test that ``load_csvs`` reads the files written by ``save_csvs`` using the metadata."""
+    # Setup
+    data['parent']['date'] = pd.to_datetime(
+        ['2020-01-01', '2020-01-02', None, '2020-01-04', '2020-01-05'])
+    save_csvs(data, tmp_path, to_csv_parameters={'index': False, 'date_format': '%Y/%m/%d'})
+    metadata = MultiTableMetadata()
+    metadata.detect_from_dataframes(data)
+    metadata.update_column('parent', 'date', sdtype='datetime', datetime_format='%Y/%m/%d')
+
+    # Run
+    result = load_csvs(tmp_path, read_csv_parameters={'engine': engine}, metadata=metadata)
+
+    # Assert
+    assert set(result) == set(data)
+    pd.testing.assert_frame_equal(result['parent'], data['parent'])
+    pd.testing.assert_frame_equal(result['grandchild'], data['grandchild'])
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from sdv.io import ParquetWriter, read_parquet, write_parquet
+from sdv.metadata import SingleTableMetadata
+from sdv.single_table import GaussianCopulaSynthesizer
+
+
+def test_parquet_round_trip_with_synthesizer(tmp_path):
+    """Test that the dtypes learned by a synthesizer round trip through Parquet files."""
+    # Setup
+    data = pd.DataFrame({
+        'id': np.arange(100),
+        'count': pd.array([1, None, 3, 4] * 25, dtype='Int64'),
+        'date': pd.date_range('2020-01-01', periods=100, freq='D'),
+        'category': ['a', 'b', 'c', 'd'] * 25,
+        'value': np.linspace(0, 1, 100),
+    })
+    real_path = tmp_path / 'real.parquet'
+    synthetic_path = tmp_path / 'synthetic.parquet'
+    write_parquet(data, real_path)
+    real_data = read_parquet(real_path)
+    metadata = SingleTableMetadata()
+    metadata.detect_from_dataframe(real_data)
+    metadata.update_column('id', sdtype='id')
+    metadata.set_primary_key('id')
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    synthesizer.fit(real_data)
+
+    # Run
+    with ParquetWriter(synthetic_path) as writer:
+        for batch in synthesizer.iter_sample(250, batch_size=100):
+            writer.write(batch)
+
+    synthetic_data = read_parquet(synthetic_path)
+
+    # Assert
+    assert len(synthetic_data) == 250
+    assert synthesizer._data_processor._dtypes.to_dict() == data.dtypes.to_dict()
+    assert synthetic_data.dtypes.to_dict() == data.dtypes.to_dict()
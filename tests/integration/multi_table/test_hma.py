@@ -865,6 +865,61 @@ class TestHMASynthesizer:
         for table_name, table in samples.items():
             assert table['data'].isin(data[table_name]['data']).all()
 
+    def test_hma_sample_all_child_rows(self):
+        """Test that sampling all the child rows at once matches sampling them per parent row."""
+        # Setup
+        rng = np.random.default_rng(0)
+        parent = pd.DataFrame({
+            'parent_ID': range(20),
+            'value': rng.normal(size=20),
+        })
+        child = pd.DataFrame({
+            'child_ID': range(100),
+            'parent_ID': rng.integers(0, 20, 100),
+            'amount': rng.gamma(2, size=100),
+            'category': rng.choice(['a', 'b', 'c'], 100),
+        })
+        metadata = MultiTableMetadata.load_from_dict({
+            'tables': {
+                'parent': {
+                    'primary_key': 'parent_ID',
+                    'columns': {
+                        'parent_ID': {'sdtype': 'id'},
+                        'value': {'sdtype': 'numerical'}
+                    }
+                },
+                'child': {
+                    'primary_key': 'child_ID',
+                    'columns': {
+                        'child_ID': {'sdtype': 'id'},
+                        'parent_ID': {'sdtype': 'id'},
+                        'amount': {'sdtype': 'numerical'},
+                        'category': {'sdtype': 'categorical'}
+                    }
+                }
+            },
+            'relationships': [
+                {
+                    'parent_table_name': 'parent',
+                    'parent_primary_key': 'parent_ID',
+                    'child_table_name': 'child',
+                    'child_foreign_key': 'parent_ID'
+                }
+            ]
+        })
+        synthesizer = HMASynthesizer(metadata)
+        synthesizer.fit({'parent': parent, 'child': child})
+
+        # Run
+        samples = synthesizer.sample()
+        synthesizer.reset_sampling()
+        with patch.object(HMASynthesizer, '_sample_all_child_rows', return_value=None):
+            expected = synthesizer.sample()
+
+        # Assert
+        for table_name, table in samples.items():
+            pd.testing.assert_frame_equal(table, expected[table_name])
+
     def test_hma_one_parent_two_children(self):
         """Test it works on a simple 'child-parent-child' dataset."""
         # Setup
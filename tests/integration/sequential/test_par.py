@@ -4,6 +4,7 @@ import pandas as pd
 from deepecho import load_demo
 
 from sdv.datasets.demo import download_demo
+from sdv.io import read_parquet
 from sdv.metadata import SingleTableMetadata
 from sdv.sequential import PARSynthesizer
 
@@ -97,6 +98,41 @@ def test_column_after_date_complex():
     assert (sampled.notna().sum(axis=1) != 0).all()
 
 
+def test_sample_n_jobs():
+    """Test that the sequences can be sampled in worker processes."""
+    # Setup
+    data, metadata = _get_par_data_and_metadata()
+    model = PARSynthesizer(metadata=metadata, context_columns=['context'], epochs=1)
+    model.fit(data)
+
+    # Run
+    sampled = model.sample(5, sequence_length=2, n_jobs=2)
+
+    # Assert
+    assert sampled.shape == (10, data.shape[1])
+    assert (sampled.dtypes == data.dtypes).all()
+    assert sampled['entity'].nunique() == 5
+    assert (sampled.groupby('entity')['context'].nunique() == 1).all()
+
+
+def test_sample_to_file(tmp_path):
+    """Test that the sequences are written to a Parquet file chunk by chunk."""
+    # Setup
+    data, metadata = _get_par_data_and_metadata()
+    model = PARSynthesizer(metadata=metadata, context_columns=['context'], epochs=1)
+    model.fit(data)
+    filepath = str(tmp_path / 'sequences.parquet')
+
+    # Run
+    model.sample_to_file(5, filepath, sequence_length=2, chunk_size=2)
+
+    # Assert
+    sampled = read_parquet(filepath)
+    assert sampled.shape == (10, data.shape[1])
+    assert (sampled.dtypes == data.dtypes).all()
+    assert sampled['entity'].nunique() == 5
+
+
 def test_save_and_load(tmp_path):
     """Test that synthesizers can be saved and loaded properly."""
     # Setup
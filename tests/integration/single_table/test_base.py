@@ -15,7 +15,7 @@ from sdv import version
 from sdv.datasets.demo import download_demo
 from sdv.errors import SynthesizerInputError, VersionError
 from sdv.metadata import SingleTableMetadata
-from sdv.sampling import Condition
+from sdv.sampling import BatchConditions, Condition
 from sdv.single_table import (
     CopulaGANSynthesizer, CTGANSynthesizer, GaussianCopulaSynthesizer, TVAESynthesizer)
 from sdv.single_table.base import BaseSingleTableSynthesizer
@@ -83,6 +83,100 @@ def test_conditional_sampling_graceful_reject_sampling_true_dataframe(synthesize
         synthesizer.sample_remaining_columns(conditions)
 
 
+@pytest.mark.parametrize('synthesizer', SYNTHESIZERS)
+def test_iter_sample(synthesizer):
+    """Test that the batches yielded by ``iter_sample`` match the rows of ``sample``."""
+    # Setup
+    data = pd.DataFrame({
+        'column1': list(range(100)),
+        'column2': list(range(100)),
+        'column3': list(range(100))
+    })
+    synthesizer.fit(data)
+
+    # Run
+    batches = list(synthesizer.iter_sample(250, batch_size=100))
+    synthesizer.reset_sampling()
+    expected = synthesizer.sample(250, batch_size=100)
+
+    # Assert
+    assert [len(batch) for batch in batches] == [100, 100, 50]
+    pd.testing.assert_frame_equal(pd.concat(batches), expected)
+
+
+@pytest.mark.parametrize('synthesizer', SYNTHESIZERS)
+def test_sample_n_jobs(synthesizer):
+    """Test that sampling in parallel gives the same rows regardless of the number of jobs."""
+    # Setup
+    data = pd.DataFrame({
+        'column1': list(range(100)),
+        'column2': list(range(100)),
+        'column3': list(range(100))
+    })
+    synthesizer.fit(data)
+
+    # Run
+    sampled_one_job = synthesizer.sample(250, batch_size=100, n_jobs=1)
+    synthesizer.reset_sampling()
+    sampled_two_jobs = synthesizer.sample(250, batch_size=100, n_jobs=2)
+    sampled_again = synthesizer.sample(250, batch_size=100, n_jobs=2)
+
+    # Assert
+    assert len(sampled_one_job) == 250
+    pd.testing.assert_frame_equal(sampled_one_job, sampled_two_jobs)
+    assert not sampled_again.equals(sampled_two_jobs)
+
+
+@pytest.mark.parametrize('synthesizer', SYNTHESIZERS)
+def test_sample_n_jobs_random_state(synthesizer):
+    """Test that the rows sampled in parallel depend on the random state of the synthesizer."""
+    # Setup
+    data = pd.DataFrame({
+        'column1': list(range(100)),
+        'column2': list(range(100)),
+        'column3': list(range(100))
+    })
+    synthesizer.fit(data)
+
+    # Run
+    synthesizer._set_random_state(1)
+    sampled_one_job = synthesizer.sample(250, batch_size=100, n_jobs=1)
+    synthesizer._set_random_state(1)
+    sampled_two_jobs = synthesizer.sample(250, batch_size=100, n_jobs=2)
+    synthesizer._set_random_state(2)
+    sampled_other_seed = synthesizer.sample(250, batch_size=100, n_jobs=2)
+
+    # Assert
+    pd.testing.assert_frame_equal(sampled_one_job, sampled_two_jobs)
+    assert not sampled_other_seed.equals(sampled_two_jobs)
+
+
+def test_sample_n_jobs_keeps_sampling_state():
+    """Test that sampling the batches in this process leaves the same state as in workers."""
+    # Setup
+    data = pd.DataFrame({
+        'id': list(range(100)),
+        'column1': np.linspace(0, 1, 100),
+    })
+    metadata = SingleTableMetadata()
+    metadata.detect_from_dataframe(data)
+    metadata.update_column('id', sdtype='id')
+    metadata.set_primary_key('id')
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    synthesizer.fit(data)
+
+    # Run
+    sampled_two_jobs = synthesizer.sample(50, batch_size=20, n_jobs=2)
+    following_two_jobs = synthesizer.sample(50)
+    synthesizer.reset_sampling()
+    sampled_one_job = synthesizer.sample(50, batch_size=20, n_jobs=1)
+    following_one_job = synthesizer.sample(50)
+
+    # Assert
+    pd.testing.assert_frame_equal(sampled_one_job, sampled_two_jobs)
+    pd.testing.assert_frame_equal(following_one_job, following_two_jobs)
+
+
 def test_sample_from_conditions_with_batch_size():
     """Test the ``sample_from_conditions`` method with a different ``batch_size``.
 
@@ -153,6 +247,39 @@ def test_sample_from_conditions_negative_float():
     pd.testing.assert_series_equal(sampled_data['column1'], expected)
 
 
+def test_sample_from_conditions_batch_conditions():
+    """Test that ``BatchConditions`` and ``Condition`` objects can be sampled together."""
+    # Setup
+    data = pd.DataFrame({
+        'column1': list(range(100)),
+        'column2': list(range(100)),
+        'column3': ['a', 'b', 'c', 'd'] * 25
+    })
+
+    metadata = SingleTableMetadata()
+    metadata.add_column('column1', sdtype='numerical')
+    metadata.add_column('column2', sdtype='numerical')
+    metadata.add_column('column3', sdtype='categorical')
+
+    model = GaussianCopulaSynthesizer(metadata)
+    model.fit(data)
+    batch = BatchConditions(pd.DataFrame({
+        'column3': ['a', 'b', 'c'],
+        'count': [30, 0, 20],
+    }), num_rows_column='count')
+    conditions = [Condition({'column3': 'd'}, num_rows=5), batch]
+
+    # Run
+    sampled_data = model.sample_from_conditions(conditions, batch_size=10)
+    batch_sampled_data = model.sample_from_conditions(batch)
+
+    # Assert
+    expected = pd.Series(['d'] * 5 + ['a'] * 30 + ['c'] * 20, name='column3')
+    pd.testing.assert_series_equal(sampled_data['column3'], expected)
+    expected_batch = pd.Series(['a'] * 30 + ['c'] * 20, name='column3')
+    pd.testing.assert_series_equal(batch_sampled_data['column3'], expected_batch)
+
+
 def test_sample_from_conditions_with_nans():
     """Test it crashes when condition has nans (GH#1758)."""
     # Setup
@@ -282,7 +409,7 @@ def test_multiple_fits():
     model.fit(data_2)
 
     # Assert
-    assert ('SF', 'CA') not in model._data_processor._constraints[0]._combinations_to_uuids
+    assert ('SF', 'CA') not in model._data_processor._constraints[0]._combinations_index
     assert model._data_processor.formatters['measurement']._rounding_digits == 1
 
 
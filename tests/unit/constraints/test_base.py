@@ -13,6 +13,7 @@ from sdv.constraints.errors import (
     AggregateConstraintsError, ConstraintMetadataError, MissingConstraintColumnError)
 from sdv.constraints.tabular import FixedCombinations
 from sdv.errors import ConstraintsNotMetError
+from sdv.sampling.reject_sampling import RejectSamplingController
 
 
 def test__get_qualified_name_class():
@@ -867,6 +868,48 @@ class TestColumnsModel:
         pd.testing.assert_frame_equal(expected_call_1, constraint.is_valid.call_args_list[0][0][0])
         pd.testing.assert_frame_equal(expected_call_2, constraint.is_valid.call_args_list[1][0][0])
 
+    def test__reject_sample_uses_previous_acceptance_rate(self):
+        """Test that the first round oversamples using the rate of the previous calls."""
+        # Setup
+        constraint = Mock()
+        constraint.is_valid.side_effect = lambda x: pd.Series(x['a'] > 0, index=x.index)
+        instance = ColumnsModel(constraint, ['a', 'b'])
+        instance._reject_sampling.update({'b': 1}, 10, 5)
+        instance._hyper_transformer = Mock()
+        instance._hyper_transformer.reverse_transform = lambda x: x
+        instance._model = Mock()
+        instance._model.sample.return_value = pd.DataFrame({'a': [1, -1] * 9, 'b': [1] * 18})
+
+        # Run
+        result = instance._reject_sample(num_rows=5, conditions={'b': 1})
+
+        # Assert
+        instance._model.sample.assert_called_once_with(num_rows=17, conditions={'b': 1})
+        pd.testing.assert_frame_equal(result, pd.DataFrame({
+            'a': [1] * 5,
+            'b': [1] * 5
+        }, index=[0, 2, 4, 6, 8]))
+
+    def test__reject_sample_without_reject_sampling(self):
+        """Test that a ``ColumnsModel`` pickled without the controller can still sample."""
+        # Setup
+        constraint = Mock()
+        constraint.is_valid.side_effect = lambda x: pd.Series(x['a'] > 0, index=x.index)
+        instance = ColumnsModel(constraint, ['a', 'b'])
+        del instance._reject_sampling
+        instance._hyper_transformer = Mock()
+        instance._hyper_transformer.reverse_transform = lambda x: x
+        instance._model = Mock()
+        instance._model.sample.return_value = pd.DataFrame({'a': [1, 2, 3], 'b': [1, 1, 1]})
+
+        # Run
+        result = instance._reject_sample(num_rows=3, conditions={'b': 1})
+
+        # Assert
+        instance._model.sample.assert_called_once_with(num_rows=3, conditions={'b': 1})
+        pd.testing.assert_frame_equal(result, pd.DataFrame({'a': [1, 2, 3], 'b': [1, 1, 1]}))
+        assert isinstance(instance._reject_sampling, RejectSamplingController)
+
     def test__reject_sampling_duplicates_valid_rows(self):
         """Test the ``Constraint.transform`` method's reject sampling fall back.
 
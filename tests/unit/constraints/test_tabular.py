@@ -848,10 +848,11 @@ class TestFixedCombinations():
         out = instance.transform(table_data)
 
         # Assert
-        assert instance._combinations_to_uuids is not None
-        assert instance._uuids_to_combinations is not None
+        assert instance._combinations_index is not None
+        assert instance._combination_labels is not None
         expected_out_a = pd.Series(['a', 'b', 'c'], name='a')
         pd.testing.assert_series_equal(expected_out_a, out['a'])
+        assert out[instance._joint_column].tolist() == ['0', '1', '2']
 
     def test_transform_non_string(self):
         """Test the ``FixedCombinations.transform`` method with non strings.
@@ -861,7 +862,7 @@ class TestFixedCombinations():
         Input:
         - Table data (pandas.DataFrame)
         Output:
-        - Table data transformed, with the columns as UUIDs.
+        - Table data transformed, with the columns as combination labels.
         Side effects:
         - Since the ``transform`` method needs ``self._joint_column``, method ``fit``
         must be called as well.
@@ -881,10 +882,11 @@ class TestFixedCombinations():
         out = instance.transform(table_data)
 
         # Assert
-        assert instance._combinations_to_uuids is not None
-        assert instance._uuids_to_combinations is not None
+        assert instance._combinations_index is not None
+        assert instance._combination_labels is not None
         expected_out_a = pd.Series(['a', 'b', 'c'], name='a')
         pd.testing.assert_series_equal(expected_out_a, out['a'])
+        assert out[instance._joint_column].tolist() == ['0', '1', '2']
 
     def test_transform_not_all_columns_provided(self):
         """Test the ``FixedCombinations.transform`` method.
@@ -939,8 +941,8 @@ class TestFixedCombinations():
         out = instance.reverse_transform(transformed_data)
 
         # Assert
-        assert instance._combinations_to_uuids is not None
-        assert instance._uuids_to_combinations is not None
+        assert instance._combinations_index is not None
+        assert instance._combination_labels is not None
         expected_out = pd.DataFrame({
             'a': ['a', 'b', 'c'],
             'b': ['d', 'e', 'f'],
@@ -948,6 +950,40 @@ class TestFixedCombinations():
         })
         pd.testing.assert_frame_equal(expected_out, out)
 
+    def test_reverse_transform_fitted_with_uuids(self):
+        """Test a constraint fitted with uuid labels before the combinations were indexed."""
+        # Setup
+        table_data = pd.DataFrame({
+            'a': ['a', 'b', 'c', 'd'],
+            'b': ['d', 'e', 'd', 'x'],
+            'c': ['g', 'h', 'g', 'y']
+        })
+        instance = FixedCombinations(column_names=['b', 'c'])
+        instance._joint_column = 'b#c'
+        instance._combinations = table_data.loc[[0, 1], ['b', 'c']].set_index(pd.Index([5, 7]))
+        instance._combinations_to_uuids = {('d', 'g'): 'uuid-0', ('e', 'h'): 'uuid-1'}
+        instance._uuids_to_combinations = {'uuid-0': ('d', 'g'), 'uuid-1': ('e', 'h')}
+        instance.fitted = True
+
+        # Run
+        is_valid = instance.is_valid(table_data)
+        transformed_data = instance.transform(table_data.iloc[:3])
+        out = instance.reverse_transform(pd.DataFrame({
+            'a': ['a', 'b'],
+            'b#c': ['uuid-1', 'uuid-0'],
+        }))
+
+        # Assert
+        pd.testing.assert_series_equal(
+            is_valid, pd.Series([True, True, True, False], name='b#c'))
+        assert transformed_data['b#c'].tolist() == ['uuid-0', 'uuid-1', 'uuid-0']
+        expected_out = pd.DataFrame({
+            'a': ['a', 'b'],
+            'b': ['e', 'd'],
+            'c': ['h', 'g']
+        })
+        pd.testing.assert_frame_equal(expected_out, out)
+
     def test_reverse_transform_non_string(self):
         """Test the ``FixedCombinations.reverse_transform`` method with a non string column.
 
@@ -977,8 +1013,8 @@ class TestFixedCombinations():
         out = instance.reverse_transform(transformed_data)
 
         # Assert
-        assert instance._combinations_to_uuids is not None
-        assert instance._uuids_to_combinations is not None
+        assert instance._combinations_index is not None
+        assert instance._combination_labels is not None
         expected_out = pd.DataFrame({
             'a': ['a', 'b', 'c'],
             'b': [1, 2, 3],
@@ -987,6 +1023,51 @@ class TestFixedCombinations():
         })
         pd.testing.assert_frame_equal(expected_out, out)
 
+    def test_transform_unseen_combination(self):
+        """Test that the rows with combinations that were not fitted are left empty."""
+        # Setup
+        table_data = pd.DataFrame({
+            'b': ['d', 'e', 'd'],
+            'c': ['g', 'h', 'g']
+        })
+        instance = FixedCombinations(column_names=['b', 'c'])
+        instance.fit(table_data)
+        new_data = pd.DataFrame({
+            'b': ['e', 'd', 'e'],
+            'c': ['h', 'h', 'g']
+        }, index=[5, 6, 7])
+
+        # Run
+        out = instance.transform(new_data)
+        is_valid = instance.is_valid(new_data)
+
+        # Assert
+        expected_out = pd.DataFrame({'b#c': ['1', None, None]}, index=[5, 6, 7])
+        pd.testing.assert_frame_equal(out, expected_out)
+        expected_is_valid = pd.Series([True, False, False], index=[5, 6, 7], name='b#c')
+        pd.testing.assert_series_equal(is_valid, expected_is_valid)
+
+    def test_reverse_transform_unknown_label(self):
+        """Test that the labels that do not belong to any combination become missing values."""
+        # Setup
+        table_data = pd.DataFrame({
+            'b': [1, 2, 2],
+            'c': [True, False, False]
+        })
+        instance = FixedCombinations(column_names=['b', 'c'])
+        instance.fit(table_data)
+        transformed_data = pd.DataFrame({'b#c': ['1', np.nan, '0']})
+
+        # Run
+        out = instance.reverse_transform(transformed_data)
+
+        # Assert
+        expected_out = pd.DataFrame({
+            'b': [2., np.nan, 1.],
+            'c': [False, np.nan, True]
+        })
+        pd.testing.assert_frame_equal(out, expected_out)
+
 
 class TestInequality():
 
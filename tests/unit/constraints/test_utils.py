@@ -1,12 +1,14 @@
 """Tests for the sdv.constraints.utils module."""
 from decimal import Decimal
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
 
 from sdv.constraints.utils import (
-    _cast_to_type, cast_to_datetime64, compute_nans_column, get_datetime_diff,
-    get_nan_component_value, logit, matches_datetime_format, revert_nans_columns, sigmoid)
+    DatetimeParseCache, _cast_to_type, cast_to_datetime64, compute_nans_column,
+    get_datetime_diff, get_nan_component_value, logit, matches_datetime_format,
+    revert_nans_columns, sigmoid)
 
 
 def test__cast_to_type():
@@ -162,6 +164,124 @@ def test_cast_to_datetime64_datetime_format():
     assert expected_string_output == string_out
 
 
+def test_cast_to_datetime64_mixed_formats():
+    """Test that the values are parsed one by one if they do not share the same format."""
+    # Setup
+    list_value = np.array(['2021-02-02', np.nan, '2021-02-03 10:30:00'], dtype=object)
+
+    # Run
+    list_out = cast_to_datetime64(list_value)
+
+    # Assert
+    expected_list_output = np.array([
+        '2021-02-02',
+        'NaT',
+        '2021-02-03 10:30:00'
+    ], dtype='datetime64[ns]')
+    np.testing.assert_array_equal(expected_list_output, list_out)
+
+
+class TestDatetimeParseCache:
+
+    def test_cast_to_datetime64(self):
+        """Test that the values of a column are only parsed once."""
+        # Setup
+        cache = DatetimeParseCache()
+        values = np.array(['2021-02-02', None, '2021-02-03'], dtype=object)
+
+        # Run
+        with patch('sdv.constraints.utils.cast_to_datetime64',
+                   wraps=cast_to_datetime64) as cast_mock:
+            first_out = cache.cast_to_datetime64('col', values, '%Y-%m-%d')
+            second_out = cache.cast_to_datetime64('col', values.copy(), '%Y-%m-%d')
+
+        # Assert
+        expected_output = np.array(['2021-02-02', 'NaT', '2021-02-03'], dtype='datetime64[ns]')
+        np.testing.assert_array_equal(first_out, expected_output)
+        np.testing.assert_array_equal(second_out, expected_output)
+        cast_mock.assert_called_once()
+
+    def test_cast_to_datetime64_modified_values(self):
+        """Test that the values are parsed again if the column has been modified."""
+        # Setup
+        cache = DatetimeParseCache()
+        values = np.array(['2021-02-02', None, '2021-02-03'], dtype=object)
+        modified_values = np.array(['2021-02-02', '2021-02-05', '2021-02-03'], dtype=object)
+
+        # Run
+        cache.cast_to_datetime64('col', values)
+        out = cache.cast_to_datetime64('col', modified_values)
+
+        # Assert
+        expected_output = np.array(
+            ['2021-02-02', '2021-02-05', '2021-02-03'], dtype='datetime64[ns]')
+        np.testing.assert_array_equal(out, expected_output)
+
+    def test_cast_to_datetime64_modified_in_place(self):
+        """Test that the values are parsed again if the column has been modified in place."""
+        # Setup
+        cache = DatetimeParseCache()
+        data = pd.DataFrame({'col': ['2020-01-01', '2020-01-02'], 'other': ['a', 'b']})
+        first_out = cache.cast_to_datetime64('col', data['col'].to_numpy(), '%Y-%m-%d')
+
+        # Run
+        data.loc[1, 'col'] = np.nan
+        out = cache.cast_to_datetime64('col', data['col'].to_numpy(), '%Y-%m-%d')
+
+        # Assert
+        np.testing.assert_array_equal(
+            first_out, np.array(['2020-01-01', '2020-01-02'], dtype='datetime64[ns]'))
+        np.testing.assert_array_equal(
+            out, np.array(['2020-01-01', 'NaT'], dtype='datetime64[ns]'))
+
+    def test_cast_to_datetime64_series(self):
+        """Test that ``pandas.Series`` are returned with their own index and name."""
+        # Setup
+        cache = DatetimeParseCache()
+        series_value = pd.Series(['2021-02-02', None], index=[3, 4], name='col')
+        other_series_value = pd.Series(['2021-02-02', None], index=[7, 8], name='col')
+
+        # Run
+        cache.cast_to_datetime64('col', series_value)
+        out = cache.cast_to_datetime64('col', other_series_value)
+
+        # Assert
+        expected_output = pd.Series(
+            pd.to_datetime(['2021-02-02', None]), index=[7, 8], name='col')
+        pd.testing.assert_series_equal(out, expected_output)
+
+    def test_cast_to_datetime64_not_object(self):
+        """Test that the values that are not strings are not cached."""
+        # Setup
+        cache = DatetimeParseCache()
+        values = pd.to_datetime(['2021-02-02', None]).to_numpy()
+
+        # Run
+        out = cache.cast_to_datetime64('col', values)
+
+        # Assert
+        np.testing.assert_array_equal(out, values)
+        assert cache._entries == {}
+
+    def test_get_set(self):
+        """Test that ``get`` returns the values stored with the same key by ``set``."""
+        # Setup
+        cache = DatetimeParseCache()
+        values = np.array(['02-2021', np.nan], dtype=object)
+        parsed_values = np.array(['2021-02-01', 'NaT'], dtype='datetime64[ns]')
+
+        # Run
+        cache.set('col', values, parsed_values, '%m-%Y')
+        out = cache.get('col', values.copy(), '%m-%Y')
+        other_format_out = cache.get('col', values, '%Y-%m')
+        other_column_out = cache.get('other_col', values, '%m-%Y')
+
+        # Assert
+        assert out is parsed_values
+        assert other_format_out is None
+        assert other_column_out is None
+
+
 def test_matches_datetime_format():
     """Test the ``matches_datetime_format`` method.
 
@@ -243,6 +363,21 @@ def test_compute_nans_columns():
     pd.testing.assert_series_equal(output, expected_output)
 
 
+def test_compute_nans_columns_index():
+    """Test that the NaN column keeps the index of the data."""
+    # Setup
+    data = pd.DataFrame({
+        'a': [np.nan, 1, None], 'b': pd.to_datetime(['2020-01-01', None, None])
+    }, index=[4, 2, 7])
+
+    # Run
+    output = compute_nans_column(data, ['a', 'b'])
+
+    # Assert
+    expected_output = pd.Series(['a', 'b', 'a, b'], index=[4, 2, 7], name='a#b.nan_component')
+    pd.testing.assert_series_equal(output, expected_output)
+
+
 def test_compute_nans_columns_without_nan():
     """Test the ``compute_nans_columns`` method when there are no nans."""
     # Setup
@@ -278,6 +413,26 @@ def test_revert_nans_columns():
     pd.testing.assert_frame_equal(result, expected_data)
 
 
+def test_revert_nans_columns_datetime():
+    """Test that the NaNs are reverted in datetime and object columns."""
+    # Setup
+    data = pd.DataFrame({
+        'a': pd.to_datetime(['2020-01-01', '2020-01-02', '2020-01-03']),
+        'b': ['x', 'y', 'z'],
+        'a#b.nan_component': ['a, b', 'None', 'a'],
+    }, index=[3, 1, 2])
+
+    # Run
+    result = revert_nans_columns(data, 'a#b.nan_component')
+
+    # Assert
+    expected_data = pd.DataFrame({
+        'a': pd.to_datetime([None, '2020-01-02', None]),
+        'b': [np.nan, 'y', 'z'],
+    }, index=[3, 1, 2])
+    pd.testing.assert_frame_equal(result, expected_data)
+
+
 def test_get_datetime_diff():
     """Test the ``_get_datetime_diff`` method.
 
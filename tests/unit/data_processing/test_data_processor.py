@@ -2,7 +2,7 @@ import logging
 import re
 import warnings
 from unittest import mock
-from unittest.mock import Mock, call, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 import numpy as np
 import pandas as pd
@@ -14,7 +14,8 @@ from rdt.transformers import (
 
 from sdv.constraints.errors import (
     AggregateConstraintsError, FunctionError, MissingConstraintColumnError)
-from sdv.constraints.tabular import Positive, ScalarRange
+from sdv.constraints.tabular import Positive, ScalarInequality, ScalarRange, Unique
+from sdv.constraints.utils import DatetimeParseCache
 from sdv.data_processing.data_processor import DataProcessor
 from sdv.data_processing.datetime_formatter import DatetimeFormatter
 from sdv.data_processing.errors import InvalidConstraintsError, NotFittedError
@@ -284,7 +285,7 @@ class TestDataProcessor:
             'numbers': [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
             'range': [0, 10, 20, 30, 40, 50, 60, 70, 80, 90]
         })
-        instance = Mock()
+        instance = DataProcessor(SingleTableMetadata())
         scalar_range = ScalarRange('range', low_value=0, high_value=90, strict_boundaries=True)
         positive = Positive('numbers')
         instance._constraints = [scalar_range, positive]
@@ -298,6 +299,179 @@ class TestDataProcessor:
             'range': [10, 20, 30, 40, 50, 60, 70, 80]
         }, index=[1, 2, 3, 4, 5, 6, 7, 8])
         pd.testing.assert_frame_equal(expected_data, data)
+        assert instance.get_constraints_statistics() == [
+            {'constraint': 'ScalarRange', 'evaluated_rows': 10, 'rejected_rows': 2},
+            {'constraint': 'Positive', 'evaluated_rows': 8, 'rejected_rows': 0},
+        ]
+
+    def test_filter_valid_row_dependent_constraint(self):
+        """Test that row dependent constraints see the rows kept by the previous ones."""
+        # Setup
+        data = pd.DataFrame({
+            'key': [1, 1, 2, 3, 4, 5],
+            'x': [-1, 5, 6, 7, 8, 9],
+        })
+        instance = DataProcessor(SingleTableMetadata())
+        instance._constraints = [
+            ScalarInequality('x', '>', 0),
+            Unique(['key']),
+        ]
+
+        # Run
+        first_result = instance.filter_valid(data)
+        second_result = instance.filter_valid(data)
+
+        # Assert
+        expected_data = data.iloc[1:]
+        pd.testing.assert_frame_equal(first_result, expected_data)
+        pd.testing.assert_frame_equal(second_result, expected_data)
+
+    def test_filter_valid_without_constraints_statistics(self):
+        """Test that a data processor pickled without the statistics can filter the data."""
+        # Setup
+        data = pd.DataFrame({'numbers': [-1, 1, 2]})
+        instance = DataProcessor(SingleTableMetadata())
+        instance._constraints = [Positive('numbers')]
+        del instance._constraints_statistics
+
+        # Run
+        result = instance.filter_valid(data)
+
+        # Assert
+        pd.testing.assert_frame_equal(result, data.iloc[1:])
+        assert instance.get_constraints_statistics() == [
+            {'constraint': 'Positive', 'evaluated_rows': 3, 'rejected_rows': 1},
+        ]
+
+    def test_filter_valid_evaluates_only_remaining_rows(self):
+        """Test that once most rows are rejected, only the remaining rows are evaluated."""
+        # Setup
+        data = pd.DataFrame({'a': [1, 2, 3, 4]}, index=[10, 11, 12, 13])
+        first = Mock()
+        first.is_valid.return_value = pd.Series([True, False, False, True], index=data.index)
+        second = Mock()
+        second.is_valid.return_value = np.array([False, True])
+        third = Mock()
+        third.is_valid.return_value = [True]
+        instance = DataProcessor(SingleTableMetadata())
+        instance._constraints = [first, second, third]
+
+        # Run
+        result = instance.filter_valid(data)
+
+        # Assert
+        pd.testing.assert_frame_equal(result, pd.DataFrame({'a': [4]}, index=[13]))
+        pd.testing.assert_frame_equal(second.is_valid.call_args[0][0], data.iloc[[0, 3]])
+        pd.testing.assert_frame_equal(third.is_valid.call_args[0][0], data.iloc[[3]])
+        assert [stats['rejected_rows'] for stats in instance._constraints_statistics] == [
+            2, 1, 0]
+
+    def test_filter_valid_stops_when_all_rows_are_rejected(self):
+        """Test that the remaining constraints are not evaluated if all rows are rejected."""
+        # Setup
+        data = pd.DataFrame({'a': [1, 2]})
+        first = Mock()
+        first.is_valid.return_value = np.array([False, False])
+        second = Mock()
+        instance = DataProcessor(SingleTableMetadata())
+        instance._constraints = [first, second]
+
+        # Run
+        result = instance.filter_valid(data)
+
+        # Assert
+        assert result.empty
+        second.is_valid.assert_not_called()
+
+    def test__datetime_parse_pass(self):
+        """Test that the constraints and datetime formatters share a cache during the pass."""
+        # Setup
+        instance = DataProcessor(SingleTableMetadata())
+        positive = Positive('numbers')
+        scalar_range = ScalarRange('range', low_value=0, high_value=90)
+        datetime_formatter = DatetimeFormatter('%Y-%m-%d')
+        numerical_formatter = NumericalFormatter()
+        instance._constraints = [positive, scalar_range]
+        instance.formatters = {'date': datetime_formatter, 'numbers': numerical_formatter}
+
+        # Run
+        with instance._datetime_parse_pass():
+            cache = positive._datetime_parse_cache
+            shared_caches = [
+                scalar_range._datetime_parse_cache,
+                datetime_formatter._datetime_parse_cache
+            ]
+
+        # Assert
+        assert isinstance(cache, DatetimeParseCache)
+        assert all(shared_cache is cache for shared_cache in shared_caches)
+        assert not hasattr(numerical_formatter, '_datetime_parse_cache')
+        assert positive._datetime_parse_cache is None
+        assert scalar_range._datetime_parse_cache is None
+        assert datetime_formatter._datetime_parse_cache is None
+
+    def test__datetime_parse_pass_nested(self):
+        """Test that a nested pass reuses the cache of the outermost one."""
+        # Setup
+        instance = DataProcessor(SingleTableMetadata())
+        positive = Positive('numbers')
+        instance._constraints = [positive]
+
+        # Run
+        with instance._datetime_parse_pass():
+            cache = positive._datetime_parse_cache
+            with instance._datetime_parse_pass():
+                nested_cache = positive._datetime_parse_cache
+
+            cache_after_nested_pass = positive._datetime_parse_cache
+
+        # Assert
+        assert nested_cache is cache
+        assert cache_after_nested_pass is cache
+        assert positive._datetime_parse_cache is None
+
+    def test__get_constraints_plan(self):
+        """Test that constraints rejecting a larger share of the rows are evaluated first."""
+        # Setup
+        instance = DataProcessor(SingleTableMetadata())
+        instance._constraints = [Mock(), Mock(), Mock(), Mock()]
+        instance._constraints_statistics = [
+            {'evaluated_rows': 100, 'rejected_rows': 10},
+            {'evaluated_rows': 100, 'rejected_rows': 50},
+            {'evaluated_rows': 0, 'rejected_rows': 0},
+            {'evaluated_rows': 100, 'rejected_rows': 0},
+        ]
+
+        # Run
+        plan = instance._get_constraints_plan()
+
+        # Assert
+        assert plan == [2, 1, 0, 3]
+
+    def test__get_constraints_plan_row_dependent_constraints(self):
+        """Test that the constraints are not moved across row dependent constraints."""
+        # Setup
+        instance = DataProcessor(SingleTableMetadata())
+        instance._constraints = [
+            Positive('a'),
+            Positive('b'),
+            Unique(['c']),
+            Positive('d'),
+            Positive('e'),
+        ]
+        instance._constraints_statistics = [
+            {'evaluated_rows': 100, 'rejected_rows': 10},
+            {'evaluated_rows': 100, 'rejected_rows': 50},
+            {'evaluated_rows': 100, 'rejected_rows': 90},
+            {'evaluated_rows': 100, 'rejected_rows': 0},
+            {'evaluated_rows': 100, 'rejected_rows': 20},
+        ]
+
+        # Run
+        plan = instance._get_constraints_plan()
+
+        # Assert
+        assert plan == [1, 0, 2, 4, 3]
 
     def test_to_dict_from_dict(self):
         """Test that ``to_dict`` and ``from_dict`` methods are inverse to each other.
@@ -1807,7 +1981,7 @@ class TestDataProcessor:
         # Setup
         data = pd.DataFrame({'a': [1, 2, 3]}, dtype=np.int64)
         transformed_data = pd.DataFrame({'a': [4, 5, 6], 'b': [1, 2, 3]})
-        dp = Mock()
+        dp = MagicMock()
         dp.table_name = 'fake_table'
         dp._transform_constraints.return_value = transformed_data
         dp._prepared_for_fitting = False
@@ -1845,7 +2019,7 @@ class TestDataProcessor:
         # Setup
         data = pd.DataFrame({'a': [1, 2, 3]}, dtype=np.int64)
         transformed_data = pd.DataFrame({'a': [4, 5, 6], 'b': [1, 2, 3]})
-        dp = Mock()
+        dp = MagicMock()
         dp.table_name = ''
         dp._transform_constraints.return_value = transformed_data
         dp._prepared_for_fitting = False
@@ -1884,7 +2058,7 @@ class TestDataProcessor:
         # Setup
         data = pd.DataFrame({'a': [1, 2, 3]}, dtype=np.int64)
         transformed_data = pd.DataFrame({'column': [4, 5, 6]})
-        dp = Mock()
+        dp = MagicMock()
         dp.table_name = 'fake_table'
         dp._constraints_list = []
         dp._constraints = []
@@ -1925,7 +2099,7 @@ class TestDataProcessor:
             'column': [4, 5, 6],
             'column#a': [1., 2., 3.]
         })
-        dp = Mock()
+        dp = MagicMock()
         dp.table_name = 'fake_table'
         dp._transform_constraints.return_value = transformed_data
         dp._prepared_for_fitting = False
@@ -1991,7 +2165,7 @@ class TestDataProcessor:
         # Setup
         data = pd.DataFrame({'a': [1, 2, 3]}, dtype=np.int64)
         transformed_data = pd.DataFrame({'a': [4, 5, 6], 'b': [1, 2, 3]})
-        dp = Mock()
+        dp = MagicMock()
         dp.table_name = 'fake_table'
         dp._transform_constraints.return_value = transformed_data
 
@@ -1,6 +1,56 @@
+from unittest.mock import patch
+
+import numpy as np
 import pandas as pd
 
-from sdv.data_processing.datetime_formatter import DatetimeFormatter
+from sdv.constraints.utils import DatetimeParseCache
+from sdv.data_processing.datetime_formatter import (
+    DatetimeFormatter, _compile_datetime_format, _format_fixed_width)
+
+
+def test__compile_datetime_format():
+    """Test that the format is split into literal strings and directives."""
+    # Run
+    tokens = _compile_datetime_format('%Y-%m-%d %H:%M:%S.%f 100%%')
+
+    # Assert
+    assert tokens == ['Y', '-', 'm', '-', 'd', ' ', 'H', ':', 'M', ':', 'S', '.', 'f', ' 100%']
+
+
+def test__compile_datetime_format_not_fixed_width():
+    """Test that ``None`` is returned if the format has a variable width directive."""
+    # Run
+    month_name = _compile_datetime_format('%d %b %Y')
+    not_padded = _compile_datetime_format('%-m/%d/%Y')
+    not_ascii = _compile_datetime_format('%Y年%m月')
+
+    # Assert
+    assert month_name is None
+    assert not_padded is None
+    assert not_ascii is None
+
+
+def test__format_fixed_width():
+    """Test that the datetimes are formatted and the missing values are kept."""
+    # Setup
+    datetime_column = pd.Series(
+        pd.to_datetime(['2021-02-05 07:08:09.000123', None, '1999-12-31 23:59:59.000000']),
+        index=[4, 5, 6],
+        name='date'
+    )
+    tokens = ['y', '/', 'm', '/', 'd', ' ', 'j', ' ', 'H', 'M', 'S', '.', 'f']
+
+    # Run
+    result = _format_fixed_width(datetime_column, tokens)
+
+    # Assert
+    expected = pd.Series(
+        ['21/02/05 036 070809.000123', np.nan, '99/12/31 365 235959.000000'],
+        index=[4, 5, 6],
+        name='date',
+        dtype=object
+    )
+    pd.testing.assert_series_equal(result, expected)
 
 
 class TestDatetimeFormatter:
@@ -63,6 +113,79 @@ class TestDatetimeFormatter:
             pd.Series(['15-02-2021', '16-05-2022', '11-04-2023'])
         )
 
+    def test_format_data_datetime_parse_cache(self):
+        """Test that the parsed values are taken from the ``DatetimeParseCache``."""
+        # Setup
+        formatter = DatetimeFormatter('%Y-%m-%d')
+        formatter._dtype = 'O'
+        formatter._datetime_parse_cache = DatetimeParseCache()
+        column = pd.Series(['2021-02-15', '2022-05-16'], name='date')
+        formatter._datetime_parse_cache.set(
+            'date',
+            column.to_numpy(),
+            np.array(['2021-02-16', '2022-05-17'], dtype='datetime64[ns]'),
+            '%Y-%m-%d'
+        )
+
+        # Run
+        result = formatter.format_data(column)
+
+        # Assert
+        pd.testing.assert_series_equal(
+            result,
+            pd.Series(['2021-02-16', '2022-05-17'], name='date')
+        )
+
+    def test_format_data_stores_parsed_values(self):
+        """Test that the parsed values are stored in the ``DatetimeParseCache``."""
+        # Setup
+        formatter = DatetimeFormatter('%d-%m-%Y')
+        formatter._dtype = 'O'
+        formatter._datetime_parse_cache = DatetimeParseCache()
+        column = pd.Series(['15-02-2021', '16-05-2022'], name='date')
+
+        # Run
+        formatter.format_data(column)
+
+        # Assert
+        parsed_values = formatter._datetime_parse_cache.get(
+            'date', column.to_numpy(), '%d-%m-%Y')
+        np.testing.assert_array_equal(
+            parsed_values,
+            np.array(['2021-02-15', '2022-05-16'], dtype='datetime64[ns]')
+        )
+
+    def test_format_data_datetime_dtype(self):
+        """Test that datetime columns are formatted without being parsed again."""
+        # Setup
+        formatter = DatetimeFormatter('%d-%m-%Y')
+        formatter._dtype = 'O'
+        column = pd.Series(pd.to_datetime(['2021-02-15', None, '2023-04-11']))
+
+        # Run
+        with patch('sdv.data_processing.datetime_formatter.pd.to_datetime') as to_datetime_mock:
+            result = formatter.format_data(column)
+
+        # Assert
+        to_datetime_mock.assert_not_called()
+        pd.testing.assert_series_equal(
+            result,
+            pd.Series(['15-02-2021', np.nan, '11-04-2023'], dtype=object)
+        )
+
+    def test_format_data_variable_width_format(self):
+        """Test that ``strftime`` is used if the format has a variable width directive."""
+        # Setup
+        formatter = DatetimeFormatter('%b %d, %Y')
+        formatter._dtype = 'O'
+        column = pd.Series(['2021-02-15', '2022-05-16'])
+
+        # Run
+        result = formatter.format_data(column)
+
+        # Assert
+        pd.testing.assert_series_equal(result, pd.Series(['Feb 15, 2021', 'May 16, 2022']))
+
     def test_format_datetime_does_not_match_format(self):
         """Test that datetime column can be formatted if the input doesn't match the format."""
         # Setup
@@ -5,10 +5,13 @@ import os.path as op
 import re
 from unittest.mock import Mock, call, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from sdv.datasets.local import load_csvs, save_csvs
+from sdv.datasets.local import _get_read_csv_parameters, load_csvs, save_csvs
+from sdv.errors import SynthesizerInputError
+from sdv.metadata import MultiTableMetadata
 
 
 @patch('sdv.datasets.local.warnings')
@@ -54,6 +57,147 @@ def test_load_csvs(load_mock, warnings_mock, tmp_path):
         f"Ignoring incompatible files ['fake.json'] in folder '{tmp_path}'.")
 
 
+def _get_metadata():
+    return MultiTableMetadata.load_from_dict({
+        'tables': {
+            'users': {
+                'primary_key': 'user_id',
+                'columns': {
+                    'user_id': {'sdtype': 'id', 'regex_format': '[0-9]{3}'},
+                    'name': {'sdtype': 'categorical'},
+                    'code': {'sdtype': 'id'},
+                    'age': {'sdtype': 'numerical', 'computer_representation': 'Int64'},
+                    'score': {'sdtype': 'numerical', 'computer_representation': 'Float'},
+                    'active': {'sdtype': 'boolean'},
+                    'joined': {'sdtype': 'datetime', 'datetime_format': '%d/%m/%Y'},
+                    'updated': {'sdtype': 'datetime'},
+                    'email': {'sdtype': 'email', 'pii': True},
+                }
+            }
+        }
+    })
+
+
+def test__get_read_csv_parameters():
+    """Test that the dtypes and datetime formats are taken from the metadata."""
+    # Setup
+    table_metadata = _get_metadata().tables['users']
+
+    # Run
+    parameters, datetime_formats = _get_read_csv_parameters(
+        table_metadata, {'sep': ';', 'dtype': {'name': 'category'}})
+
+    # Assert
+    assert parameters == {
+        'sep': ';',
+        'dtype': {
+            'user_id': 'str',
+            'name': 'category',
+            'score': 'float64',
+            'email': 'str',
+        }
+    }
+    assert datetime_formats == {'joined': '%d/%m/%Y', 'updated': None}
+
+
+def test__get_read_csv_parameters_pyarrow():
+    """Test that the text columns are not given a dtype with the ``pyarrow`` engine."""
+    # Setup
+    table_metadata = _get_metadata().tables['users']
+
+    # Run
+    parameters, _ = _get_read_csv_parameters(table_metadata, {'engine': 'pyarrow'})
+
+    # Assert
+    assert parameters == {'engine': 'pyarrow', 'dtype': {'score': 'float64'}}
+
+
+def test__get_read_csv_parameters_user_parse_dates():
+    """Test that the datetimes are not parsed again if ``parse_dates`` is given."""
+    # Setup
+    table_metadata = _get_metadata().tables['users']
+
+    # Run
+    parameters, datetime_formats = _get_read_csv_parameters(
+        table_metadata, {'parse_dates': ['joined'], 'dtype': str})
+
+    # Assert
+    assert parameters == {'parse_dates': ['joined'], 'dtype': str}
+    assert datetime_formats == {}
+
+
+def test__get_read_csv_parameters_no_metadata():
+    """Test that the parameters are returned as they are if there is no metadata."""
+    # Run
+    parameters, datetime_formats = _get_read_csv_parameters(None, None)
+
+    # Assert
+    assert parameters is None
+    assert datetime_formats == {}
+
+
+def test_load_csvs_with_metadata(tmp_path):
+    """Test that the dtypes of the tables in the metadata are taken from it."""
+    # Setup
+    (tmp_path / 'users.csv').write_text(
+        'user_id,name,code,age,score,active,joined,updated,email\n'
+        '001,1,5,30,1,True,25/12/2020,2021-01-01,a@b.com\n'
+        '002,,6,,,False,,2021-01-02,\n'
+    )
+    (tmp_path / 'other.csv').write_text('user_id\n001\n')
+
+    # Run
+    result = load_csvs(tmp_path, metadata=_get_metadata(), n_jobs=2)
+
+    # Assert
+    expected_users = pd.DataFrame({
+        'user_id': ['001', '002'],
+        'name': [1., np.nan],
+        'code': [5, 6],
+        'age': [30., np.nan],
+        'score': [1., np.nan],
+        'active': [True, False],
+        'joined': pd.to_datetime(['2020-12-25', None]),
+        'updated': pd.to_datetime(['2021-01-01', '2021-01-02']),
+        'email': ['a@b.com', np.nan],
+    })
+    pd.testing.assert_frame_equal(result['users'], expected_users)
+    pd.testing.assert_frame_equal(result['other'], pd.DataFrame({'user_id': [1]}))
+
+
+def test_load_csvs_with_metadata_invalid_datetimes(tmp_path):
+    """Test that the datetime columns that cannot be parsed are loaded as they are."""
+    # Setup
+    (tmp_path / 'users.csv').write_text(
+        'user_id,joined,updated\n'
+        '001,25/12/2020,2021-01-01\n'
+        '002,not a date,01/02/2021\n'
+    )
+
+    # Run
+    with pytest.warns(UserWarning, match="Could not parse the datetime column 'joined'"):
+        result = load_csvs(tmp_path, metadata=_get_metadata(), n_jobs=1)
+
+    # Assert
+    expected_users = pd.DataFrame({
+        'user_id': ['001', '002'],
+        'joined': ['25/12/2020', 'not a date'],
+        'updated': ['2021-01-01', '01/02/2021'],
+    })
+    pd.testing.assert_frame_equal(result['users'], expected_users)
+
+
+@pytest.mark.parametrize('n_jobs', [0, -2, 1.5])
+def test_load_csvs_invalid_n_jobs(n_jobs, tmp_path):
+    """Test that an error is raised if ``n_jobs`` is not valid."""
+    # Setup
+    error_msg = re.escape(f"Invalid value '{n_jobs}' for parameter 'n_jobs'.")
+
+    # Run and Assert
+    with pytest.raises(SynthesizerInputError, match=error_msg):
+        load_csvs(tmp_path, n_jobs=n_jobs)
+
+
 def test_load_csvs_no_csvs(tmp_path):
     """Test that the function raises an error if there are no csvs in the folder."""
     # Setup
@@ -0,0 +1,284 @@
+"""Test the functions for reading and writing Parquet files."""
+
+import re
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from sdv.io.parquet import (
+    ParquetWriter, load_parquets, read_parquet, save_parquets, write_parquet)
+
+
+def _get_data():
+    return pd.DataFrame({
+        'id': [1, 2, 3],
+        'count': pd.array([1, None, 3], dtype='Int64'),
+        'flag': pd.array([True, None, False], dtype='boolean'),
+        'date': pd.to_datetime(['2020-01-01 00:00:00', None, '2021-03-04 10:00:00']),
+        'category': pd.Categorical(['a', 'b', 'a']),
+        'name': ['x', None, 'z'],
+        'value': [1.5, np.nan, 2.5],
+    })
+
+
+def test_write_parquet_read_parquet(tmp_path):
+    """Test that the data and its dtypes are preserved."""
+    # Setup
+    data = _get_data()
+    data.index = [10, 11, 12]
+    filepath = tmp_path / 'table.parquet'
+
+    # Run
+    write_parquet(data, filepath)
+    result = read_parquet(filepath)
+
+    # Assert
+    pd.testing.assert_frame_equal(result, data.reset_index(drop=True))
+
+
+def test_read_parquet_columns(tmp_path):
+    """Test that only the given columns are read."""
+    # Setup
+    data = _get_data()
+    filepath = tmp_path / 'table.parquet'
+    write_parquet(data, filepath)
+
+    # Run
+    result = read_parquet(filepath, columns=['date', 'count'])
+
+    # Assert
+    pd.testing.assert_frame_equal(result, data[['date', 'count']])
+
+
+def test_write_parquet_row_group_size(tmp_path):
+    """Test that the rows are split in row groups of the given size."""
+    # Setup
+    filepath = tmp_path / 'table.parquet'
+
+    # Run
+    write_parquet(_get_data(), filepath, row_group_size=2)
+
+    # Assert
+    assert pq.ParquetFile(filepath).num_row_groups == 2
+
+
+def test_write_parquet_not_dataframe(tmp_path):
+    """Test that an error is raised if the data is not a DataFrame."""
+    # Run and Assert
+    with pytest.raises(ValueError, match="'data' must be a pandas DataFrame."):
+        write_parquet({'a': [1]}, tmp_path / 'table.parquet')
+
+
+def test_read_parquet_pyarrow_not_installed(tmp_path):
+    """Test that a helpful error is raised if ``pyarrow`` is not installed."""
+    # Setup
+    expected_message = re.escape(
+        "Reading and writing Parquet files requires 'pyarrow'. Please install it with "
+        "'pip install sdv[parquet]'."
+    )
+
+    # Run and Assert
+    with patch.dict('sys.modules', {'pyarrow': None}):
+        with pytest.raises(ImportError, match=expected_message):
+            read_parquet(tmp_path / 'table.parquet')
+
+
+class TestParquetWriter:
+
+    def test_write(self, tmp_path):
+        """Test that every write is appended to the file as a row group."""
+        # Setup
+        data = _get_data()
+        filepath = tmp_path / 'table.parquet'
+
+        # Run
+        with ParquetWriter(filepath) as writer:
+            writer.write(data.head(2))
+            writer.write(data.tail(1))
+
+        # Assert
+        assert pq.ParquetFile(filepath).num_row_groups == 2
+        pd.testing.assert_frame_equal(read_parquet(filepath), data)
+
+    def test_write_missing_values(self, tmp_path):
+        """Test that the columns that only have missing values at first are written as strings.
+
+        The data must not be kept in memory until those columns have values.
+        """
+        # Setup
+        filepath = tmp_path / 'table.parquet'
+        first = pd.DataFrame({'a': [1, 2], 'b': [np.nan, np.nan], 'c': [None, None]})
+        second = pd.DataFrame({'a': [3, 4], 'b': [np.nan, np.nan], 'c': ['x', None]})
+        third = pd.DataFrame({'a': [5, np.nan], 'b': [1.5, np.nan], 'c': [None, None]})
+
+        # Run
+        with ParquetWriter(filepath) as writer:
+            writer.write(first)
+            file_exists = filepath.exists()
+            writer.write(second)
+            writer.write(third)
+
+        # Assert
+        assert file_exists
+        parquet_file = pq.ParquetFile(filepath)
+        assert parquet_file.num_row_groups == 3
+        assert parquet_file.schema_arrow.field('c').type == pa.string()
+        expected = pd.DataFrame({
+            'a': [1, 2, 3, 4, 5, np.nan],
+            'b': [np.nan, np.nan, np.nan, np.nan, 1.5, np.nan],
+            'c': [None, None, 'x', None, None, None],
+        })
+        pd.testing.assert_frame_equal(read_parquet(filepath), expected)
+
+    def test_write_different_types(self, tmp_path):
+        """Test that the data is converted to the types of the first data written."""
+        # Setup
+        filepath = tmp_path / 'table.parquet'
+        first = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y'], 'c': [None, None]})
+        second = pd.DataFrame({'a': [3, 4], 'b': [1, 2], 'c': [1.5, None]})
+
+        # Run
+        with ParquetWriter(filepath) as writer:
+            writer.write(first)
+            writer.write(second)
+
+        # Assert
+        expected = pd.DataFrame({
+            'a': [1, 2, 3, 4],
+            'b': ['x', 'y', '1', '2'],
+            'c': [None, None, '1.5', None],
+        })
+        pd.testing.assert_frame_equal(read_parquet(filepath), expected)
+
+    def test_write_only_missing_values(self, tmp_path):
+        """Test that the data is written on close if a column only has missing values."""
+        # Setup
+        filepath = tmp_path / 'table.parquet'
+        data = pd.DataFrame({'a': [1, 2], 'b': [None, None]})
+
+        # Run
+        with ParquetWriter(filepath) as writer:
+            writer.write(data)
+
+        # Assert
+        pd.testing.assert_frame_equal(read_parquet(filepath), data)
+
+    def test_write_dtypes(self, tmp_path):
+        """Test that the given numerical dtypes are used instead of the ones of the data."""
+        # Setup
+        filepath = tmp_path / 'table.parquet'
+        dtypes = pd.Series({'a': np.dtype('float64'), 'b': np.dtype('O')})
+
+        # Run
+        with ParquetWriter(filepath, dtypes=dtypes) as writer:
+            writer.write(pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']}))
+            writer.write(pd.DataFrame({'a': [1.5, np.nan], 'b': ['z', None]}))
+
+        # Assert
+        expected = pd.DataFrame({'a': [1., 2., 1.5, np.nan], 'b': ['x', 'y', 'z', None]})
+        pd.testing.assert_frame_equal(read_parquet(filepath), expected)
+
+    def test_close_without_writing(self, tmp_path):
+        """Test that closing the writer without writing any data does not create a file."""
+        # Setup
+        filepath = tmp_path / 'table.parquet'
+
+        # Run
+        ParquetWriter(filepath).close()
+
+        # Assert
+        assert not filepath.exists()
+
+
+@patch('sdv.io.parquet.warnings')
+def test_load_parquets(warnings_mock, tmp_path):
+    """Test that only the Parquet files are loaded, with the given columns of every table."""
+    # Setup
+    users = pd.DataFrame({'user_id': [1, 2, 3], 'name': ['a', 'b', 'c']})
+    orders = pd.DataFrame({'order_id': [1, 2, 3], 'user_id': [1, 2, 2]})
+    write_parquet(users, tmp_path / 'users.parquet')
+    write_parquet(orders, tmp_path / 'orders.parquet')
+    (tmp_path / 'fake.json').write_text('{}')
+
+    # Run
+    result = load_parquets(tmp_path, columns={'users': ['name']})
+
+    # Assert
+    assert set(result) == {'users', 'orders'}
+    pd.testing.assert_frame_equal(result['users'], users[['name']])
+    pd.testing.assert_frame_equal(result['orders'], orders)
+    warnings_mock.warn.assert_called_once_with(
+        f"Ignoring incompatible files ['fake.json'] in folder '{tmp_path}'.")
+
+
+def test_load_parquets_no_parquets(tmp_path):
+    """Test that an error is raised if there are no Parquet files in the folder."""
+    # Setup
+    (tmp_path / 'fake.json').write_text('{}')
+    error_message = re.escape(
+        f"No Parquet files exist in '{tmp_path}'. Please make sure your files end in the "
+        "'.parquet' suffix."
+    )
+
+    # Run and Assert
+    with pytest.warns(UserWarning):
+        with pytest.raises(ValueError, match=error_message):
+            load_parquets(tmp_path)
+
+
+def test_load_parquets_folder_does_not_exist():
+    """Test that an error is raised if the folder does not exist."""
+    # Run and Assert
+    with pytest.raises(ValueError, match="The folder 'demo/' cannot be found."):
+        load_parquets('demo/')
+
+
+def test_save_parquets(tmp_path):
+    """Test that every table is saved to a Parquet file with the suffix."""
+    # Setup
+    data = {
+        'users': pd.DataFrame({'user_id': [1, 2], 'name': ['a', 'b']}),
+        'orders': pd.DataFrame({'order_id': [1, 2], 'user_id': [1, 1]}),
+    }
+    folder = tmp_path / 'data'
+
+    # Run
+    save_parquets(data, folder, suffix='-synthetic')
+
+    # Assert
+    result = load_parquets(folder)
+    pd.testing.assert_frame_equal(result['users-synthetic'], data['users'])
+    pd.testing.assert_frame_equal(result['orders-synthetic'], data['orders'])
+
+
+def test_save_parquets_files_exist(tmp_path):
+    """Test that an error is raised if any of the files already exist."""
+    # Setup
+    data = {'users': pd.DataFrame({'user_id': [1, 2]})}
+    (tmp_path / 'users.parquet').touch()
+    error_message = re.escape(
+        f"The following files already exist in '{tmp_path}':\nusers.parquet\n"
+        'Please remove them or specify a different suffix.'
+    )
+
+    # Run and Assert
+    with pytest.raises(FileExistsError, match=error_message):
+        save_parquets(data, tmp_path)
+
+
+def test_save_parquets_invalid_data(tmp_path):
+    """Test that an error is raised if the data is not a dictionary of DataFrames."""
+    # Setup
+    error_message = re.escape(
+        "'data' must be a dictionary that maps table names to pandas DataFrames.")
+
+    # Run and Assert
+    with pytest.raises(ValueError, match=error_message):
+        save_parquets(pd.DataFrame(), tmp_path)
+
+    with pytest.raises(ValueError, match=error_message):
+        save_parquets({'users': [1, 2]}, tmp_path)
@@ -1224,6 +1224,115 @@ class TestSingleTableMetadata:
         instance._determine_sdtype_for_objects.assert_called_once()
         mock__get_datetime_format.assert_called_once()
 
+    def test__count_unique(self):
+        """Test that the distinct values are counted from the sample when it is enough."""
+        # Setup
+        column = pd.Series(np.arange(1000) % 100)
+        unique_sample = column.iloc[:20]
+        repeated_sample = column.iloc[::10]
+
+        # Run
+        unique = SingleTableMetadata._count_unique(column, unique_sample, 'i', False)
+        many_numbers = SingleTableMetadata._count_unique(column, unique_sample, 'i', True)
+        repeated = SingleTableMetadata._count_unique(column, repeated_sample, 'O', False)
+
+        # Assert
+        assert unique == 1000
+        assert many_numbers == 20
+        assert repeated == 10
+
+    @patch('sdv.metadata.single_table.estimate_nunique')
+    def test__count_unique_estimate(self, mock_estimate_nunique):
+        """Test that the distinct values are estimated if the sample has singletons."""
+        # Setup
+        column = pd.Series(['a', 'b', 'c', 'd'] * 250)
+        sample = pd.Series(['a', 'a', 'b'])
+        mock_estimate_nunique.side_effect = [4.2, 995.]
+
+        # Run
+        estimated = SingleTableMetadata._count_unique(column, sample, 'O', False)
+        almost_unique = SingleTableMetadata._count_unique(column, sample, 'O', False)
+
+        # Assert
+        assert estimated == 4
+        assert almost_unique == 1000
+        mock_estimate_nunique.assert_called_with(column)
+
+    def test__detect_columns_sample_size(self):
+        """Test that the sdtypes detected from a sample match the ones of the full data."""
+        # Setup
+        num_rows = 1000
+        data = pd.DataFrame({
+            'int_id': np.arange(num_rows),
+            'str_id': np.arange(num_rows).astype(str),
+            'categorical': ['a', 'b', 'c', 'd'] * 250,
+            'rare_categorical': ['a'] * 997 + ['b', 'c', 'd'],
+            'numerical': np.arange(num_rows) % 100,
+            'float': np.linspace(0, 1, num_rows),
+            'date': ['2021-02-02', '2022-03-05', '2021-02-03', '2022-12-09'] * 250,
+            'bool': [True, False] * 500,
+        })
+        expected = SingleTableMetadata()
+        expected._detect_columns(data)
+        instance = SingleTableMetadata()
+
+        # Run
+        instance._detect_columns(data, sample_size=100)
+
+        # Assert
+        assert instance.to_dict() == expected.to_dict()
+        assert instance.primary_key == 'int_id'
+
+    def test__detect_columns_sample_size_not_unique(self):
+        """Test that candidate ids detected from a sample are checked on all the rows."""
+        # Setup
+        data = pd.DataFrame({
+            'str_id': list(map(str, range(999))) + ['0'],
+            'int_id': list(range(999)) + [0],
+        })
+        instance = SingleTableMetadata()
+
+        # Run
+        instance._detect_columns(data, sample_size=100)
+
+        # Assert
+        assert instance.primary_key is None
+        assert instance.columns == {
+            'str_id': {'sdtype': 'unknown', 'pii': True},
+            'int_id': {'sdtype': 'numerical'},
+        }
+
+    def test__detect_columns_n_jobs(self):
+        """Test that detecting the columns in threads matches detecting them one by one."""
+        # Setup
+        data = pd.DataFrame({
+            'id': range(100),
+            'name': ['John', 'Doe'] * 50,
+            'date': ['2021-02-02', '2022-03-05'] * 50,
+            'email': [f'user{i}@sdv.dev' for i in range(100)],
+        })
+        expected = SingleTableMetadata()
+        expected._detect_columns(data)
+        instance = SingleTableMetadata()
+
+        # Run
+        instance._detect_columns(data, n_jobs=2)
+
+        # Assert
+        assert instance.to_dict() == expected.to_dict()
+
+    @pytest.mark.parametrize('sample_size', [0, -1, 1.5, True])
+    def test_detect_from_dataframe_invalid_sample_size(self, sample_size):
+        """Test that an error is raised if ``sample_size`` is not a positive integer."""
+        # Setup
+        instance = SingleTableMetadata()
+        data = pd.DataFrame({'column': [1, 2, 3]})
+
+        # Run and Assert
+        error_msg = re.escape(f"Invalid value '{sample_size}' for parameter 'sample_size'.")
+        with pytest.raises(ValueError, match=error_msg):
+            instance.detect_from_dataframe(data, sample_size=sample_size)
+
     def test_detect_from_dataframe_raises_error(self):
         """Test the ``detect_from_dataframe`` method.
 
@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+
+from sdv.metadata.utils import estimate_nunique
+
+
+def test_estimate_nunique():
+    """Test that the estimate is exact for few values and close for many of them."""
+    # Setup
+    few_values = pd.Series(['a', 'b', None, 'c', np.nan] * 100)
+    many_values = pd.Series(np.arange(200000) % 50000)
+
+    # Run
+    few_estimate = estimate_nunique(few_values)
+    many_estimate = estimate_nunique(many_values, chunk_size=30000)
+    empty_estimate = estimate_nunique(pd.Series([], dtype=float))
+
+    # Assert
+    assert round(few_estimate) == 3
+    assert abs(many_estimate - 50000) / 50000 < 0.05
+    assert empty_estimate == 0
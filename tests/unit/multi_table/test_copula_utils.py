@@ -0,0 +1,305 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from copulas.univariate import (
+    BetaUnivariate, GaussianUnivariate, TruncatedGaussian, UniformUnivariate)
+
+from sdv.metadata import SingleTableMetadata
+from sdv.multi_table.copula_utils import (
+    GroupedData, StackedGaussianCopulas, get_grouped_copula_parameters)
+from sdv.single_table import GaussianCopulaSynthesizer
+
+
+class TestGroupedData:
+
+    def test___init__(self):
+        """Test that the rows are sorted by group in order of appearance."""
+        # Run
+        grouped = GroupedData(pd.Series(['b', 'a', 'b', 'c', 'a']))
+
+        # Assert
+        assert list(grouped.group_values) == ['b', 'a', 'c']
+        np.testing.assert_array_equal(grouped.order, [0, 2, 1, 4, 3])
+        np.testing.assert_array_equal(grouped.counts, [2, 2, 1])
+        np.testing.assert_array_equal(grouped.starts, [0, 2, 4])
+        np.testing.assert_array_equal(grouped.codes, [0, 0, 1, 1, 2])
+        assert len(grouped) == 3
+
+    def test_aggregations(self):
+        """Test the ``sort``, ``sum``, ``mean`` and ``split`` methods."""
+        # Setup
+        grouped = GroupedData(np.array([1, 0, 1, 0]))
+
+        # Run
+        values = grouped.sort([1., 2., 3., 4.])
+
+        # Assert
+        np.testing.assert_array_equal(values, [1., 3., 2., 4.])
+        np.testing.assert_array_equal(grouped.sum(values), [4., 6.])
+        np.testing.assert_array_equal(grouped.mean(values), [2., 3.])
+        np.testing.assert_array_equal(
+            grouped.mean(np.column_stack([values, values])), [[2., 2.], [3., 3.]])
+        split = grouped.split(values)
+        np.testing.assert_array_equal(split[0], [1., 3.])
+        np.testing.assert_array_equal(split[1], [2., 4.])
+
+
+def _fit_synthesizers(data, groups, distribution):
+    metadata = SingleTableMetadata()
+    for column in data.columns:
+        metadata.add_column(column, sdtype='numerical')
+
+    rows = []
+    for value in pd.unique(groups):
+        synthesizer = GaussianCopulaSynthesizer(metadata, default_distribution=distribution)
+        synthesizer.fit_processed_data(data[groups == value].reset_index(drop=True))
+        rows.append(pd.Series(synthesizer._get_parameters()))
+
+    return pd.DataFrame(rows, index=pd.unique(groups))
+
+
+@pytest.mark.parametrize('distribution', ['norm', 'uniform', 'beta', 'truncnorm', 'gamma'])
+def test_get_grouped_copula_parameters(distribution):
+    """Test that the parameters match fitting a synthesizer for every group."""
+    # Setup
+    rng = np.random.default_rng(42)
+    groups = pd.Series(rng.integers(0, 8, 60))
+    data = pd.DataFrame({
+        'a': rng.normal(size=60).round(1),
+        'b': rng.gamma(2, size=60),
+        'c': rng.integers(0, 3, 60).astype(float)
+    })
+    data.loc[groups == groups[0], 'c'] = 1.
+    data.loc[groups == 5, 'a'] = 2.
+    univariate = GaussianCopulaSynthesizer.get_distribution_class(distribution)
+    distributions = {'a': univariate, 'b': univariate, 'c': univariate}
+
+    # Run
+    result = get_grouped_copula_parameters(data, groups, distributions)
+
+    # Assert
+    expected = _fit_synthesizers(data, groups, distribution)
+    pd.testing.assert_frame_equal(result, expected, check_index_type=False)
+
+
+def test_get_grouped_copula_parameters_fallback():
+    """Test that groups that fail to fit use the parameters of a ``norm`` distribution."""
+    # Setup
+    groups = np.array([0, 0, 0, 1, 1, 1])
+    data = pd.DataFrame({'a': [1., 1., 1., 0., 1e-9, 2e-9]})
+    distributions = {'a': BetaUnivariate}
+
+    # Run
+    with patch.object(BetaUnivariate, 'fit', side_effect=ValueError('fit failed')):
+        result = get_grouped_copula_parameters(data, groups, distributions)
+
+    # Assert
+    expected = pd.DataFrame({
+        'univariates__a__a': [1., np.nan],
+        'univariates__a__b': [1., np.nan],
+        'univariates__a__loc': [1., 1e-9],
+        'univariates__a__scale': [0., np.std([0., 1e-9, 2e-9])],
+        'num_rows': [3., 3.]
+    })
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_get_grouped_copula_parameters_no_columns():
+    """Test that only the number of rows is computed if there are no data columns."""
+    # Setup
+    groups = pd.Series(['x', 'y', 'x'])
+
+    # Run
+    result = get_grouped_copula_parameters(pd.DataFrame(index=range(3)), groups, {})
+
+    # Assert
+    expected = pd.DataFrame({'num_rows': [2, 1]}, index=pd.Index(['x', 'y']))
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_get_grouped_copula_parameters_mixed_distributions():
+    """Test that every column uses its own distribution."""
+    # Setup
+    groups = np.array([0, 0, 1, 1, 1])
+    data = pd.DataFrame({
+        'x': [1., 3., 2., 4., 6.],
+        'y': [1., 2., 3., 3., 5.],
+    })
+    distributions = {'x': GaussianUnivariate, 'y': UniformUnivariate}
+
+    # Run
+    result = get_grouped_copula_parameters(data, groups, distributions)
+
+    # Assert
+    assert list(result.columns) == [
+        'correlation__0__0',
+        'univariates__x__loc',
+        'univariates__x__scale',
+        'univariates__y__loc',
+        'univariates__y__scale',
+        'num_rows'
+    ]
+    np.testing.assert_allclose(result['univariates__x__loc'], [2., 4.])
+    np.testing.assert_allclose(result['univariates__x__scale'], [1., np.std([2., 4., 6.])])
+    np.testing.assert_allclose(result['univariates__y__loc'], [1., 3.])
+    np.testing.assert_allclose(result['univariates__y__scale'], [1., 2.])
+
+
+class TestStackedGaussianCopulas:
+
+    @pytest.mark.parametrize('distribution', ['norm', 'beta', 'truncnorm', 'gamma', 'uniform'])
+    def test_log_probability_density(self, distribution):
+        """Test that the densities match the ones of every ``GaussianMultivariate`` model."""
+        # Setup
+        rng = np.random.default_rng(0)
+        groups = np.repeat(np.arange(4), 15)
+        data = pd.DataFrame({
+            'a': rng.normal(size=60),
+            'b': rng.gamma(2, size=60),
+            'c': rng.integers(0, 3, 60).astype(float)
+        })
+        data.loc[groups == 3, 'c'] = 1.
+        univariate = GaussianCopulaSynthesizer.get_distribution_class(distribution)
+        distributions = {'a': univariate, 'b': univariate, 'c': univariate}
+        parameters = get_grouped_copula_parameters(data, groups, distributions)
+        parameters = parameters.drop(columns='num_rows').fillna(1e-6)
+        metadata = SingleTableMetadata()
+        for column in data.columns:
+            metadata.add_column(column, sdtype='numerical')
+
+        # Run
+        copulas = StackedGaussianCopulas(parameters, distributions)
+        result = copulas.log_probability_density(data)
+
+        # Assert
+        assert result.shape == (60, 4)
+        for position, (_, row) in enumerate(parameters.iterrows()):
+            synthesizer = GaussianCopulaSynthesizer(metadata, default_distribution=distribution)
+            synthesizer._set_parameters(row.to_dict())
+            expected = synthesizer._get_likelihood(data)
+            np.testing.assert_allclose(np.exp(result[:, position]), expected, rtol=1e-7)
+
+    def test_log_probability_density_singular(self):
+        """Test that rows outside of the support of a singular model have zero density."""
+        # Setup
+        parameters = pd.DataFrame({
+            'correlation__0__0': [1., 0.],
+            'univariates__x__loc': [0., 0.],
+            'univariates__x__scale': [1., 1.],
+            'univariates__y__loc': [0., 0.],
+            'univariates__y__scale': [1., 1.],
+        })
+        distributions = {'x': GaussianUnivariate, 'y': GaussianUnivariate}
+        data = pd.DataFrame({'x': [0.5, 0.5], 'y': [0.5, -1.]})
+
+        # Run
+        result = StackedGaussianCopulas(parameters, distributions).log_probability_density(data)
+
+        # Assert
+        expected_singular = -0.5 * np.log(2 * np.pi) - 0.5 * np.log(2) - 0.5 * 0.5 ** 2
+        np.testing.assert_allclose(result[0], [expected_singular, -np.log(2 * np.pi) - 0.25])
+        assert result[1, 0] == -np.inf
+
+    def test_log_probability_density_invalid_truncnorm_bounds(self):
+        """Test that invalid truncnorm bounds match the ``GaussianMultivariate`` densities.
+
+        Rows transformed to ``NaN`` values are outside of the support of singular models, so
+        they have zero density, while they have ``NaN`` density under the other models.
+        """
+        # Setup
+        parameters = pd.DataFrame({
+            'correlation__0__0': [1., 0.9],
+            'univariates__x__a': [3., 3.],
+            'univariates__x__b': [-3., -3.],
+            'univariates__x__loc': [0., 0.],
+            'univariates__x__scale': [1., 1.],
+            'univariates__y__a': [-3., -3.],
+            'univariates__y__b': [3., 3.],
+            'univariates__y__loc': [0., 0.],
+            'univariates__y__scale': [1., 1.],
+        })
+        distributions = {'x': TruncatedGaussian, 'y': TruncatedGaussian}
+        data = pd.DataFrame({'x': [0.5, -0.2], 'y': [0.1, 0.3]})
+        metadata = SingleTableMetadata()
+        metadata.add_column('x', sdtype='numerical')
+        metadata.add_column('y', sdtype='numerical')
+
+        # Run
+        result = StackedGaussianCopulas(parameters, distributions).log_probability_density(data)
+
+        # Assert
+        for position, (_, row) in enumerate(parameters.iterrows()):
+            synthesizer = GaussianCopulaSynthesizer(metadata, default_distribution='truncnorm')
+            synthesizer._set_parameters(row.to_dict())
+            expected = synthesizer._get_likelihood(data)
+            np.testing.assert_array_equal(np.exp(result[:, position]), expected)
+
+        np.testing.assert_array_equal(np.exp(result[:, 0]), [0., 0.])
+
+    @pytest.mark.parametrize('distribution', ['norm', 'beta', 'truncnorm', 'gamma', 'uniform'])
+    def test_sample(self, distribution):
+        """Test that the rows match the ones sampled from every ``GaussianMultivariate`` model."""
+        # Setup
+        rng = np.random.default_rng(0)
+        groups = np.repeat(np.arange(3), 20)
+        data = pd.DataFrame({
+            'a': rng.normal(size=60),
+            'b': rng.gamma(2, size=60),
+        })
+        univariate = GaussianCopulaSynthesizer.get_distribution_class(distribution)
+        distributions = {'a': univariate, 'b': univariate}
+        parameters = get_grouped_copula_parameters(data, groups, distributions)
+        parameters = parameters.drop(columns='num_rows')
+        metadata = SingleTableMetadata()
+        for column in data.columns:
+            metadata.add_column(column, sdtype='numerical')
+
+        num_rows = np.array([3, 0, 5])
+
+        # Run
+        copulas = StackedGaussianCopulas(parameters, distributions)
+        result = copulas.sample(num_rows, np.random.RandomState(42), max_chunk_elements=16)
+
+        # Assert
+        expected = []
+        for (_, row), model_rows in zip(parameters.iterrows(), num_rows):
+            synthesizer = GaussianCopulaSynthesizer(metadata, default_distribution=distribution)
+            synthesizer._set_parameters(row.to_dict())
+            synthesizer._model.set_random_state(np.random.RandomState(42))
+            expected.append(synthesizer._model.sample(model_rows))
+
+        expected = pd.concat(expected, ignore_index=True)
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False, rtol=1e-7)
+
+    def test_sample_constant(self):
+        """Test that constant columns are sampled as their value."""
+        # Setup
+        parameters = pd.DataFrame({
+            'univariates__x__a': [1., 2.],
+            'univariates__x__b': [1., 3.],
+            'univariates__x__loc': [4., 0.],
+            'univariates__x__scale': [0., 1.],
+        })
+        copulas = StackedGaussianCopulas(parameters, {'x': BetaUnivariate})
+
+        # Run
+        result = copulas.sample(np.array([2, 1]), np.random.RandomState(0))
+
+        # Assert
+        assert list(result['x'][:2]) == [4., 4.]
+        assert 0 < result['x'][2] < 1
+
+    def test_get_chunk_size(self):
+        """Test that the number of rows is bounded by the number of models and columns."""
+        # Setup
+        parameters = pd.DataFrame({
+            'univariates__x__loc': [0., 1., 2.],
+            'univariates__x__scale': [1., 1., 1.],
+        })
+        copulas = StackedGaussianCopulas(parameters, {'x': GaussianUnivariate})
+
+        # Run and Assert
+        assert copulas.get_chunk_size(10) == 3
+        assert copulas.get_chunk_size(2) == 1
@@ -85,6 +85,49 @@ class TestHMASynthesizer:
 
         pd.testing.assert_frame_equal(result, expected)
 
+    def test__get_extension_n_jobs(self):
+        """Test that fitting the extension in parallel matches the serial result."""
+        # Setup
+        metadata = get_multi_table_metadata()
+        metadata.add_column('oseba', 'oseba_value', sdtype='numerical')
+        child_table = pd.DataFrame({
+            'id_nesreca': [0, 0, 1, 1, 1, 2, 3, 3],
+            'oseba_val': [0, 1, 5, 2, 7, 3, 4, 1],
+            'oseba_value': [1., 2., 2.5, 3., 1., 6., 2., 0.]
+        })
+        serial = HMASynthesizer(metadata, verbose=False)
+        parallel = HMASynthesizer(metadata, verbose=False, n_jobs=2)
+
+        # Run
+        expected = serial._get_extension('oseba', child_table, 'id_nesreca', '')
+        result = parallel._get_extension('oseba', child_table, 'id_nesreca', '')
+
+        # Assert
+        assert list(result.index) == [0, 1, 2, 3]
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test__get_num_workers(self):
+        """Test that the number of workers is bounded by the number of groups."""
+        # Setup
+        metadata = get_multi_table_metadata()
+        instance = HMASynthesizer(metadata, n_jobs=4)
+
+        # Run and Assert
+        assert instance._get_num_workers(10) == 4
+        assert instance._get_num_workers(2) == 2
+        assert instance._get_num_workers(0) == 1
+
+    @pytest.mark.parametrize('n_jobs', [0, -2, 1.5, 'all', True])
+    def test___init___invalid_n_jobs(self, n_jobs):
+        """Test that an error is raised if ``n_jobs`` is not valid."""
+        # Setup
+        metadata = get_multi_table_metadata()
+        error_msg = re.escape(f"Invalid value '{n_jobs}' for parameter 'n_jobs'.")
+
+        # Run and Assert
+        with pytest.raises(SynthesizerInputError, match=error_msg):
+            HMASynthesizer(metadata, n_jobs=n_jobs)
+
     def test__get_distributions(self):
         """Test the ``_get_distributions`` method."""
         # Setup
@@ -149,8 +192,10 @@ class TestHMASynthesizer:
         # Setup
         instance = Mock()
         instance._get_pbar_args.return_value = {'desc': "(1/2) Tables 'A' and 'B' ('user_id')"}
+        instance._get_num_workers.return_value = 1
         instance.metadata._get_all_foreign_keys.return_value = ['id_upravna_enota']
         instance._table_synthesizers = {'nesreca': Mock()}
+        instance._table_parameters = {'nesreca': {}}
         child_table = pd.DataFrame({
             'id_upravna_enota': [0, 1, 2, 3]
         })
@@ -509,6 +554,136 @@ class TestHMASynthesizer:
         )
         instance._extract_parameters.assert_called_once_with(parent_row, table_name, 'session_id')
 
+    def test__sample_all_child_rows_constraints(self):
+        """Test that the rows are sampled one parent row at a time if there are constraints."""
+        # Setup
+        instance = Mock()
+        instance.metadata._get_foreign_keys.return_value = ['user_id']
+        table_synthesizer = Mock()
+        table_synthesizer._data_processor._constraints = [Mock()]
+        instance._table_synthesizers = {'sessions': table_synthesizer}
+        parent_rows = pd.DataFrame({
+            'user_id': [1, 2],
+            '__sessions__user_id__num_rows': [1., 2.]
+        })
+
+        # Run
+        result = HMASynthesizer._sample_all_child_rows(
+            instance, 'sessions', 'users', parent_rows)
+
+        # Assert
+        assert result is None
+        instance._get_child_parameters.assert_not_called()
+
+    def test__sample_all_child_rows_missing_num_rows(self):
+        """Test that the rows are sampled one parent row at a time if ``num_rows`` is missing."""
+        # Setup
+        instance = Mock()
+        instance.metadata._get_foreign_keys.return_value = ['user_id']
+        table_synthesizer = Mock()
+        table_synthesizer._data_processor._constraints = []
+        instance._table_synthesizers = {'sessions': table_synthesizer}
+        parent_rows = pd.DataFrame({
+            'user_id': [1, 2],
+            '__sessions__user_id__num_rows': [1., np.nan]
+        })
+
+        # Run
+        result = HMASynthesizer._sample_all_child_rows(
+            instance, 'sessions', 'users', parent_rows)
+
+        # Assert
+        assert result is None
+        instance._get_child_parameters.assert_not_called()
+
+    def test__get_child_parameters(self):
+        """Test that the parameters of every parent row are clipped and returned without prefix."""
+        # Setup
+        parent_rows = pd.DataFrame({
+            '__sessions__user_id__num_rows': [10, 3],
+            '__sessions__user_id__a': [-1.0, 2.0],
+            '__sessions__user_id__loc': [None, 0.5],
+            'name': ['x', 'y'],
+        }, index=[7, 8])
+        instance = Mock()
+        formatters = {}
+        for key, (min_value, max_value) in {
+            '__sessions__user_id__num_rows': (0, 5),
+            '__sessions__user_id__a': (0.1, 5),
+            '__sessions__user_id__loc': (0, 1),
+        }.items():
+            formatters[key] = MagicMock(_min_value=min_value, _max_value=max_value)
+
+        instance.extended_columns = {'sessions': formatters}
+
+        # Run
+        result = HMASynthesizer._get_child_parameters(
+            instance, parent_rows, 'sessions', 'user_id')
+
+        # Assert
+        expected = pd.DataFrame({'a': [0.1, 2.0], 'loc': [1e-6, 0.5]}, index=[7, 8])
+        pd.testing.assert_frame_equal(result, expected)
+
+    @patch('sdv.multi_table.hma.np.random.choice')
+    def test__find_parent_id(self, choice_mock):
+        """Test that the parent is chosen among the ones with rows left, based on likelihoods."""
+        # Setup
+        choice_mock.return_value = 2
+        likelihoods = np.array([0.5, np.nan, 0.25, 0.25])
+        num_rows = np.array([1., 2., 3., 0.])
+
+        # Run
+        result = HMASynthesizer._find_parent_id(likelihoods, num_rows)
+
+        # Assert
+        assert result == 2
+        np.testing.assert_array_equal(num_rows, [1., 2., 2., 0.])
+        candidates, = choice_mock.call_args[0]
+        np.testing.assert_array_equal(candidates, [0, 1, 2])
+        np.testing.assert_allclose(
+            choice_mock.call_args[1]['p'], np.array([0.5, 1 / 3, 0.25]) / (0.5 + 1 / 3 + 0.25))
+
+    @patch('sdv.multi_table.hma.np.random.choice')
+    def test__find_parent_id_all_zero(self, choice_mock):
+        """Test that the number of rows is used when all the likelihoods are zero."""
+        # Setup
+        choice_mock.return_value = 0
+        likelihoods = np.array([0., 0.])
+        num_rows = np.array([1., 3.])
+
+        # Run
+        HMASynthesizer._find_parent_id(likelihoods, num_rows)
+
+        # Assert
+        np.testing.assert_allclose(choice_mock.call_args[1]['p'], [0.25, 0.75])
+        np.testing.assert_array_equal(num_rows, [0., 3.])
+
+    def test__find_parent_ids(self):
+        """Test that the parent ids are found a chunk of likelihoods at a time."""
+        # Setup
+        np.random.seed(0)
+        instance = Mock()
+        instance.metadata.tables = {'users': Mock(primary_key='user_id')}
+        instance._find_parent_id = HMASynthesizer._find_parent_id
+        instance._iter_likelihoods.return_value = iter([
+            (pd.Index([10, 11]), np.array([[1., 0.], [1., 0.]])),
+            (pd.Index([12]), np.array([[1., 0.]])),
+        ])
+        child_table = pd.DataFrame({'value': [1, 2, 3]}, index=[10, 11, 12])
+        parent_table = pd.DataFrame({
+            'user_id': ['a', 'b'],
+            '__sessions__user_id__num_rows': [2, 1]
+        })
+
+        # Run
+        result = HMASynthesizer._find_parent_ids(
+            instance, child_table, parent_table, 'sessions', 'users', 'user_id')
+
+        # Assert
+        pd.testing.assert_series_equal(
+            result, pd.Series(['a', 'a', 'b'], index=[10, 11, 12], name='user_id'))
+        assert parent_table['__sessions__user_id__num_rows'].tolist() == [2, 1]
+
     def test_get_learned_distributions(self):
         """Test that ``get_learned_distributions`` returns a dict.
 
@@ -578,7 +753,7 @@ class TestHMASynthesizer:
         result = instance.get_parameters()
 
         # Assert
-        assert result == {'locales': 'en_CA', 'verbose': True}
+        assert result == {'locales': 'en_CA', 'verbose': True, 'n_jobs': 1}
 
     def test__add_foreign_key_columns(self):
         """Test that the ``_add_foreign_key_columns`` method adds foreign keys."""
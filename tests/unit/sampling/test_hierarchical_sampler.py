@@ -5,7 +5,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from sdv.sampling.hierarchical_sampler import BaseHierarchicalSampler
+from sdv.sampling.hierarchical_sampler import BaseHierarchicalSampler, _rebalance_num_rows
 from tests.utils import DataFrameMatcher, SeriesMatcher, get_multi_table_metadata
 
 
@@ -216,6 +216,7 @@ class TestBaseHierarchicalSampler():
         instance._table_synthesizers = {'users': Mock()}
         instance._sample_children = sample_children
         instance._add_child_rows.side_effect = _add_child_rows
+        instance._sample_all_child_rows.return_value = None
 
         # Run
         result = {
@@ -257,6 +258,47 @@ class TestBaseHierarchicalSampler():
         for result_frame, expected_frame in zip(result.values(), expected_result.values()):
             pd.testing.assert_frame_equal(result_frame, expected_frame)
 
+    def test__sample_children_all_child_rows(self):
+        """Test that the children of all the parent rows are sampled at once when supported."""
+        # Setup
+        def sample_children(table_name, sampled_data, scale):
+            pass
+
+        instance = Mock()
+        instance.metadata._get_child_map.return_value = {'users': ['sessions']}
+        instance.metadata._get_parent_map.return_value = {'users': []}
+        instance._table_sizes = {'users': 10, 'sessions': 5}
+        instance._table_synthesizers = {'users': Mock()}
+        instance._sample_children = sample_children
+        sessions = pd.DataFrame({
+            'user_id': [1, 1, 3],
+            'session_id': ['a', 'b', 'c'],
+        })
+        instance._sample_all_child_rows.return_value = sessions
+        users = pd.DataFrame({'user_id': [1, 3]})
+        result = {'users': users}
+
+        # Run
+        BaseHierarchicalSampler._sample_children(
+            self=instance,
+            table_name='users',
+            sampled_data=result
+        )
+
+        # Assert
+        instance._sample_all_child_rows.assert_called_once_with('sessions', 'users', users)
+        instance._add_child_rows.assert_not_called()
+        assert result['sessions'] is sessions
+
+    def test__sample_all_child_rows(self):
+        """Test that by default the child rows are sampled one parent row at a time."""
+        # Run
+        result = BaseHierarchicalSampler._sample_all_child_rows(
+            Mock(), 'sessions', 'users', pd.DataFrame())
+
+        # Assert
+        assert result is None
+
     def test__sample_children_no_rows_sampled(self):
         """Test sampling the children of a table where no rows created and no ``num_rows`` column.
 
@@ -285,6 +327,7 @@ class TestBaseHierarchicalSampler():
         instance._table_synthesizers = {'users': Mock()}
         instance._sample_children = sample_children
         instance._add_child_rows.side_effect = _add_child_rows
+        instance._sample_all_child_rows.return_value = None
 
         # Run
         result = {
@@ -358,6 +401,7 @@ class TestBaseHierarchicalSampler():
         instance._table_synthesizers = {'users': Mock()}
         instance._sample_children = sample_children
         instance._add_child_rows.side_effect = _add_child_rows
+        instance._sample_all_child_rows.return_value = None
 
         # Run
         result = {
@@ -667,3 +711,55 @@ class TestBaseHierarchicalSampler():
 
         # Assert
         assert data['parent']['__child__fk__num_rows'].to_list() == [2, 2, 4]
+
+    def test___enforce_table_size_out_of_bounds(self):
+        """Test it enforces the table size when it can't be reached within the bounds.
+
+        All the values should be set to the bound and the rest spread evenly among them.
+        """
+        # Setup
+        instance = MagicMock()
+        data = {
+            'parent': pd.DataFrame({
+                'fk': ['a', 'b', 'c'],
+                '__child__fk__num_rows': [1, 3, 2]
+            })
+        }
+        instance.metadata._get_foreign_keys.return_value = ['fk']
+        instance._min_child_rows = {'__child__fk__num_rows': 1}
+        instance._max_child_rows = {'__child__fk__num_rows': 3}
+        instance._table_sizes = {'child': 11}
+
+        # Run
+        BaseHierarchicalSampler._enforce_table_size(
+            instance,
+            'child',
+            'parent',
+            1.0,
+            data
+        )
+
+        # Assert
+        assert data['parent']['__child__fk__num_rows'].to_list() == [4, 4, 3]
+
+
+@pytest.mark.parametrize('total_num_rows', [0, 5, 50, 137, 300, 450, 600])
+def test__rebalance_num_rows(total_num_rows):
+    """Test that the values add up to the total and respect the bounds when possible."""
+    # Setup
+    num_rows = np.random.default_rng(0).integers(1, 5, 100)
+
+    # Run
+    result = _rebalance_num_rows(num_rows, total_num_rows, 1, 4)
+
+    # Assert
+    assert result.sum() == total_num_rows
+    if 100 <= total_num_rows <= 400:
+        assert result.min() >= 1
+        assert result.max() <= 4
+    else:
+        assert result.max() - result.min() <= 1
+
+    increased = total_num_rows > num_rows.sum()
+    changes = result - num_rows
+    assert (changes >= 0).all() if increased else (changes <= 0).all()
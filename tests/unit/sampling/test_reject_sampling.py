@@ -0,0 +1,117 @@
+import numpy as np
+
+from sdv.sampling.reject_sampling import RejectSamplingController
+
+
+class TestRejectSamplingController:
+
+    def test_get_acceptance_rate(self):
+        """Test that the rate accumulates the statistics of every update for the conditions."""
+        # Setup
+        controller = RejectSamplingController()
+
+        # Run
+        controller.update({'a': 1}, 100, 10)
+        controller.update({'a': 1}, 100, 30)
+        controller.update(None, 100, 100)
+
+        # Assert
+        assert controller.get_acceptance_rate({'a': 1}) == 0.2
+        assert controller.get_acceptance_rate() == 1.0
+
+    def test_get_acceptance_rate_unseen_conditions(self):
+        """Test that the rows sampled for other values of the same columns are used."""
+        # Setup
+        controller = RejectSamplingController()
+        controller.update({'a': 1, 'b': 'x'}, 100, 10)
+        controller.update({'b': 'y', 'a': 2}, 100, 30)
+        controller.update({'a': 1}, 100, 100)
+
+        # Run
+        rate = controller.get_acceptance_rate({'a': 3, 'b': 'z'})
+
+        # Assert
+        assert rate == 0.2
+        assert controller.get_acceptance_rate({'c': 1}) is None
+
+    def test_get_acceptance_rate_max_signatures(self):
+        """Test that the signatures over ``max_signatures`` only update the column statistics."""
+        # Setup
+        controller = RejectSamplingController(max_signatures=1)
+        controller.update({'a': 1}, 100, 10)
+        controller.update({'a': 2}, 100, 50)
+
+        # Run
+        stored_rate = controller.get_acceptance_rate({'a': 1})
+        not_stored_rate = controller.get_acceptance_rate({'a': 2})
+
+        # Assert
+        assert stored_rate == 0.1
+        assert not_stored_rate == 0.3
+        assert controller._statistics == {(('a', 1),): [100, 10]}
+        assert controller._column_statistics == {('a',): [200, 60]}
+
+    def test_get_acceptance_rate_no_valid_rows(self):
+        """Test that the rate is not zero if no valid rows have been sampled."""
+        # Setup
+        controller = RejectSamplingController()
+        controller.update({'a': 1}, 99, 0)
+
+        # Run
+        rate = controller.get_acceptance_rate({'a': 1})
+
+        # Assert
+        assert rate == 0.01
+
+    def test_get_num_rows_to_sample(self):
+        """Test that the rows to sample include a margin for the variance of valid rows."""
+        # Setup
+        controller = RejectSamplingController()
+        controller.update(None, 100, 50)
+
+        # Run
+        num_rows = controller.get_num_rows_to_sample(100, 100)
+
+        # Assert
+        expected = int(np.ceil((100 + 2 * np.sqrt(50)) / 0.5))
+        assert num_rows == expected
+
+    def test_get_num_rows_to_sample_without_rejections(self):
+        """Test that no extra rows are sampled without statistics or without rejected rows."""
+        # Setup
+        controller = RejectSamplingController()
+
+        # Run
+        without_statistics = controller.get_num_rows_to_sample(10, 10)
+        controller.update(None, 100, 100)
+        without_rejections = controller.get_num_rows_to_sample(10, 10)
+
+        # Assert
+        assert without_statistics == 10
+        assert without_rejections == 10
+
+    def test_get_num_rows_to_sample_max_oversampling(self):
+        """Test that the rows to sample are capped by ``max_oversampling`` times the batch."""
+        # Setup
+        controller = RejectSamplingController(max_oversampling=5)
+        controller.update(None, 1000, 1)
+
+        # Run
+        num_rows = controller.get_num_rows_to_sample(10, 20)
+
+        # Assert
+        assert num_rows == 100
+
+    def test_to_dict(self):
+        """Test that the acceptance rate of every set of condition columns is returned."""
+        # Setup
+        controller = RejectSamplingController()
+        controller.update(None, 10, 10)
+        controller.update({'b': 2, 'a': 1}, 10, 5)
+        controller.update({'a': 3, 'b': 4}, 10, 0)
+
+        # Run
+        result = controller.to_dict()
+
+        # Assert
+        assert result == {'[]': 1.0, "['a', 'b']": 0.25}
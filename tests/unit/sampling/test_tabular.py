@@ -1,5 +1,9 @@
 """Tests for the sdv.sampling.tabular module."""
-from sdv.sampling.tabular import Condition
+import numpy as np
+import pandas as pd
+import pytest
+
+from sdv.sampling.tabular import BatchConditions, Condition
 
 
 class TestCondition():
@@ -80,3 +84,110 @@ class TestCondition():
 
         # Assert
         assert condition_num_rows == num_rows
+
+
+class TestBatchConditions():
+
+    def test___init__(self):
+        """Test that ``column_values`` and ``num_rows_column`` are stored."""
+        # Setup
+        column_values = pd.DataFrame({'a': [1, 2], 'count': [3, 4]})
+
+        # Run
+        conditions = BatchConditions(column_values, num_rows_column='count')
+
+        # Assert
+        assert conditions.column_values is column_values
+        assert conditions.num_rows_column == 'count'
+
+    def test___init__not_dataframe(self):
+        """Test that an error is raised if ``column_values`` is not a DataFrame."""
+        # Run and Assert
+        with pytest.raises(ValueError, match="'column_values' must be a pandas DataFrame."):
+            BatchConditions({'a': [1, 2]})
+
+    def test___init__missing_num_rows_column(self):
+        """Test that an error is raised if the number of rows column does not exist."""
+        # Setup
+        column_values = pd.DataFrame({'a': [1, 2]})
+
+        # Run and Assert
+        with pytest.raises(ValueError, match="The column 'count' is not in 'column_values'."):
+            BatchConditions(column_values, num_rows_column='count')
+
+    @pytest.mark.parametrize('counts', [
+        [1, np.nan], [1, -1], [1, 1.5], ['1', '2'], [True, False], [1, np.inf]
+    ])
+    def test___init__invalid_num_rows_column(self, counts):
+        """Test that an error is raised if the number of rows are not non-negative integers."""
+        # Setup
+        column_values = pd.DataFrame({'a': [1, 2], 'count': counts})
+
+        # Run and Assert
+        error_msg = "The column 'count' must only contain non-negative integers"
+        with pytest.raises(ValueError, match=error_msg):
+            BatchConditions(column_values, num_rows_column='count')
+
+    def test___init__float_num_rows_column(self):
+        """Test that integral float numbers of rows are valid."""
+        # Setup
+        column_values = pd.DataFrame({'a': [1, 2], 'count': [0., 2.]})
+
+        # Run
+        conditions = BatchConditions(column_values, num_rows_column='count')
+
+        # Assert
+        assert conditions.get_num_rows() == 2
+
+    def test_get_column_values(self):
+        """Test that the number of rows column is not part of the condition values."""
+        # Setup
+        column_values = pd.DataFrame({'a': [1, 2], 'count': [3, 4]})
+        conditions = BatchConditions(column_values, num_rows_column='count')
+
+        # Run
+        result = conditions.get_column_values()
+
+        # Assert
+        pd.testing.assert_frame_equal(result, pd.DataFrame({'a': [1, 2]}))
+
+    def test_get_num_rows(self):
+        """Test that the number of rows of all the conditions is added up."""
+        # Setup
+        column_values = pd.DataFrame({'a': [1, 2], 'count': [3, 4]})
+
+        # Run
+        num_rows = BatchConditions(column_values, num_rows_column='count').get_num_rows()
+        default_num_rows = BatchConditions(column_values).get_num_rows()
+
+        # Assert
+        assert num_rows == 7
+        assert default_num_rows == 2
+
+    def test_get_num_rows_per_condition(self):
+        """Test that one row per condition is the default."""
+        # Setup
+        column_values = pd.DataFrame({'a': [1, 2, 3]})
+
+        # Run
+        result = BatchConditions(column_values).get_num_rows_per_condition()
+
+        # Assert
+        np.testing.assert_array_equal(result, [1, 1, 1])
+
+    def test_to_dataframe(self):
+        """Test that every condition is repeated as many times as rows to generate."""
+        # Setup
+        column_values = pd.DataFrame({
+            'a': [1, 2, 3],
+            'b': ['x', 'y', 'z'],
+            'count': [2, 0, 1],
+        }, index=[10, 11, 12])
+        conditions = BatchConditions(column_values, num_rows_column='count')
+
+        # Run
+        result = conditions.to_dataframe()
+
+        # Assert
+        expected = pd.DataFrame({'a': [1, 1, 3], 'b': ['x', 'x', 'z']})
+        pd.testing.assert_frame_equal(result, expected)
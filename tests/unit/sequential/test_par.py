@@ -1,19 +1,147 @@
 import re
-from unittest.mock import ANY, Mock, mock_open, patch
+from unittest.mock import ANY, Mock, call, mock_open, patch
 
 import numpy as np
 import pandas as pd
 import pytest
+import torch
+from deepecho import PARModel
 from rdt.transformers import FloatFormatter, UnixTimestampEncoder
 
 from sdv.data_processing.data_processor import DataProcessor
 from sdv.errors import InvalidDataError, NotFittedError, SamplingError, SynthesizerInputError
+from sdv.io import read_parquet
 from sdv.metadata.single_table import SingleTableMetadata
-from sdv.sampling import Condition
-from sdv.sequential.par import PARSynthesizer
+from sdv.sampling import BatchConditions
+from sdv.sequential.par import (
+    PARSynthesizer, _assemble_sequences, _can_sample_in_batches, _sample_sequences,
+    _sample_shard, _select_best_samples)
 from sdv.single_table.copulas import GaussianCopulaSynthesizer
 
 
+def _get_fitted_par_model(sample_size=1):
+    model = PARModel(epochs=1, sample_size=sample_size, cuda=False, verbose=False)
+    sequences = [
+        {'context': ['M', 1.0], 'data': [[1.0, 2.0, np.nan], ['a', 'b', 'a']]},
+        {'context': ['F', 3.0], 'data': [[4.0, 5.0], ['b', None]]},
+    ]
+    model.fit_sequences(sequences, ['categorical', 'continuous'], ['continuous', 'categorical'])
+    return model
+
+
+def test__assemble_sequences():
+    """Test that the sequences are grouped by entity, sorted by sequence index and segmented."""
+    # Setup
+    data = pd.DataFrame({
+        'time': [3, 1, 2, 1, 4, 2],
+        'gender': ['M', 'F', 'M', 'M', 'M', 'F'],
+        'name': ['John', 'Jane', 'John', 'John', 'John', 'Jane'],
+        'measurement': [65., 55., 60., 58., 70., np.nan]
+    })
+
+    # Run
+    sequences = _assemble_sequences(data, ['name'], ['gender'], None, 'time')
+    segments = _assemble_sequences(data, ['name'], [], 2, None)
+
+    # Assert
+    assert len(sequences) == 2
+    np.testing.assert_array_equal(sequences[0]['context'], np.array(['F'], dtype=object))
+    assert sequences[0]['data'][0] == [1, 2]
+    np.testing.assert_array_equal(sequences[0]['data'][1], [55., np.nan])
+    np.testing.assert_array_equal(sequences[1]['context'], np.array(['M'], dtype=object))
+    assert sequences[1]['data'] == [[1, 2, 3, 4], [58., 60., 65., 70.]]
+    assert len(segments) == 3
+    assert segments[0]['context'] == []
+    assert [segment['data'][0] for segment in segments] == [[1, 2], [3, 2], [1, 4]]
+
+
+def test__assemble_sequences_context_not_constant():
+    """Test that an error is raised if the context changes inside an entity."""
+    # Setup
+    data = pd.DataFrame({
+        'gender': ['F', 'M', 'M'],
+        'name': ['John', 'John', 'Jane'],
+        'measurement': [55, 60, 65]
+    })
+
+    # Run and Assert
+    with pytest.raises(ValueError, match='Context columns are not constant within each entity.'):
+        _assemble_sequences(data, ['name'], ['gender'], None, None)
+
+
+def test__can_sample_in_batches():
+    """Test that only fitted ``PARModel`` instances can sample in batches."""
+    # Setup
+    model = _get_fitted_par_model()
+
+    # Run and Assert
+    assert _can_sample_in_batches(model) is True
+    assert _can_sample_in_batches(PARModel()) is False
+    assert _can_sample_in_batches(Mock()) is False
+
+
+def test__sample_sequences():
+    """Test that one sequence of the given length is sampled for each context."""
+    # Setup
+    model = _get_fitted_par_model(sample_size=2)
+    context = pd.DataFrame({'gender': ['M', 'F', 'M'], 'age': [1.0, np.nan, 3.0]})
+
+    # Run
+    sequences, lengths = _sample_sequences(model, context, sequence_length=4)
+
+    # Assert
+    np.testing.assert_array_equal(lengths, [4, 4, 4])
+    assert len(sequences) == 2
+    assert all(len(values) == 12 for values in sequences)
+    assert all(value is None or isinstance(value, float) for value in sequences[0])
+    assert set(sequences[1]) <= {'a', 'b', None}
+
+
+def test__sample_sequences_sampled_lengths():
+    """Test that the length of each sequence is sampled within the lengths seen in fit."""
+    # Setup
+    model = _get_fitted_par_model()
+    context = pd.DataFrame({'gender': ['M'] * 20, 'age': [2.0] * 20})
+
+    # Run
+    sequences, lengths = _sample_sequences(model, context)
+
+    # Assert
+    assert set(lengths) <= {2, 3}
+    assert len(sequences[0]) == lengths.sum()
+
+
+def test__sample_shard():
+    """Test that the shard is sampled with the given seed and without a progress bar."""
+    # Setup
+    synthesizer = Mock()
+    synthesizer._sample.side_effect = lambda *args, **kwargs: np.random.random()
+    context = pd.DataFrame({'name': [1, 2]})
+
+    # Run
+    first = _sample_shard(synthesizer, context, 5, 42)
+    second = _sample_shard(synthesizer, context, 5, 42)
+
+    # Assert
+    assert first == second
+    synthesizer._sample.assert_called_with(context, 5, show_progress_bar=False)
+
+
+def test__select_best_samples():
+    """Test that the rows of the sample with the highest log likelihood are kept."""
+    # Setup
+    best = (np.array([[1.], [2.], [3.], [4.]]), np.array([1, 3]), np.array([-1., -5.]))
+    sample = (np.array([[5.], [6.], [7.], [8.]]), np.array([2, 2]), np.array([-3., -2.]))
+
+    # Run
+    data, lengths, log_likelihood = _select_best_samples(best, sample)
+
+    # Assert
+    np.testing.assert_array_equal(data, [[1.], [7.], [8.]])
+    np.testing.assert_array_equal(lengths, [1, 2])
+    np.testing.assert_array_equal(log_likelihood, [-1., -2.])
+
+
 class TestPARSynthesizer:
 
     def get_metadata(self, add_sequence_key=True, add_sequence_index=False):
@@ -252,6 +380,33 @@ class TestPARSynthesizer:
         assert list(par.extended_columns.keys()) == ['time']
         assert par.extended_columns['time'].enforce_min_max_values is True
 
+    def test__transform_sequence_index_unsorted(self):
+        """Test that the diffs are aligned with their rows when the data is not sorted by key."""
+        # Setup
+        metadata = self.get_metadata(add_sequence_index=True)
+        par = PARSynthesizer(
+            metadata=metadata
+        )
+        data = pd.DataFrame({
+            'time': [1, 5, 3, 8],
+            'gender': ['M', 'F', 'M', 'F'],
+            'name': ['John', 'Jane', 'John', 'Jane'],
+            'measurement': [55, 60, 65, 68]
+        }, index=[10, 11, 12, 13])
+
+        # Run
+        transformed_data = par._transform_sequence_index(data)
+
+        # Assert
+        expected = pd.DataFrame({
+            'time': [2., 3., 2., 3.],
+            'gender': ['M', 'F', 'M', 'F'],
+            'name': ['John', 'Jane', 'John', 'Jane'],
+            'measurement': [55, 60, 65, 68],
+            'time.context': [1, 5, 1, 5]
+        }, index=[10, 11, 12, 13])
+        pd.testing.assert_frame_equal(transformed_data, expected)
+
     def test__transform_sequence_index_single_instances(self):
         # Setup
         metadata = self.get_metadata(add_sequence_index=True)
@@ -452,11 +607,11 @@ class TestPARSynthesizer:
         pd.testing.assert_frame_equal(fitted_data.sort_values(by='name'), expected_fitted_data)
 
     @patch('sdv.sequential.par.PARModel')
-    @patch('sdv.sequential.par.assemble_sequences')
+    @patch('sdv.sequential.par._assemble_sequences')
     def test__fit_sequence_columns(self, assemble_sequences_mock, model_mock):
         """Test that the method assembles sequences properly and fits the ``PARModel`` to them.
 
-        The method should use the ``assemble_sequences`` method to create a list of sequences
+        The method should use the ``_assemble_sequences`` method to create a list of sequences
         that the model can fit to. It also needs to extract the data types for the context
         and non-context columns.
         """
@@ -483,8 +638,7 @@ class TestPARSynthesizer:
             ['name'],
             ['gender'],
             None,
-            None,
-            drop_sequence_index=False
+            None
         )
         model_mock.assert_called_once_with(epochs=128, sample_size=1, cuda=True, verbose=False)
         model_mock.return_value.fit_sequences.assert_called_once_with(
@@ -494,7 +648,7 @@ class TestPARSynthesizer:
         )
 
     @patch('sdv.sequential.par.PARModel')
-    @patch('sdv.sequential.par.assemble_sequences')
+    @patch('sdv.sequential.par._assemble_sequences')
     def test__fit_sequence_columns_with_sequence_index(self, assemble_sequences_mock, model_mock):
         """Test the method when a sequence_index is present.
 
@@ -534,7 +688,6 @@ class TestPARSynthesizer:
         assert assemble_call_args_list[0][0][2] == ['gender']
         assert assemble_call_args_list[0][0][3] is None
         assert assemble_call_args_list[0][0][4] == 'time'
-        assert assemble_call_args_list[0][1] == {'drop_sequence_index': False}
         expected_sequences = [
             {'context': np.array(['F'], dtype=object), 'data': [[1, 1], [55, 60], [1, 1]]},
             {
@@ -550,7 +703,7 @@ class TestPARSynthesizer:
         )
 
     @patch('sdv.sequential.par.PARModel')
-    @patch('sdv.sequential.par.assemble_sequences')
+    @patch('sdv.sequential.par._assemble_sequences')
     def test__fit_sequence_columns_bad_dtype(self, assemble_sequences_mock, model_mock):
         """Test the method when a column has an unsupported dtype."""
         # Setup
@@ -756,6 +909,49 @@ class TestPARSynthesizer:
         })
         pd.testing.assert_frame_equal(sampled, expected_output, check_dtype=False)
 
+    @patch('sdv.sequential.par._sample_sequences')
+    @patch('sdv.sequential.par._can_sample_in_batches')
+    def test__sample_from_par_in_batches(self, can_sample_mock, sample_sequences_mock):
+        """Test that the sequences are sampled in batches and the sequence index rebuilt."""
+        # Setup
+        metadata = self.get_metadata()
+        metadata.set_sequence_index('time')
+        par = PARSynthesizer(metadata=metadata, context_columns=['gender'])
+        par._sample_batch_size = 2
+        can_sample_mock.return_value = True
+        mock_transformer = Mock()
+        mock_transformer.reverse_transform.side_effect = lambda data: data * 10
+        par.extended_columns = {'time': mock_transformer}
+        par._data_columns = ['time', 'measurement']
+        par._output_columns = ['time', 'gender', 'name', 'measurement']
+        par._extra_context_columns = {'time.context': {'sdtype': 'numerical'}}
+        sample_sequences_mock.side_effect = [
+            ([[1, 2, 2, 5, 1], [55, 60, 65, 70, 75]], np.array([3, 2])),
+            ([[3], [80]], np.array([1])),
+        ]
+        context_columns = pd.DataFrame({
+            'name': ['John', 'Jane', 'Doe'],
+            'gender': ['M', 'F', 'F'],
+            'time.context': [18000, 100, 5]
+        })
+
+        # Run
+        sampled = par._sample_from_par(context_columns)
+
+        # Assert
+        expected_output = pd.DataFrame({
+            'time': [18000, 18020, 18040, 100, 110, 5],
+            'gender': ['M', 'M', 'M', 'F', 'F', 'F'],
+            'name': ['John', 'John', 'John', 'Jane', 'Jane', 'Doe'],
+            'measurement': [55, 60, 65, 70, 75, 80]
+        })
+        pd.testing.assert_frame_equal(sampled, expected_output, check_dtype=False)
+        first_context = sample_sequences_mock.call_args_list[0][0][1]
+        pd.testing.assert_frame_equal(
+            first_context,
+            context_columns.set_index('name').iloc[:2]
+        )
+
     def test__sample(self):
         """This method should sample from par and reverse transform the data."""
         # Setup
@@ -770,9 +966,34 @@ class TestPARSynthesizer:
         par._sample(context_columns=context_columns, sequence_length=5)
 
         # Assert
-        par._sample_from_par.assert_called_once_with(context_columns, 5)
+        par._sample_from_par.assert_called_once_with(context_columns, 5, True)
         par._data_processor.reverse_transform.assert_called_once_with(fake_sampled)
 
+    @patch('sdv.sequential.par.ProcessPoolExecutor')
+    def test__sample_in_shards(self, executor_mock):
+        """Test that contiguous shards of the context are sampled and concatenated in order."""
+        # Setup
+        def submit(function, *args):
+            return Mock(result=Mock(return_value=function(*args)))
+
+        executor_mock.return_value.__enter__.return_value.submit.side_effect = submit
+        par = PARSynthesizer(metadata=self.get_metadata())
+        par._sample = Mock(side_effect=lambda context, *args, **kwargs: context.copy())
+        context = pd.DataFrame({'name': range(10), 'gender': ['M', 'F'] * 5})
+
+        # Run
+        np.random.seed(0)
+        sampled = par._sample_in_shards(context, 5, 2)
+
+        # Assert
+        executor_mock.assert_called_once_with(max_workers=2)
+        assert par._sample.call_count == 8
+        first_shard = par._sample.call_args_list[0][0][0]
+        pd.testing.assert_frame_equal(first_shard, context.iloc[:2])
+        assert par._sample.call_args_list[0][0][1] == 5
+        assert par._sample.call_args_list[0][1] == {'show_progress_bar': False}
+        pd.testing.assert_frame_equal(sampled, context)
+
     def test_sample(self):
         """Test that the method samples the context columns and uses them to sample from PAR."""
         # Setup
@@ -795,7 +1016,159 @@ class TestPARSynthesizer:
         # Assert
         par._context_synthesizer._sample_with_progress_bar.assert_called_once_with(
             3, output_file_path='disable', show_progress_bar=False)
-        par._sample.assert_called_once_with(context_columns, 2)
+        par._sample.assert_called_once_with(context_columns, 2, True)
+
+    def test_sample_n_jobs(self):
+        """Test that the sequences are sampled in shards when ``n_jobs`` is greater than 1."""
+        # Setup
+        metadata = self.get_metadata()
+        par = PARSynthesizer(
+            metadata=metadata,
+            context_columns=['gender']
+        )
+        par._model = Mock(device=torch.device('cpu'))
+        par._context_synthesizer = Mock()
+        context_columns = pd.DataFrame({
+            'name': ['John', 'John', 'Jane'],
+            'gender': ['M', 'M', 'F']
+        })
+        par._context_synthesizer._sample_with_progress_bar.return_value = context_columns
+        par._sample_in_shards = Mock()
+
+        # Run
+        result = par.sample(3, 2, n_jobs=4)
+
+        # Assert
+        par._sample_in_shards.assert_called_once_with(context_columns, 2, 3, True)
+        assert result == par._sample_in_shards.return_value
+
+    @pytest.mark.parametrize('n_jobs', [0, -2, 1.5, 'all', True])
+    def test_sample_invalid_n_jobs(self, n_jobs):
+        """Test that an error is raised if ``n_jobs`` is not valid."""
+        # Setup
+        par = PARSynthesizer(metadata=self.get_metadata())
+
+        # Run and Assert
+        error_msg = re.escape(f"Invalid value '{n_jobs}' for parameter 'n_jobs'.")
+        with pytest.raises(SynthesizerInputError, match=error_msg):
+            par.sample(3, n_jobs=n_jobs)
+
+    def test_sample_in_chunks(self):
+        """Test that the context and the sequences are sampled chunk by chunk."""
+        # Setup
+        par = PARSynthesizer(metadata=self.get_metadata())
+        contexts = [pd.DataFrame({'name': range(size)}) for size in (2, 2, 1)]
+        chunks = [pd.DataFrame({'name': [size] * 3}) for size in (2, 2, 1)]
+        par._sample_context = Mock(side_effect=contexts)
+        par._sample_with_n_jobs = Mock(side_effect=chunks)
+
+        # Run
+        result = list(par.sample_in_chunks(5, 3, chunk_size=2))
+
+        # Assert
+        assert result == chunks
+        assert par._sample_context.call_args_list == [call(2, 0), call(2, 2), call(1, 4)]
+        par._sample_with_n_jobs.assert_called_with(contexts[2], 3, 1, show_progress_bar=False)
+
+    @pytest.mark.parametrize('chunk_size', [0, -1, 1.5, True])
+    def test_sample_in_chunks_invalid_chunk_size(self, chunk_size):
+        """Test that an error is raised if ``chunk_size`` is not a positive integer."""
+        # Setup
+        par = PARSynthesizer(metadata=self.get_metadata())
+
+        # Run and Assert
+        error_msg = re.escape(f"Invalid value '{chunk_size}' for parameter 'chunk_size'.")
+        with pytest.raises(SynthesizerInputError, match=error_msg):
+            par.sample_in_chunks(3, chunk_size=chunk_size)
+
+    def test_sample_to_file_csv(self, tmp_path):
+        """Test that every chunk is appended to the CSV file."""
+        # Setup
+        par = PARSynthesizer(metadata=self.get_metadata())
+        chunks = [
+            pd.DataFrame({'name': ['John', 'John'], 'measurement': [1., 2.]}),
+            pd.DataFrame({'name': ['Jane'], 'measurement': [3.]}),
+        ]
+        par.sample_in_chunks = Mock(return_value=iter(chunks))
+        filepath = str(tmp_path / 'sequences.csv')
+
+        # Run
+        par.sample_to_file(2, filepath, chunk_size=1)
+
+        # Assert
+        par.sample_in_chunks.assert_called_once_with(2, None, 1, 1)
+        pd.testing.assert_frame_equal(
+            pd.read_csv(filepath), pd.concat(chunks, ignore_index=True))
+
+    def test_sample_to_file_parquet(self, tmp_path):
+        """Test that every chunk is written as a row group of the Parquet file."""
+        # Setup
+        par = PARSynthesizer(metadata=self.get_metadata())
+        chunks = [
+            pd.DataFrame({'name': ['John', 'John'], 'measurement': [1., 2.]}),
+            pd.DataFrame({'name': ['Jane'], 'measurement': [3.]}),
+        ]
+        par.sample_in_chunks = Mock(return_value=iter(chunks))
+        filepath = str(tmp_path / 'sequences.parquet')
+
+        # Run
+        par.sample_to_file(2, filepath, chunk_size=1)
+
+        # Assert
+        pd.testing.assert_frame_equal(
+            read_parquet(filepath), pd.concat(chunks, ignore_index=True))
+
+    def test_sample_to_file_parquet_missing_values(self, tmp_path):
+        """Test that the fitted dtypes are used when the first chunk only has missing values."""
+        # Setup
+        par = PARSynthesizer(metadata=self.get_metadata())
+        par._data_processor._dtypes = pd.Series({
+            'name': np.dtype('O'),
+            'measurement': np.dtype('float64'),
+        })
+        chunks = [
+            pd.DataFrame({'name': [None, None], 'measurement': [None, None]}),
+            pd.DataFrame({'name': ['Jane'], 'measurement': [3.]}),
+        ]
+        par.sample_in_chunks = Mock(return_value=iter(chunks))
+        filepath = str(tmp_path / 'sequences.parquet')
+
+        # Run
+        par.sample_to_file(2, filepath, chunk_size=1)
+
+        # Assert
+        expected = pd.DataFrame({
+            'name': [None, None, 'Jane'],
+            'measurement': [np.nan, np.nan, 3.],
+        })
+        pd.testing.assert_frame_equal(read_parquet(filepath), expected)
+
+    def test_sample_to_file_error(self, tmp_path):
+        """Test that the error mentions the file with the partial results."""
+        # Setup
+        par = PARSynthesizer(metadata=self.get_metadata())
+
+        def sample_in_chunks(*args):
+            yield pd.DataFrame({'name': ['John'], 'measurement': [1.]})
+            raise ValueError('Sampling failed.')
+
+        par.sample_in_chunks = sample_in_chunks
+        filepath = str(tmp_path / 'sequences.csv')
+
+        # Run and Assert
+        with pytest.raises(ValueError, match='Partial results are stored in'):
+            par.sample_to_file(2, filepath, chunk_size=1)
+
+        assert len(pd.read_csv(filepath)) == 1
+
+    def test_sample_to_file_no_path(self):
+        """Test that an error is raised if no file path is given."""
+        # Setup
+        par = PARSynthesizer(metadata=self.get_metadata())
+
+        # Run and Assert
+        with pytest.raises(SynthesizerInputError, match="Please provide an 'output_file_path'."):
+            par.sample_to_file(2, None)
 
     def test_sample_sequence_key_needs_to_be_filled_in(self):
         """Test that the method adds the sequence key to the context columns if necessary."""
@@ -818,7 +1191,7 @@ class TestPARSynthesizer:
         # Assert
         par._context_synthesizer._sample_with_progress_bar.assert_called_once_with(
             3, output_file_path='disable', show_progress_bar=False)
-        par._sample.assert_called_once_with(context_columns, 2)
+        par._sample.assert_called_once_with(context_columns, 2, True)
         expected_context_columns = pd.DataFrame({
             'gender': ['M', 'M', 'F'],
             'name': [0, 1, 2]
@@ -850,13 +1223,12 @@ class TestPARSynthesizer:
 
         # Assert
         call_args, _ = par._context_synthesizer.sample_from_conditions.call_args
-        expected_conditions = [
-            Condition({'gender': 'M'}), Condition({'gender': 'M'}), Condition({'gender': 'F'})
-        ]
-        assert len(call_args[0]) == len(expected_conditions)
-        for arg, expected in zip(call_args[0], expected_conditions):
-            assert arg.column_values == expected.column_values
-            assert arg.num_rows == expected.num_rows
+        assert len(call_args[0]) == 1
+        assert isinstance(call_args[0][0], BatchConditions)
+        pd.testing.assert_frame_equal(
+            call_args[0][0].to_dataframe(),
+            pd.DataFrame({'gender': ['M', 'M', 'F']})
+        )
 
         expected_call_arg = pd.DataFrame({
             'id_col': ['ID-1', 'ID-2', 'ID-3'],
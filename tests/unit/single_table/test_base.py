@@ -14,7 +14,8 @@ from sdv import version
 from sdv.constraints.errors import AggregateConstraintsError
 from sdv.errors import ConstraintsNotMetError, SynthesizerInputError, VersionError
 from sdv.metadata.single_table import SingleTableMetadata
-from sdv.sampling.tabular import Condition
+from sdv.sampling.reject_sampling import RejectSamplingController
+from sdv.sampling.tabular import BatchConditions, Condition
 from sdv.single_table import (
     CopulaGANSynthesizer, CTGANSynthesizer, GaussianCopulaSynthesizer, TVAESynthesizer)
 from sdv.single_table.base import COND_IDX, BaseSingleTableSynthesizer
@@ -718,7 +719,7 @@ class TestBaseSingleTableSynthesizer:
         instance's model ``set_random_state`` method in order to assign it to it.
         """
         # Setup
-        rng_seed = Mock()
+        rng_seed = 5
         metadata = Mock()
         instance = BaseSingleTableSynthesizer(metadata)
         instance._model = Mock()
@@ -729,6 +730,23 @@ class TestBaseSingleTableSynthesizer:
         # Assert
         instance._model.set_random_state.assert_called_once_with(rng_seed)
         assert instance._random_state_set is True
+        assert instance._seed_sequence.entropy == 5
+
+    @patch('sdv.single_table.base.DataProcessor')
+    def test__set_random_state_tuple(self, mock_data_processor):
+        """Test that the seed sequence uses the entropy of the numpy random state in the tuple."""
+        # Setup
+        instance = BaseSingleTableSynthesizer(Mock())
+        instance._model = Mock()
+        random_state = (np.random.RandomState(5), Mock())
+
+        # Run
+        instance._set_random_state(random_state)
+
+        # Assert
+        instance._model.set_random_state.assert_called_once_with(random_state)
+        np.testing.assert_array_equal(
+            instance._seed_sequence.entropy, np.random.RandomState(5).get_state()[1])
 
     def test_reset_sampling(self):
         """Test the ``reset_sampling`` method.
@@ -790,8 +808,7 @@ class TestBaseSingleTableSynthesizer:
         instance = Mock()
         instance._random_state_set = False
         instance._sample.return_value = pd.DataFrame()
-        instance._data_processor.reverse_transform.return_value = data
-        instance._data_processor.filter_valid.return_value = data
+        instance._data_processor.reverse_transform_valid.return_value = data
         instance._data_processor._hyper_transformer._input_columns = []
 
         # Run
@@ -801,16 +818,16 @@ class TestBaseSingleTableSynthesizer:
         assert num_valid == 3
         pd.testing.assert_frame_equal(sampled, data)
         instance._sample.assert_called_once_with(3)
-        instance._data_processor.reverse_transform.assert_called_once_with(
-            instance._sample.return_value
-        )
-        instance._data_processor.filter_valid.assert_called_once_with(
-            instance._data_processor.reverse_transform.return_value
+        instance._data_processor.reverse_transform_valid.assert_called_once_with(
+            instance._sample.return_value, None, None
         )
         instance._set_random_state.assert_called_once_with(73251)
 
     def test__sample_rows_with_conditions(self):
-        """Test that sample rows calls with the transformed conditions the ``_sample``."""
+        """Test that sample rows calls with the transformed conditions the ``_sample``.
+
+        The rows are filtered with ``_filter_conditions`` during the reverse transformation.
+        """
         # Setup
         data = pd.DataFrame({
             'name': ['John', 'Doe', 'John Doe'],
@@ -818,7 +835,9 @@ class TestBaseSingleTableSynthesizer:
         })
         instance = Mock()
         instance._sample.return_value = pd.DataFrame()
-        instance._data_processor.reverse_transform.return_value = data
+        instance._data_processor.reverse_transform_valid.side_effect = (
+            lambda raw, columns, filter_conditions: filter_conditions(data)
+        )
         instance._data_processor._hyper_transformer._input_columns = []
         instance._filter_conditions.return_value = data[data.name == 'John Doe']
         conditions = {'salary': 80.}
@@ -836,12 +855,11 @@ class TestBaseSingleTableSynthesizer:
         assert num_valid == 1
         pd.testing.assert_frame_equal(sampled, data[data.name == 'John Doe'])
         instance._sample.assert_called_once_with(3, {'salary': 80.0})
-        instance._data_processor.reverse_transform.assert_called_once_with(
-            instance._sample.return_value
-        )
-        instance._data_processor.filter_valid.assert_called_once_with(
-            instance._data_processor.reverse_transform.return_value
-        )
+        reverse_transform_args = instance._data_processor.reverse_transform_valid.call_args[0]
+        assert reverse_transform_args[0] is instance._sample.return_value
+        assert reverse_transform_args[1] == ['salary']
+        instance._filter_conditions.assert_called_once_with(
+            data, conditions={'salary': 80.}, float_rtol=0.1)
 
     def test__sample_rows_with_previous_rows(self):
         """Test that previous rows are being concatenated when provided to ``_sample``."""
@@ -858,8 +876,7 @@ class TestBaseSingleTableSynthesizer:
         instance = Mock()
         instance._sample.return_value = pd.DataFrame()
         instance._data_processor._hyper_transformer._input_columns = []
-        instance._data_processor.filter_valid = lambda x: x
-        instance._data_processor.reverse_transform.return_value = data
+        instance._data_processor.reverse_transform_valid.return_value = data
 
         # Run
         sampled, num_valid = BaseSingleTableSynthesizer._sample_rows(
@@ -873,10 +890,32 @@ class TestBaseSingleTableSynthesizer:
         assert num_valid == 6
         pd.testing.assert_frame_equal(sampled, expected_data)
         instance._sample.assert_called_once_with(3)
-        instance._data_processor.reverse_transform.assert_called_once_with(
-            instance._sample.return_value
+        instance._data_processor.reverse_transform_valid.assert_called_once_with(
+            instance._sample.return_value, None, None
         )
 
+    def test__sample_rows_keep_extra_columns(self):
+        """Test that the extra columns of the valid rows are kept."""
+        # Setup
+        raw_sampled = pd.DataFrame({'name': [0, 1, 2], 'extra': [5, 6, 7]})
+        data = pd.DataFrame({'name': ['John', 'John Doe']}, index=[0, 2])
+        instance = Mock()
+        instance._sample.return_value = raw_sampled
+        instance._data_processor._hyper_transformer._input_columns = ['name']
+        instance._data_processor.reverse_transform_valid.return_value = data
+
+        # Run
+        sampled, num_valid = BaseSingleTableSynthesizer._sample_rows(
+            instance, 3, keep_extra_columns=True)
+
+        # Assert
+        expected_data = pd.DataFrame({
+            'name': ['John', 'John Doe'],
+            'extra': [5, 7]
+        }, index=[0, 2])
+        assert num_valid == 2
+        pd.testing.assert_frame_equal(sampled, expected_data)
+
     def test__sample_rows_notimplementederror(self):
         """Test when the model does not support conditional sampling and raises an error."""
         # Setup
@@ -885,7 +924,9 @@ class TestBaseSingleTableSynthesizer:
             'salary': [90.0, 100.0, 80.0]
         })
         instance = Mock()
-        instance._data_processor.reverse_transform.return_value = data
+        instance._data_processor.reverse_transform_valid.side_effect = (
+            lambda raw, columns, filter_conditions: filter_conditions(data)
+        )
         instance._data_processor._hyper_transformer._input_columns = []
         instance._filter_conditions.return_value = data[data.name == 'John Doe']
         conditions = {'salary': 80.}
@@ -934,6 +975,7 @@ class TestBaseSingleTableSynthesizer:
         instance = Mock()
         instance.metadata.columns.keys.return_value = ['name', 'salary']
         instance._sample_rows.return_value = (sampled_data, 3)
+        instance._get_reject_sampling.return_value = RejectSamplingController()
 
         # Run
         result = BaseSingleTableSynthesizer._sample_batch(
@@ -955,7 +997,7 @@ class TestBaseSingleTableSynthesizer:
         assert conditions is None
         assert trans_cond is None
         assert float_rtol == 0.01
-        pd.testing.assert_frame_equal(sampled, pd.DataFrame())
+        assert sampled is None
         assert keep_extra_columns is False
 
     def test__sample_batch_with_sampled_data_bigger_than_batch_size(self):
@@ -971,7 +1013,8 @@ class TestBaseSingleTableSynthesizer:
         })
         instance = Mock()
         instance.metadata.columns.keys.return_value = ['name', 'salary']
-        instance._sample_rows.return_value = (sampled_data, 3)
+        instance._sample_rows.return_value = (sampled_data, 4)
+        instance._get_reject_sampling.return_value = RejectSamplingController()
 
         # Run
         result = BaseSingleTableSynthesizer._sample_batch(
@@ -987,14 +1030,7 @@ class TestBaseSingleTableSynthesizer:
 
         # Assert
         pd.testing.assert_frame_equal(result, sampled_data.head(3))
-        _sample_rows_args = instance._sample_rows.call_args[0]
-        rows, conditions, trans_cond, float_rtol, sampled, keep_extra_columns = _sample_rows_args
-        assert rows == 3
-        assert conditions is None
-        assert trans_cond is None
-        assert float_rtol == 0.01
-        pd.testing.assert_frame_equal(sampled, pd.DataFrame())
-        assert keep_extra_columns is False
+        instance._sample_rows.assert_called_once_with(3, None, None, 0.01, None, False)
 
     def test__sample_batch_max_tries_reached(self):
         """Test that when ``max_tries`` is reached, a break occurs."""
@@ -1005,7 +1041,7 @@ class TestBaseSingleTableSynthesizer:
         })
         instance = Mock()
         instance.metadata.columns.keys.return_value = ['name', 'salary']
-        instance._sample_rows.return_value = (sampled_data, 3)
+        instance._sample_rows.return_value = (sampled_data, 4)
 
         # Run
         result = BaseSingleTableSynthesizer._sample_batch(
@@ -1020,10 +1056,59 @@ class TestBaseSingleTableSynthesizer:
         )
 
         # Assert
-        pd.testing.assert_frame_equal(result, sampled_data)
-        _sample_rows_args = instance._sample_rows.call_args[0]
-        rows, conditions, trans_cond, float_rtol, sampled, keep_extra_columns = _sample_rows_args
+        expected = pd.concat([sampled_data, sampled_data], ignore_index=True)
+        pd.testing.assert_frame_equal(result, expected)
+        assert instance._sample_rows.call_count == 2
+
+    def test__sample_batch_only_new_rows_are_sampled(self):
+        """Test that only the new rows are sampled and validated in every iteration.
+
+        The valid rows of every iteration are not passed back to ``_sample_rows``, and are
+        concatenated once at the end.
+        """
+        # Setup
+        first = pd.DataFrame({'a': [1, 2]}, index=[3, 7])
+        second = pd.DataFrame({'a': [3, 4, 5]}, index=[0, 1, 5])
+        instance = Mock()
+        instance._sample_rows.side_effect = [(first, 2), (second, 3)]
+
+        # Run
+        result = BaseSingleTableSynthesizer._sample_batch(instance, batch_size=4)
+
+        # Assert
+        pd.testing.assert_frame_equal(result, pd.DataFrame({'a': [1, 2, 3, 4]}))
         assert instance._sample_rows.call_count == 2
+        assert all(call[0][4] is None for call in instance._sample_rows.call_args_list)
+
+    def test__sample_batch_uses_acceptance_rate(self):
+        """Test that the acceptance rate of previous calls is used to size the first round."""
+        # Setup
+        instance = Mock()
+        reject_sampling = RejectSamplingController()
+        reject_sampling.update({'a': 1}, 100, 25)
+        instance._get_reject_sampling.return_value = reject_sampling
+        instance._sample_rows.return_value = (pd.DataFrame({'a': [1] * 12}), 12)
+
+        # Run
+        result = BaseSingleTableSynthesizer._sample_batch(
+            instance, batch_size=10, conditions={'a': 1})
+
+        # Assert
+        assert len(result) == 10
+        instance._sample_rows.assert_called_once_with(62, {'a': 1}, None, 0.01, None, False)
+        assert reject_sampling._statistics == {(('a', 1),): [162, 37]}
+
+    def test__sample_batch_max_tries_zero(self):
+        """Test that an empty ``DataFrame`` is returned if no rows are sampled."""
+        # Setup
+        instance = Mock()
+
+        # Run
+        result = BaseSingleTableSynthesizer._sample_batch(instance, batch_size=4, max_tries=0)
+
+        # Assert
+        pd.testing.assert_frame_equal(result, pd.DataFrame())
+        instance._sample_rows.assert_not_called()
 
     def test__sample_batch_storing_output_file(self, tmpdir):
         """Test that an output file is properly stored while sampling.
@@ -1039,8 +1124,9 @@ class TestBaseSingleTableSynthesizer:
         instance.metadata.columns.keys.return_value = ['name', 'salary']
         instance._sample_rows.side_effect = [
             (sampled_data, 4),
-            (sampled_data, 5),
-            (sampled_data, 10),
+            (sampled_data.tail(1), 1),
+            (sampled_data, 4),
+            (sampled_data, 4),
         ]
         mock_progress_bar = Mock()
 
@@ -1061,8 +1147,7 @@ class TestBaseSingleTableSynthesizer:
         )
 
         # Assert
-        pd.testing.assert_frame_equal(result, sampled_data)
-        assert instance._sample_rows.call_count == 3
+        assert instance._sample_rows.call_count == 4
         expected_stored_data = pd.DataFrame({
             'name': [
                 'John',
@@ -1074,6 +1159,7 @@ class TestBaseSingleTableSynthesizer:
                 'Doe',
                 'John Doe',
                 'John Doe John',
+                'John',
             ],
             'salary': [
                 80.,
@@ -1085,11 +1171,13 @@ class TestBaseSingleTableSynthesizer:
                 60.,
                 100.,
                 300.,
+                80.,
             ]
         })
+        pd.testing.assert_frame_equal(result, expected_stored_data)
         data = pd.read_csv(path)
         pd.testing.assert_frame_equal(expected_stored_data, data)
-        mock_progress_bar.update.call_count == 3
+        assert mock_progress_bar.update.call_count == 4
 
     def test__make_condition_dfs(self):
         """Test that the condition dfs are being created as expected."""
@@ -1109,6 +1197,38 @@ class TestBaseSingleTableSynthesizer:
         for res, exp in zip(result, expected_result):
             pd.testing.assert_frame_equal(res, exp)
 
+    def test__make_condition_dfs_batch_conditions(self):
+        """Test that the conditions with the same columns are built as a single dataframe."""
+        # Setup
+        conditions = [
+            Condition({'name': 'John Doe'}, num_rows=2),
+            Condition({'salary': 80.}),
+            BatchConditions(pd.DataFrame({
+                'name': ['Jane', 'Doe'],
+                'num_rows': [1, 3],
+            }), num_rows_column='num_rows'),
+            Condition({'name': 'Johanna'}),
+            Condition({'name': 'John', 'salary': 90.}, num_rows=0),
+        ]
+
+        # Run
+        result = BaseSingleTableSynthesizer._make_condition_dfs(conditions)
+
+        # Assert
+        expected_result = [
+            pd.DataFrame({
+                'name': ['John Doe', 'John Doe', 'Jane', 'Doe', 'Doe', 'Doe', 'Johanna']
+            }),
+            pd.DataFrame({'salary': [80.]}),
+            pd.DataFrame({
+                'name': pd.Series([], dtype=object),
+                'salary': pd.Series([], dtype=float)
+            }),
+        ]
+        assert len(result) == len(expected_result)
+        for res, exp in zip(result, expected_result):
+            pd.testing.assert_frame_equal(res, exp)
+
     def test__sample_in_batches(self):
         """Test that this method calls and concatenates the output of ``_sample_batch``."""
         # Setup
@@ -1122,6 +1242,8 @@ class TestBaseSingleTableSynthesizer:
         })
         instance = Mock()
         instance._sample_batch.side_effect = [first_data, second_data]
+        instance._iter_batches.side_effect = lambda **kwargs: (
+            BaseSingleTableSynthesizer._iter_batches(instance, **kwargs))
 
         # Run
         result = BaseSingleTableSynthesizer._sample_in_batches(
@@ -1155,6 +1277,29 @@ class TestBaseSingleTableSynthesizer:
         assert expected_call == instance._sample_batch.call_args_list[0]
         assert expected_call == instance._sample_batch.call_args_list[1]
 
+    def test__iter_batches(self):
+        """Test that every batch is yielded with a continuous index and trimmed to ``num_rows``."""
+        # Setup
+        first_data = pd.DataFrame({'salary': [60., 70.]})
+        second_data = pd.DataFrame({'salary': [65., 75., 85.]}, index=[3, 4, 5])
+        instance = Mock()
+        instance._sample_batch.side_effect = [first_data, second_data]
+
+        # Run
+        result = list(BaseSingleTableSynthesizer._iter_batches(
+            instance,
+            num_rows=4,
+            batch_size=3,
+            max_tries_per_batch=100,
+        ))
+
+        # Assert
+        assert len(result) == 2
+        pd.testing.assert_frame_equal(result[0], pd.DataFrame({'salary': [60., 70.]}))
+        pd.testing.assert_frame_equal(
+            result[1], pd.DataFrame({'salary': [65., 75.]}, index=pd.RangeIndex(2, 4)))
+        assert instance._sample_batch.call_count == 2
+
     def test__conditionally_sample_rows(self):
         """Test when sampled rows is bigger than 0."""
         # Setup
@@ -1438,7 +1583,8 @@ class TestBaseSingleTableSynthesizer:
             50,
             5,
             'temp.csv',
-            show_progress_bar=True
+            show_progress_bar=True,
+            n_jobs=None
         )
         pd.testing.assert_frame_equal(result, pd.DataFrame({'col': [1, 2, 3]}))
         assert caplog.messages[0] == (
@@ -1452,6 +1598,219 @@ class TestBaseSingleTableSynthesizer:
             '  Synthesizer id: BaseSingleTableSynthesizer_1.0.0_92aff11e9a5649d1a280990d1231a5f5'
         )
 
+    @pytest.mark.parametrize('n_jobs', [0, -2, 1.5, 'all', True])
+    def test_sample_invalid_n_jobs(self, n_jobs):
+        """Test that an error is raised if ``n_jobs`` is not valid."""
+        # Setup
+        instance = Mock()
+        error_msg = re.escape(f"Invalid value '{n_jobs}' for parameter 'n_jobs'.")
+
+        # Run and Assert
+        with pytest.raises(SynthesizerInputError, match=error_msg):
+            BaseSingleTableSynthesizer.sample(instance, 10, n_jobs=n_jobs)
+
+        instance._sample_with_progress_bar.assert_not_called()
+
+    def test__sample_seeded_batch(self):
+        """Test that the model and the reverse transformers are seeded before sampling."""
+        # Setup
+        instance = Mock()
+        transformer = Mock()
+        instance._data_processor._hyper_transformer.field_transformers = {
+            'a': transformer,
+            'b': None
+        }
+
+        # Run
+        result = BaseSingleTableSynthesizer._sample_seeded_batch(instance, 5, 10, 20)
+
+        # Assert
+        assert result == instance._sample_batch.return_value
+        instance._model.set_random_state.assert_called_once_with(5)
+        instance._set_random_state.assert_not_called()
+        assert instance._random_state_set is True
+        instance._sample_batch.assert_called_once_with(batch_size=10, max_tries=20)
+        state, method_name = transformer.set_random_state.call_args[0]
+        assert method_name == 'reverse_transform'
+        assert state.randint(1000) == np.random.RandomState(5).randint(1000)
+
+    def test__regenerate_columns(self):
+        """Test that the generated columns are replaced and cast to their dtype."""
+        # Setup
+        instance = Mock()
+        id_transformer = Mock()
+        id_transformer.is_generator.return_value = True
+        value_transformer = Mock()
+        value_transformer.is_generator.return_value = False
+        hyper_transformer = instance._data_processor._hyper_transformer
+        hyper_transformer.field_transformers = {'id': id_transformer, 'value': value_transformer}
+        hyper_transformer.create_anonymized_columns.return_value = pd.DataFrame({
+            'id': ['7', '8']
+        })
+        sampled = pd.DataFrame({'id': [0, 0], 'value': [1.5, 2.5]}, index=[4, 5])
+
+        # Run
+        result = BaseSingleTableSynthesizer._regenerate_columns(instance, sampled)
+
+        # Assert
+        hyper_transformer.create_anonymized_columns.assert_called_once_with(
+            num_rows=2, column_names=['id'])
+        expected = pd.DataFrame({'id': [7, 8], 'value': [1.5, 2.5]}, index=[4, 5])
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test__sample_in_parallel_single_worker(self):
+        """Test that the batches are sampled in this process with one seed each."""
+        # Setup
+        instance = Mock(_seed_sequence=None, _random_state_set=True)
+        instance._sample_seeded_batches.return_value = iter(['batch1', 'batch2', 'batch3'])
+
+        # Run
+        result = BaseSingleTableSynthesizer._sample_in_parallel(
+            instance, 25, 10, 50, n_jobs=1, progress_bar='progress_bar')
+
+        # Assert
+        assert result == instance._collect_batches.return_value
+        batches, num_rows, progress_bar, output_file_path = instance._collect_batches.call_args[0]
+        assert list(batches) == ['batch1', 'batch2', 'batch3']
+        assert (num_rows, progress_bar, output_file_path) == (25, 'progress_bar', None)
+        seeds = [
+            int(seed_sequence.generate_state(1)[0])
+            for seed_sequence in np.random.SeedSequence(73251).spawn(3)
+        ]
+        instance._sample_seeded_batches.assert_called_once_with(seeds, 10, 50)
+        instance._set_random_state.assert_not_called()
+        assert instance._seed_sequence.n_children_spawned == 3
+
+    def test__sample_in_parallel_sets_random_state(self):
+        """Test that the fixed seed is set if the random state was not set yet."""
+        # Setup
+        instance = Mock(_seed_sequence=None, _random_state_set=False)
+
+        def set_random_state(random_state):
+            instance._seed_sequence = np.random.SeedSequence(random_state)
+
+        instance._set_random_state.side_effect = set_random_state
+
+        # Run
+        BaseSingleTableSynthesizer._sample_in_parallel(instance, 10, 10, 50, n_jobs=1)
+
+        # Assert
+        instance._set_random_state.assert_called_once_with(73251)
+        seeds = [
+            int(seed_sequence.generate_state(1)[0])
+            for seed_sequence in np.random.SeedSequence(73251).spawn(1)
+        ]
+        instance._sample_seeded_batches.assert_called_once_with(seeds, 10, 50)
+
+    def test__sample_seeded_batches(self):
+        """Test that the sampling state of the synthesizer is restored after every batch."""
+        # Setup
+        instance = Mock(_random_state_set=False)
+        instance._model = Mock(spec=['random_state', 'set_random_state'])
+        instance._model.random_state = 'random_state'
+        hyper_transformer = instance._data_processor._hyper_transformer
+        hyper_transformer.field_transformers = {}
+        used_hyper_transformers = []
+
+        def sample_seeded_batch(seed, batch_size, max_tries_per_batch):
+            used_hyper_transformers.append(instance._data_processor._hyper_transformer)
+            instance._model.random_state = seed
+            instance._random_state_set = True
+            return f'batch{seed}'
+
+        instance._sample_seeded_batch.side_effect = sample_seeded_batch
+
+        # Run
+        batches = BaseSingleTableSynthesizer._sample_seeded_batches(instance, [1, 2], 10, 50)
+        first_batch = next(batches)
+        state_after_first_batch = (
+            instance._data_processor._hyper_transformer,
+            instance._model.random_state,
+            instance._random_state_set
+        )
+        result = [first_batch, *batches]
+
+        # Assert
+        assert result == ['batch1', 'batch2']
+        assert state_after_first_batch == (hyper_transformer, 'random_state', False)
+        assert instance._data_processor._hyper_transformer is hyper_transformer
+        assert instance._model.random_state == 'random_state'
+        assert instance._random_state_set is False
+        assert used_hyper_transformers[0] is used_hyper_transformers[1]
+        assert used_hyper_transformers[0] is not hyper_transformer
+        assert instance._sample_seeded_batch.call_args_list == [call(1, 10, 50), call(2, 10, 50)]
+
+    def test__collect_batches(self, tmp_path):
+        """Test that the batches are trimmed to ``num_rows``, written and concatenated."""
+        # Setup
+        instance = Mock()
+        instance._regenerate_columns.side_effect = lambda batch: batch
+        progress_bar = Mock()
+        output_file_path = tmp_path / 'sampled.csv'
+        output_file_path.touch()
+        batches = [
+            pd.DataFrame({'a': [1, 2]}),
+            pd.DataFrame({'a': [3, 4]}),
+            pd.DataFrame({'a': [5, 6]}),
+        ]
+
+        # Run
+        result = BaseSingleTableSynthesizer._collect_batches(
+            instance, iter(batches), 5, progress_bar, output_file_path)
+
+        # Assert
+        expected = pd.DataFrame({'a': [1, 2, 3, 4, 5]})
+        pd.testing.assert_frame_equal(result, expected)
+        pd.testing.assert_frame_equal(pd.read_csv(output_file_path), expected)
+        assert progress_bar.update.call_args_list == [call(2), call(2), call(1)]
+
+    @patch('sdv.single_table.base.datetime')
+    def test_iter_sample(self, mock_datetime, caplog):
+        """Test that the batches are yielded one at a time and the sample is logged at the end."""
+        # Setup
+        mock_datetime.datetime.now.return_value = '2024-04-19 16:20:10.037183'
+        instance = Mock(
+            _synthesizer_id='BaseSingleTableSynthesizer_1.0.0_92aff11e9a5649d1a280990d1231a5f5'
+        )
+        first_data = pd.DataFrame({'col': [1, 2]})
+        second_data = pd.DataFrame({'col': [3]}, index=[2])
+        instance._iter_batches.return_value = iter([first_data, second_data])
+
+        # Run
+        with catch_sdv_logs(caplog, logging.INFO, logger='SingleTableSynthesizer'):
+            iterator = BaseSingleTableSynthesizer.iter_sample(instance, 3, batch_size=2)
+            first_batch = next(iterator)
+            instance._iter_batches.assert_called_once_with(3, 2, 100)
+            assert caplog.messages == []
+            result = [first_batch, *iterator]
+
+        # Assert
+        assert result[0] is first_data
+        assert result[1] is second_data
+        assert caplog.messages[0] == (
+            '\nSample:\n'
+            '  Timestamp: 2024-04-19 16:20:10.037183\n'
+            '  Synthesizer class name: Mock\n'
+            '  Statistics of the sample size:\n'
+            '    Total number of tables: 1\n'
+            '    Total number of rows: 3\n'
+            '    Total number of columns: 1\n'
+            '  Synthesizer id: BaseSingleTableSynthesizer_1.0.0_92aff11e9a5649d1a280990d1231a5f5'
+        )
+
+    def test_iter_sample_no_rows(self):
+        """Test that nothing is yielded when ``num_rows`` is 0 and it errors when it is None."""
+        # Setup
+        instance = Mock()
+
+        # Run and Assert
+        assert list(BaseSingleTableSynthesizer.iter_sample(instance, 0)) == []
+        instance._iter_batches.assert_not_called()
+        expected_message = re.escape(
+            'You must specify the number of rows to sample (e.g. num_rows=100).')
+        with pytest.raises(ValueError, match=expected_message):
+            next(BaseSingleTableSynthesizer.iter_sample(instance, None))
+
     def test__validate_conditions_unseen_columns(self):
         """Test that conditions are within the ``data_processor`` fields."""
         # Setup
@@ -1501,6 +1860,134 @@ class TestBaseSingleTableSynthesizer:
         with pytest.raises(SynthesizerInputError, match=error_msg):
             synthesizer._validate_conditions(conditions)
 
+    def test__filter_row_conditions(self):
+        """Test that every row is compared against the conditions of its own row."""
+        # Setup
+        sampled = pd.DataFrame({
+            'position': ['Engineer', 'Scientist', 'Analyst', 'Engineer'],
+            'salary': [80.5, 90., 50., 70.],
+        }, index=[0, 1, 3, 4])
+        conditions = pd.DataFrame({
+            'position': ['Engineer', 'Scientist', 'Engineer', 'Analyst', 'Engineer'],
+            'salary': [80., 60., 80., 50., 70.],
+        })
+
+        # Run
+        filtered_data = BaseSingleTableSynthesizer._filter_row_conditions(
+            sampled, conditions, 0.01)
+
+        # Assert
+        expected_data = pd.DataFrame({
+            'position': ['Engineer', 'Analyst', 'Engineer'],
+            'salary': [80., 50., 70.],
+        }, index=[0, 3, 4])
+        pd.testing.assert_frame_equal(filtered_data, expected_data)
+
+    def test__sample_with_row_conditions(self):
+        """Test that the rows that are not valid are sampled again with their own conditions."""
+        # Setup
+        conditions = pd.DataFrame({COND_IDX: [7, 5, 6], 'name': ['a', 'b', 'c']})
+        instance = Mock()
+        instance._random_state_set = True
+        instance._can_sample_conditioned_rows.return_value = True
+        instance._data_processor.transform.return_value = pd.DataFrame(
+            {'name': [0.1, 0.2, 0.3]})
+        instance._sample_conditioned_rows.side_effect = lambda remaining: remaining
+        instance._data_processor.reverse_transform_valid.side_effect = [
+            pd.DataFrame({'name': ['a', 'c']}, index=[0, 2]),
+            pd.DataFrame({'name': ['b']}, index=[1]),
+        ]
+        progress_bar = Mock()
+
+        # Run
+        result = BaseSingleTableSynthesizer._sample_with_row_conditions(
+            instance, conditions, ['name'], 10, progress_bar=progress_bar)
+
+        # Assert
+        expected = pd.DataFrame({'name': ['b', 'c', 'a']}, index=[5, 6, 7])
+        pd.testing.assert_frame_equal(result, expected)
+        sample_calls = instance._sample_conditioned_rows.call_args_list
+        assert len(sample_calls) == 2
+        pd.testing.assert_frame_equal(
+            sample_calls[1][0][0], pd.DataFrame({'name': [0.2]}, index=[1]))
+        assert progress_bar.update.call_args_list == [call(2), call(1)]
+        instance._can_sample_conditioned_rows.assert_called_once_with(['name'])
+
+    def test__sample_with_row_conditions_missing_values(self):
+        """Test that the rows with missing conditioning values are skipped."""
+        # Setup
+        conditions = pd.DataFrame({COND_IDX: [0, 1, 2], 'name': ['a', np.nan, 'c']})
+        instance = Mock()
+        instance._random_state_set = True
+        instance._can_sample_conditioned_rows.return_value = True
+        instance._data_processor.transform.return_value = pd.DataFrame({'name': [0.1, 0.3]})
+        instance._sample_conditioned_rows.side_effect = lambda remaining: remaining
+        instance._data_processor.reverse_transform_valid.return_value = pd.DataFrame(
+            {'name': ['a', 'c']}, index=[0, 1])
+
+        # Run
+        result = BaseSingleTableSynthesizer._sample_with_row_conditions(
+            instance, conditions, ['name'], 10)
+
+        # Assert
+        expected = pd.DataFrame({'name': ['a', 'c']}, index=[0, 2])
+        pd.testing.assert_frame_equal(result, expected)
+        pd.testing.assert_frame_equal(
+            instance._data_processor.transform.call_args[0][0],
+            pd.DataFrame({'name': ['a', 'c']}, index=[0, 1])
+        )
+        instance._sample_conditioned_rows.assert_called_once()
+
+    def test__sample_with_row_conditions_all_missing_values(self):
+        """Test that an empty ``DataFrame`` is returned if all the conditions are missing."""
+        # Setup
+        conditions = pd.DataFrame({COND_IDX: [0, 1], 'name': [np.nan, None]})
+        instance = Mock()
+
+        # Run
+        result = BaseSingleTableSynthesizer._sample_with_row_conditions(
+            instance, conditions, ['name'], 10)
+
+        # Assert
+        assert result.empty
+        instance._data_processor.transform.assert_not_called()
+
+    def test__sample_with_row_conditions_not_supported(self):
+        """Test that ``None`` is returned if the model cannot sample the transformed columns."""
+        # Setup
+        conditions = pd.DataFrame({COND_IDX: [0], 'name': ['a']})
+        instance = Mock()
+        instance._can_sample_conditioned_rows.return_value = False
+        instance._data_processor.transform.return_value = pd.DataFrame({'name#a': [1.0]})
+
+        # Run
+        result = BaseSingleTableSynthesizer._sample_with_row_conditions(
+            instance, conditions, ['name'], 10)
+
+        # Assert
+        assert result is None
+        instance._sample_conditioned_rows.assert_not_called()
+
+    def test__sample_with_conditions_row_conditions(self):
+        """Test that the conditions are sampled row by row when the model supports it."""
+        # Setup
+        conditions = pd.DataFrame({'name': ['Johanna', 'Doe']})
+        instance = Mock()
+        instance._can_sample_conditioned_rows.return_value = True
+
+        # Run
+        result = BaseSingleTableSynthesizer._sample_with_conditions(
+            instance, conditions, 10, 5)
+
+        # Assert
+        assert result == instance._sample_with_row_conditions.return_value
+        call_conditions = instance._sample_with_row_conditions.call_args[0][0]
+        pd.testing.assert_frame_equal(
+            call_conditions,
+            pd.DataFrame({COND_IDX: [0, 1], 'name': ['Johanna', 'Doe']})
+        )
+        instance._conditionally_sample_rows.assert_not_called()
+
     def test__sample_with_conditions_constraints_not_met(self):
         """Test when conditions are not met."""
         # Setup
@@ -1509,6 +1996,7 @@ class TestBaseSingleTableSynthesizer:
             'salary': [100., 90.]
         })
         instance = Mock()
+        instance._can_sample_conditioned_rows.return_value = False
         instance._data_processor.transform.side_effect = [ConstraintsNotMetError]
 
         # Run and Assert
@@ -1526,6 +2014,7 @@ class TestBaseSingleTableSynthesizer:
         # Setup
         conditions = pd.DataFrame({'name': ['Johanna', 'Doe']})
         instance = Mock()
+        instance._can_sample_conditioned_rows.return_value = False
         instance._data_processor.transform.side_effect = [
             pd.DataFrame({'name': [0.25]}),
             pd.DataFrame({'name': [0.90]}),
@@ -1594,6 +2083,7 @@ class TestBaseSingleTableSynthesizer:
         # Setup
         conditions = pd.DataFrame({'name': ['Johanna']})
         instance = Mock()
+        instance._can_sample_conditioned_rows.return_value = False
         instance._data_processor.transform.side_effect = [
             pd.DataFrame(),
             pd.DataFrame(),
@@ -2033,6 +2523,45 @@ class TestBaseSingleTableSynthesizer:
                 'fitted_sdv_version': '1.0.0'
             }
 
+    def test_get_info_acceptance_rates(self):
+        """Test that the acceptance rates since the last fit are included once sampled."""
+        # Setup
+        data = pd.DataFrame({'col': [1, 2, 3]})
+        metadata = SingleTableMetadata()
+        metadata.add_column('col', sdtype='numerical')
+        synthesizer = GaussianCopulaSynthesizer(metadata)
+        synthesizer.fit(data)
+
+        # Run
+        synthesizer.sample(5)
+        info = synthesizer.get_info()
+        synthesizer.fit(data)
+        info_after_fit = synthesizer.get_info()
+
+        # Assert
+        assert info['acceptance_rates'] == {'[]': 1.0}
+        assert 'acceptance_rates' not in info_after_fit
+
+    def test_get_info_and_sample_without_reject_sampling(self):
+        """Test that a synthesizer saved without the reject sampling controller still works."""
+        # Setup
+        data = pd.DataFrame({'col': [1, 2, 3]})
+        metadata = SingleTableMetadata()
+        metadata.add_column('col', sdtype='numerical')
+        synthesizer = GaussianCopulaSynthesizer(metadata)
+        synthesizer.fit(data)
+        del synthesizer._reject_sampling
+
+        # Run
+        info_before_sample = synthesizer.get_info()
+        sampled = synthesizer.sample(5)
+        info = synthesizer.get_info()
+
+        # Assert
+        assert 'acceptance_rates' not in info_before_sample
+        assert len(sampled) == 5
+        assert info['acceptance_rates'] == {'[]': 1.0}
+
     @patch('sdv.single_table.base.version')
     def test_get_info_with_enterprise(self, mock_sdv_version):
         """Test the correct dictionary is returned with the enterprise version.
@@ -629,3 +629,115 @@ class TestGaussianCopulaSynthesizer:
         # Assert
         assert result == instance._model.probability_density.return_value
         instance._model.probability_density.assert_called_once_with(table_rows)
+
+    def test__can_sample_conditioned_rows(self):
+        """Test that a fitted ``GaussianMultivariate`` is needed, with columns left to sample."""
+        # Setup
+        data = pd.DataFrame({'a': np.arange(10.0), 'b': np.arange(10.0) ** 2})
+        metadata = SingleTableMetadata()
+        metadata.add_column('a', sdtype='numerical')
+        metadata.add_column('b', sdtype='numerical')
+        instance = GaussianCopulaSynthesizer(metadata)
+
+        # Run
+        not_fitted = instance._can_sample_conditioned_rows()
+        instance.fit(data)
+        fitted = instance._can_sample_conditioned_rows()
+        valid_columns = instance._can_sample_conditioned_rows(['a'])
+        invalid_columns = instance._can_sample_conditioned_rows(['a', 'c'])
+        all_columns = instance._can_sample_conditioned_rows(['a', 'b'])
+
+        # Assert
+        assert not_fitted is False
+        assert fitted is True
+        assert valid_columns is True
+        assert invalid_columns is False
+        assert all_columns is False
+
+    def test__get_conditional_factors(self):
+        """Test the regression and square root of the conditional covariance of the columns."""
+        # Setup
+        instance = Mock()
+        instance._conditional_model = None
+        instance._model.columns = ['a', 'b', 'c']
+        instance._model.correlation = pd.DataFrame([
+            [1.0, 0.5, 0.2],
+            [0.5, 1.0, 0.0],
+            [0.2, 0.0, 1.0],
+        ])
+
+        # Run
+        sampled, regression, factor = GaussianCopulaSynthesizer._get_conditional_factors(
+            instance, ('a',))
+        cached = GaussianCopulaSynthesizer._get_conditional_factors(instance, ('a',))
+
+        # Assert
+        assert sampled == [1, 2]
+        np.testing.assert_allclose(regression, [[0.5], [0.2]])
+        expected_covariance = [[0.75, -0.1], [-0.1, 0.96]]
+        np.testing.assert_allclose(factor @ factor.T, expected_covariance, atol=1e-12)
+        assert cached[1] is regression
+        assert instance._conditional_model is instance._model
+
+    def test__get_conditional_factors_model_changed(self):
+        """Test that the cached matrices are recomputed when the model changes."""
+        # Setup
+        instance = Mock()
+        instance._conditional_model = Mock()
+        instance._conditional_factors = {('a',): 'cached'}
+        instance._model.columns = ['a', 'b']
+        instance._model.correlation = pd.DataFrame([[1.0, 0.5], [0.5, 1.0]])
+
+        # Run
+        sampled, regression, _ = GaussianCopulaSynthesizer._get_conditional_factors(
+            instance, ('a',))
+
+        # Assert
+        assert sampled == [1]
+        np.testing.assert_allclose(regression, [[0.5]])
+
+    def test__get_conditional_factors_without_conditional_model(self):
+        """Test that the factors are computed for a synthesizer saved without the cache."""
+        # Setup
+        instance = Mock(spec=['_model'])
+        instance._model.columns = ['a', 'b']
+        instance._model.correlation = pd.DataFrame([[1.0, 0.5], [0.5, 1.0]])
+
+        # Run
+        sampled, regression, _ = GaussianCopulaSynthesizer._get_conditional_factors(
+            instance, ('a',))
+
+        # Assert
+        assert sampled == [1]
+        np.testing.assert_allclose(regression, [[0.5]])
+        assert instance._conditional_model is instance._model
+
+    def test__sample_conditioned_rows(self):
+        """Test that one row is sampled per row of conditions, keeping the conditions."""
+        # Setup
+        rng = np.random.default_rng(0)
+        a_values = rng.normal(size=500)
+        data = pd.DataFrame({
+            'a': a_values,
+            'b': a_values + rng.normal(scale=0.1, size=500),
+            'c': rng.normal(size=500),
+        })
+        metadata = SingleTableMetadata()
+        metadata.detect_from_dataframe(data)
+        instance = GaussianCopulaSynthesizer(metadata, default_distribution='norm')
+        instance.fit(data)
+        conditions = pd.DataFrame({'a': [-1.0, 0.0, 1.0] * 100}, index=range(5, 305))
+
+        # Run
+        instance._set_random_state(0)
+        result = instance._sample_conditioned_rows(conditions)
+        instance._set_random_state(0)
+        repeated = instance._sample_conditioned_rows(conditions)
+
+        # Assert
+        assert list(result.columns) == ['a', 'b', 'c']
+        pd.testing.assert_index_equal(result.index, conditions.index)
+        pd.testing.assert_series_equal(result['a'], conditions['a'])
+        means = result.groupby('a')['b'].mean()
+        np.testing.assert_allclose(means.to_numpy(), [-1.0, 0.0, 1.0], atol=0.1)
+        pd.testing.assert_frame_equal(result, repeated)
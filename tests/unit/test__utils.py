@@ -10,8 +10,9 @@ import pytest
 from sdv import version
 from sdv._utils import (
     _compare_versions, _convert_to_timedelta, _create_unique_name, _get_datetime_format,
-    _get_root_tables, _is_datetime_type, _validate_foreign_keys_not_null,
-    check_sdv_versions_and_warn, check_synthesizer_version, generate_synthesizer_id)
+    _get_num_workers, _get_root_tables, _is_datetime_type, _validate_foreign_keys_not_null,
+    _validate_n_jobs, check_sdv_versions_and_warn, check_synthesizer_version,
+    generate_synthesizer_id)
 from sdv.errors import SDVVersionWarning, SynthesizerInputError, VersionError
 from sdv.metadata.single_table import SingleTableMetadata
 from sdv.single_table.base import BaseSingleTableSynthesizer
@@ -660,3 +661,27 @@ def test_generate_synthesizer_id(mock_version, mock_uuid):
 
     # Assert
     assert result == 'BaseSingleTableSynthesizer_1.0.0_92aff11e9a5649d1a280990d1231a5f5'
+
+
+@pytest.mark.parametrize('n_jobs', [0, -2, 1.5, 'all', True])
+def test__validate_n_jobs(n_jobs):
+    """Test that an error is raised if ``n_jobs`` is not a positive integer or -1."""
+    # Setup
+    error_msg = re.escape(f"Invalid value '{n_jobs}' for parameter 'n_jobs'.")
+
+    # Run and Assert
+    with pytest.raises(SynthesizerInputError, match=error_msg):
+        _validate_n_jobs(n_jobs)
+
+
+@patch('sdv._utils.os.cpu_count')
+def test__get_num_workers(cpu_count_mock):
+    """Test that the number of workers is bounded by the number of tasks."""
+    # Setup
+    cpu_count_mock.return_value = 8
+
+    # Run and Assert
+    assert _get_num_workers(4, 10) == 4
+    assert _get_num_workers(4, 2) == 2
+    assert _get_num_workers(4, 0) == 1
+    assert _get_num_workers(-1, 20) == 8